@@ -5,30 +5,497 @@ Purpose: Store, observe, and interpret alignment signals
 NOT: Automate sales, accelerate conversion, or optimise funnels
 """
 
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
-from fastapi.security import HTTPBasic, HTTPBasicCredentials
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Header, Query, Response, status
+from fastapi.security import HTTPBasic, HTTPBasicCredentials, HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from dotenv import load_dotenv
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, DESCENDING, TEXT, DeleteOne, IndexModel, UpdateOne, monitoring
+from pymongo.collation import Collation, CollationStrength
+from pymongo.errors import BulkWriteError, CollectionInvalid, DuplicateKeyError, OperationFailure, PyMongoError
+from bson import Binary, ObjectId
+from bson.codec_options import CodecOptions
+import asyncio
+import base64
+import bcrypt
+import bisect
+import bson
+import fcntl
+import jwt
+import csv
+import io
+import json
+import math
 import os
 import logging
+import re
 import secrets
 import hashlib
+import hmac
+import struct
+import threading
+import time
+from abc import ABC, abstractmethod
+from array import array
+from collections import Counter, OrderedDict, deque
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict, EmailStr
+from pydantic import BaseModel, Field, ConfigDict, EmailStr, TypeAdapter
 from typing import List, Optional, Dict, Any
 import uuid
-from datetime import datetime, timezone
+import zlib
+from datetime import date, datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
 from enum import Enum
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
+# ============================================
+# METRICS (Prometheus text format, see /metrics)
+# ============================================
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Collections / commands whose Mongo timings are pre-allocated
+METRIC_COLLECTIONS = ("questionnaire_responses", "contact_submissions", "analytics_events")
+METRIC_COMMANDS = ("find", "getMore", "insert", "update", "delete", "aggregate", "findAndModify")
+
+class Histogram:
+    """Fixed-bucket histogram - counts are pre-allocated, observe() only adds"""
+    __slots__ = ("counts", "sum")
+    
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)  # last slot is +Inf
+        self.sum = 0.0
+    
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.sum += seconds
+    
+    def merge(self, other: "Histogram"):
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.sum += other.sum
+    
+    def render(self, name: str, labels: str) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        cumulative += self.counts[-1]
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {cumulative}')
+        lines.append(f'{name}_sum{{{labels}}} {self.sum}')
+        lines.append(f'{name}_count{{{labels}}} {cumulative}')
+        return lines
+
+class HttpMetrics:
+    """Per-route request latency and status counts.
+    
+    Only touched from the event loop thread, so plain ints need no locking.
+    Histograms for every registered route are allocated by preallocate().
+    """
+    
+    def __init__(self):
+        self.in_flight = 0
+        self.latency: Dict[tuple, Histogram] = {}
+        self.statuses: Dict[tuple, int] = {}
+    
+    def preallocate(self, routes):
+        for route in routes:
+            for method in getattr(route, "methods", None) or ():
+                self.latency.setdefault((method, route.path), Histogram())
+    
+    def observe(self, method: str, route: str, status_code: int, seconds: float):
+        key = (method, route)
+        histogram = self.latency.get(key)
+        if histogram is None:
+            histogram = self.latency[key] = Histogram()
+        histogram.observe(seconds)
+        status_key = (method, route, status_code)
+        self.statuses[status_key] = self.statuses.get(status_key, 0) + 1
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """Times every Mongo command by collection and command name.
+    
+    Motor runs PyMongo in worker threads, so each thread records into its own
+    shard (no locks, no lost updates); shards are summed when scraped.
+    """
+    
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: List[Dict[tuple, Histogram]] = []
+        self._collections: Dict[tuple, str] = {}  # in-flight (connection, request id) -> collection
+    
+    def _shard(self) -> Dict[tuple, Histogram]:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = {(c, op): Histogram() for c in METRIC_COLLECTIONS for op in METRIC_COMMANDS}
+            self._local.shard = shard
+            self._shards.append(shard)
+        return shard
+    
+    def started(self, event):
+        command = event.command
+        collection = command.get("collection") if event.command_name == "getMore" else command.get(event.command_name)
+        self._collections[(event.connection_id, event.request_id)] = collection if isinstance(collection, str) else ""
+    
+    def _finish(self, event):
+        collection = self._collections.pop((event.connection_id, event.request_id), "")
+        shard = self._shard()
+        key = (collection, event.command_name)
+        histogram = shard.get(key)
+        if histogram is None:
+            histogram = shard[key] = Histogram()
+        histogram.observe(event.duration_micros / 1e6)
+    
+    def succeeded(self, event):
+        self._finish(event)
+    
+    def failed(self, event):
+        self._finish(event)
+    
+    def snapshot(self) -> Dict[tuple, Histogram]:
+        merged: Dict[tuple, Histogram] = {}
+        for shard in list(self._shards):
+            for key, histogram in list(shard.items()):
+                merged.setdefault(key, Histogram()).merge(histogram)
+        return merged
+
+class MongoPoolMetrics(monitoring.ConnectionPoolListener):
+    """Connection pool usage; per-thread counters like MongoCommandMetrics"""
+    
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: List[List[int]] = []  # [checked_out, checked_in, created, closed]
+    
+    def _shard(self) -> List[int]:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = [0, 0, 0, 0]
+            self._shards.append(shard)
+        return shard
+    
+    def connection_checked_out(self, event):
+        self._shard()[0] += 1
+    
+    def connection_checked_in(self, event):
+        self._shard()[1] += 1
+    
+    def connection_created(self, event):
+        self._shard()[2] += 1
+    
+    def connection_closed(self, event):
+        self._shard()[3] += 1
+    
+    def pool_created(self, event): pass
+    def pool_ready(self, event): pass
+    def pool_cleared(self, event): pass
+    def pool_closed(self, event): pass
+    def connection_ready(self, event): pass
+    def connection_check_out_started(self, event): pass
+    def connection_check_out_failed(self, event): pass
+    
+    def in_use(self) -> int:
+        return sum(shard[0] - shard[1] for shard in list(self._shards))
+    
+    def open(self) -> int:
+        return sum(shard[2] - shard[3] for shard in list(self._shards))
+
+http_metrics = HttpMetrics()
+mongo_metrics = MongoCommandMetrics()
+pool_metrics = MongoPoolMetrics()
+
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+MONGO_MIN_POOL_SIZE = int(os.environ.get('MONGO_MIN_POOL_SIZE', '5'))
+MONGO_MAX_POOL_SIZE = int(os.environ.get('MONGO_MAX_POOL_SIZE', '100'))
+# tz_aware: native BSON dates come back as UTC-aware datetimes
+client = AsyncIOMotorClient(
+    mongo_url,
+    tz_aware=True,
+    minPoolSize=MONGO_MIN_POOL_SIZE,
+    maxPoolSize=MONGO_MAX_POOL_SIZE,
+    event_listeners=[mongo_metrics, pool_metrics],
+)
 db = client[os.environ['DB_NAME']]
 
+# Analytics storage: 'standard' collection, or 'timeseries' - a Mongo time-series
+# collection with session_id/event_type as bucket metadata (Mongo 5.0+)
+ANALYTICS_STORAGE = os.environ.get('ANALYTICS_STORAGE', 'standard')
+ANALYTICS_RETENTION_DAYS = int(os.environ.get('ANALYTICS_RETENTION_DAYS', '0'))  # 0 = keep forever
+ANALYTICS_TIMESERIES = ANALYTICS_STORAGE == 'timeseries'
+ANALYTICS_COLLECTION = "analytics_events_ts" if ANALYTICS_TIMESERIES else "analytics_events"
+ANALYTICS_SESSION_FIELD = "meta.session_id" if ANALYTICS_TIMESERIES else "session_id"
+ANALYTICS_TYPE_FIELD = "meta.event_type" if ANALYTICS_TIMESERIES else "event_type"
+
+# Case-insensitive email equality; only served by an index built with the same collation
+EMAIL_COLLATION = Collation(locale="en", strength=CollationStrength.SECONDARY)
+
+# Indexes ensured at startup - covers the admin list sorts/filters and id lookups
+COLLECTION_INDEXES = {
+    "questionnaire_responses": [
+        IndexModel([("response_id", ASCENDING)], name="response_id_unique", unique=True),
+        IndexModel([("timestamp", DESCENDING), ("response_id", DESCENDING)], name="timestamp_id"),
+        IndexModel([("status", ASCENDING), ("timestamp", DESCENDING), ("response_id", DESCENDING)], name="status_timestamp_id"),
+        IndexModel([("watched", ASCENDING), ("timestamp", DESCENDING), ("response_id", DESCENDING)], name="watched_timestamp_id"),
+        # Erasure lookups
+        IndexModel([("session_id", ASCENDING)], name="session_id"),
+        IndexModel([("contact_info.email", ASCENDING)], name="contact_email", sparse=True, collation=EMAIL_COLLATION),
+        # Admin search (a collection can only have one text index)
+        IndexModel([("search_text", TEXT), ("internal_notes", TEXT)], name="search_text", default_language="english"),
+    ],
+    "contact_submissions": [
+        IndexModel([("submission_id", ASCENDING)], name="submission_id_unique", unique=True),
+        IndexModel([("timestamp", DESCENDING), ("submission_id", DESCENDING)], name="timestamp_id"),
+        IndexModel([("status", ASCENDING), ("timestamp", DESCENDING), ("submission_id", DESCENDING)], name="status_timestamp_id"),
+        IndexModel([("watched", ASCENDING), ("timestamp", DESCENDING), ("submission_id", DESCENDING)], name="watched_timestamp_id"),
+        IndexModel([("email", ASCENDING)], name="email", sparse=True, collation=EMAIL_COLLATION),
+        IndexModel(
+            [("name", TEXT), ("reason", TEXT), ("internal_notes", TEXT)],
+            name="search_text", default_language="english", weights={"name": 3},
+        ),
+    ],
+    ANALYTICS_COLLECTION: [
+        IndexModel([(ANALYTICS_SESSION_FIELD, ASCENDING)], name="session_id"),
+        IndexModel([(ANALYTICS_TYPE_FIELD, ASCENDING), ("timestamp", DESCENDING)], name="event_type_timestamp"),
+    ],
+    "analytics_rollups": [
+        IndexModel([("hour", ASCENDING)], name="hour"),
+    ],
+    "analytics_sketches": [
+        IndexModel([("day", ASCENDING)], name="day"),
+    ],
+    "erasure_receipts": [
+        IndexModel([("receipt_id", ASCENDING)], name="receipt_id_unique", unique=True),
+    ],
+}
+
+# Collections whose documents carry a timestamp field
+TIMESTAMP_COLLECTIONS = ("questionnaire_responses", "contact_submissions", "analytics_events")
+
+# Queries the admin UI runs constantly - each must be served by an index
+HOT_QUERIES = [
+    {"name": "questionnaire_list", "collection": "questionnaire_responses", "filter": {}, "sort": {"timestamp": -1, "response_id": -1}},
+    {"name": "questionnaire_by_status", "collection": "questionnaire_responses", "filter": {"status": "unreviewed"}, "sort": {"timestamp": -1, "response_id": -1}},
+    {"name": "questionnaire_watched", "collection": "questionnaire_responses", "filter": {"watched": True}, "sort": {"timestamp": -1, "response_id": -1}},
+    {"name": "questionnaire_detail", "collection": "questionnaire_responses", "filter": {"response_id": ""}, "sort": None},
+    {"name": "contact_list", "collection": "contact_submissions", "filter": {}, "sort": {"timestamp": -1, "submission_id": -1}},
+    {"name": "contact_by_status", "collection": "contact_submissions", "filter": {"status": "new"}, "sort": {"timestamp": -1, "submission_id": -1}},
+    {"name": "contact_watched", "collection": "contact_submissions", "filter": {"watched": True}, "sort": {"timestamp": -1, "submission_id": -1}},
+    {"name": "contact_detail", "collection": "contact_submissions", "filter": {"submission_id": ""}, "sort": None},
+    {"name": "questionnaire_search", "collection": "questionnaire_responses", "filter": {"$text": {"$search": "access"}}, "sort": None},
+    {"name": "contact_search", "collection": "contact_submissions", "filter": {"$text": {"$search": "access"}}, "sort": None},
+]
+
+async def ensure_analytics_storage():
+    """Create the time-series collection if needed and apply ANALYTICS_RETENTION_DAYS"""
+    expire = ANALYTICS_RETENTION_DAYS * 86400
+    
+    if ANALYTICS_TIMESERIES:
+        if await db.list_collection_names(filter={"name": ANALYTICS_COLLECTION}):
+            await db.command("collMod", ANALYTICS_COLLECTION, expireAfterSeconds=expire or "off")
+            return
+        options = {"timeseries": {"timeField": "timestamp", "metaField": "meta", "granularity": "minutes"}}
+        if expire:
+            options["expireAfterSeconds"] = expire
+        try:
+            await db.create_collection(ANALYTICS_COLLECTION, **options)
+        except CollectionInvalid:
+            pass  # Another worker created it first
+        except OperationFailure as e:
+            if e.code != 48:  # NamespaceExists
+                raise
+        return
+    
+    # Standard collection: retention is a TTL index on timestamp
+    collection = db[ANALYTICS_COLLECTION]
+    ttl_index = (await collection.index_information()).get("timestamp_ttl")
+    if expire and ttl_index is None:
+        await collection.create_index([("timestamp", ASCENDING)], name="timestamp_ttl", expireAfterSeconds=expire)
+    elif expire and ttl_index.get("expireAfterSeconds") != expire:
+        await db.command("collMod", ANALYTICS_COLLECTION, index={"name": "timestamp_ttl", "expireAfterSeconds": expire})
+    elif not expire and ttl_index is not None:
+        await collection.drop_index("timestamp_ttl")
+
+async def ensure_indexes():
+    """Create declared indexes (no-op for indexes that already exist)"""
+    for collection, indexes in COLLECTION_INDEXES.items():
+        try:
+            await db[collection].create_indexes(indexes)
+        except PyMongoError:
+            logger.exception(f"Index bootstrap failed for {collection}")
+    logger.info("Index bootstrap complete")
+
+def plan_stages(plan: dict) -> List[str]:
+    """Flatten a winning plan into its stage names"""
+    plan = plan.get("queryPlan", plan)
+    stages = [plan.get("stage", "")]
+    if "inputStage" in plan:
+        stages += plan_stages(plan["inputStage"])
+    for child in plan.get("inputStages", []):
+        stages += plan_stages(child)
+    return stages
+
+# ============================================
+# MIGRATIONS (online, resumable)
+# ============================================
+
+MIGRATION_BATCH_SIZE = int(os.environ.get('MIGRATION_BATCH_SIZE', '500'))
+MIGRATION_BATCH_PAUSE = 0.1  # seconds between batches, keeps load on Atlas low
+
+def parse_timestamp(value: str) -> datetime:
+    """Legacy ISO string timestamp -> UTC datetime"""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+async def migrate_string_timestamps():
+    """Rewrite legacy ISO string timestamps as native BSON dates.
+    
+    Walks each collection in _id order in batches and checkpoints the last
+    _id in the migrations collection, so a restart resumes where it stopped.
+    """
+    migration_id = "native_timestamps"
+    state = await db.migrations.find_one({"_id": migration_id}) or {}
+    if state.get("done"):
+        return
+    
+    progress = state.get("progress", {})
+    
+    for collection in TIMESTAMP_COLLECTIONS:
+        query = {"timestamp": {"$type": "string"}}
+        migrated = 0
+        
+        while True:
+            if collection in progress:
+                query["_id"] = {"$gt": progress[collection]}
+            
+            batch = await db[collection].find(query, {"_id": 1, "timestamp": 1}).sort("_id", 1).limit(MIGRATION_BATCH_SIZE).to_list(MIGRATION_BATCH_SIZE)
+            if not batch:
+                break
+            
+            ops = []
+            for doc in batch:
+                try:
+                    timestamp = parse_timestamp(doc['timestamp'])
+                except ValueError:
+                    logger.warning(f"Unparseable timestamp in {collection} {doc['_id']}, left as-is")
+                    continue
+                # Match on the old value too so concurrent workers stay idempotent
+                ops.append(UpdateOne({"_id": doc['_id'], "timestamp": doc['timestamp']}, {"$set": {"timestamp": timestamp}}))
+            
+            if ops:
+                await db[collection].bulk_write(ops, ordered=False)
+            
+            migrated += len(ops)
+            progress[collection] = batch[-1]['_id']
+            await db.migrations.update_one({"_id": migration_id}, {"$set": {"progress": progress}}, upsert=True)
+            await asyncio.sleep(MIGRATION_BATCH_PAUSE)
+        
+        logger.info(f"Timestamp migration: {migrated} documents converted in {collection}")
+    
+    await db.migrations.update_one(
+        {"_id": migration_id},
+        {"$set": {"done": True, "completed_at": datetime.now(timezone.utc)}},
+        upsert=True
+    )
+
+def timeseries_event_doc(_id, timestamp: datetime, session_id: str, event_type: str, event_data: Dict[str, Any]) -> dict:
+    """Time-series layout: no event_id or consent flag, empty event_data omitted"""
+    doc = {"_id": _id, "timestamp": timestamp, "meta": {"session_id": session_id, "event_type": event_type}}
+    if event_data:
+        doc["event_data"] = event_data
+    return doc
+
+async def migrate_analytics_to_timeseries():
+    """One-shot copy of analytics_events into the time-series collection.
+    
+    Copies in _id order and checkpoints the last copied _id, so a restart
+    resumes. Time-series collections have no unique _id, so a crash between
+    an insert and its checkpoint can duplicate at most one batch. The legacy
+    collection is left in place for the operator to drop once this is done.
+    """
+    migration_id = "analytics_timeseries"
+    state = await db.migrations.find_one({"_id": migration_id}) or {}
+    if state.get("done"):
+        return
+    
+    last_id = state.get("last_id")
+    copied = 0
+    
+    while True:
+        query = {"timestamp": {"$type": "date"}}
+        if last_id is not None:
+            query["_id"] = {"$gt": last_id}
+        
+        batch = await db.analytics_events.find(query).sort("_id", 1).limit(MIGRATION_BATCH_SIZE).to_list(MIGRATION_BATCH_SIZE)
+        if not batch:
+            break
+        
+        docs = [
+            timeseries_event_doc(doc['_id'], doc['timestamp'], doc['session_id'], doc['event_type'], doc.get('event_data'))
+            for doc in batch
+        ]
+        await db[ANALYTICS_COLLECTION].insert_many(docs, ordered=False)
+        
+        copied += len(docs)
+        last_id = batch[-1]['_id']
+        await db.migrations.update_one({"_id": migration_id}, {"$set": {"last_id": last_id}}, upsert=True)
+        await asyncio.sleep(MIGRATION_BATCH_PAUSE)
+    
+    await db.migrations.update_one(
+        {"_id": migration_id},
+        {"$set": {"done": True, "completed_at": datetime.now(timezone.utc)}},
+        upsert=True
+    )
+    logger.info(f"Analytics time-series migration: {copied} events copied - analytics_events can now be dropped")
+
+# Strong references to fire-and-forget tasks (the event loop only keeps weak ones)
+background_tasks = set()
+
+def spawn(coro) -> asyncio.Task:
+    task = asyncio.get_running_loop().create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+async def run_startup_maintenance():
+    """Index bootstrap then data migrations, off the startup path"""
+    # Before index creation, which would otherwise create a standard collection
+    try:
+        await analytics_buffer.prepare()
+    except PyMongoError:
+        logger.exception("Analytics storage setup failed, will retry on first flush")
+    await ensure_indexes()
+    try:
+        await lockout_store.setup()
+    except PyMongoError:
+        logger.exception("Lockout store setup failed")
+    try:
+        await migrate_string_timestamps()
+    except PyMongoError:
+        logger.exception("Timestamp migration interrupted, will resume on next start")
+        return
+    if ANALYTICS_TIMESERIES:
+        try:
+            await migrate_analytics_to_timeseries()
+        except PyMongoError:
+            logger.exception("Analytics time-series migration interrupted, will resume on next start")
+            return
+    try:
+        await backfill_hourly_rollups()
+    except PyMongoError:
+        logger.exception("Analytics rollup backfill failed, will retry on next start")
+    try:
+        await migrate_search_text()
+    except PyMongoError:
+        logger.exception("Search text migration interrupted, will resume on next start")
+
 # Create the main app
 app = FastAPI(
     title="HILLIA Governance Backend",
@@ -39,54 +506,159 @@ app = FastAPI(
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
-# Basic auth for admin endpoints
-security = HTTPBasic()
+# Admin auth: bearer session token, with HTTP Basic as fallback
+security = HTTPBasic(auto_error=False)
+bearer = HTTPBearer(auto_error=False)
 
 # Admin credentials (in production, set via environment variables - NO DEFAULTS)
 ADMIN_USERNAME = os.environ.get('ADMIN_USERNAME')
-ADMIN_PASSWORD_HASH = os.environ.get('ADMIN_PASSWORD_HASH')
+ADMIN_PASSWORD_HASH = os.environ.get('ADMIN_PASSWORD_HASH')  # bcrypt ($2b$...) or legacy sha256 hex
 
-# Rate limiting for admin auth (simple in-memory, resets on server restart)
-failed_attempts = {}
+# Session tokens - without a configured secret, tokens only last for this process
+ADMIN_TOKEN_SECRET = os.environ.get('ADMIN_TOKEN_SECRET') or secrets.token_urlsafe(32)
+ADMIN_TOKEN_TTL = int(os.environ.get('ADMIN_TOKEN_TTL', '3600'))  # seconds
+
+# Rate limiting for admin auth
 MAX_FAILED_ATTEMPTS = 5
 LOCKOUT_DURATION = 300  # 5 minutes in seconds
+LOCKOUT_MAX_ENTRIES = int(os.environ.get('LOCKOUT_MAX_ENTRIES', '10000'))
+LOCKOUT_BACKEND = os.environ.get('LOCKOUT_BACKEND', 'memory')  # 'memory' or 'mongo'
+
+class LockoutStore(ABC):
+    """Failed admin login tracking, keyed by username"""
+    
+    async def setup(self):
+        pass
+    
+    @abstractmethod
+    async def is_locked(self, key: str) -> bool:
+        ...
+    
+    @abstractmethod
+    async def record_failure(self, key: str):
+        ...
+    
+    @abstractmethod
+    async def clear(self, key: str):
+        ...
+
+class MemoryLockoutStore(LockoutStore):
+    """Per-process store with a fixed ceiling (resets on server restart).
+    
+    Entries are kept in last-failure order, so expired entries are always at
+    the front: expiry and capacity eviction both pop from the front, O(1)
+    amortized, and the dict never exceeds max_entries.
+    """
+    
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()  # key -> (attempts, last_failure)
+    
+    def _expire(self, now: float):
+        while self._entries:
+            _, (_, last_failure) = next(iter(self._entries.items()))
+            if now - last_failure < self.ttl:
+                break
+            self._entries.popitem(last=False)
+    
+    async def is_locked(self, key: str) -> bool:
+        self._expire(time.monotonic())
+        entry = self._entries.get(key)
+        return entry is not None and entry[0] >= MAX_FAILED_ATTEMPTS
+    
+    async def record_failure(self, key: str):
+        now = time.monotonic()
+        self._expire(now)
+        attempts, _ = self._entries.pop(key, (0, now))
+        self._entries[key] = (attempts + 1, now)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    async def clear(self, key: str):
+        self._entries.pop(key, None)
+
+class MongoLockoutStore(LockoutStore):
+    """Shared store for multi-worker deployments; a TTL index expires entries"""
+    
+    collection_name = "admin_lockouts"
+    
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+    
+    async def setup(self):
+        await db[self.collection_name].create_index("last_failure", name="last_failure_ttl", expireAfterSeconds=int(self.ttl))
+    
+    async def is_locked(self, key: str) -> bool:
+        entry = await db[self.collection_name].find_one({"_id": key})
+        if not entry or entry["attempts"] < MAX_FAILED_ATTEMPTS:
+            return False
+        # The TTL monitor only runs once a minute - check expiry ourselves
+        age = datetime.now(timezone.utc) - entry["last_failure"]
+        return age.total_seconds() < self.ttl
+    
+    async def record_failure(self, key: str):
+        now = datetime.now(timezone.utc)
+        expired_before = now - timedelta(seconds=self.ttl)
+        # Restart the count if the previous entry has expired but not yet been reaped
+        await db[self.collection_name].update_one(
+            {"_id": key},
+            [{"$set": {
+                "attempts": {"$cond": [{"$gt": ["$last_failure", expired_before]}, {"$add": ["$attempts", 1]}, 1]},
+                "last_failure": now,
+            }}],
+            upsert=True
+        )
+    
+    async def clear(self, key: str):
+        await db[self.collection_name].delete_one({"_id": key})
+
+if LOCKOUT_BACKEND == 'mongo':
+    lockout_store: LockoutStore = MongoLockoutStore(ttl=LOCKOUT_DURATION)
+else:
+    lockout_store = MemoryLockoutStore(max_entries=LOCKOUT_MAX_ENTRIES, ttl=LOCKOUT_DURATION)
 
-def verify_admin(credentials: HTTPBasicCredentials = Depends(security)):
-    """Verify admin credentials with rate limiting"""
+def check_admin_password(password: str) -> bool:
+    """Compare against ADMIN_PASSWORD_HASH (bcrypt is deliberately slow - call off the event loop)"""
+    if ADMIN_PASSWORD_HASH.startswith("$2"):
+        return bcrypt.checkpw(password.encode(), ADMIN_PASSWORD_HASH.encode())
+    password_hash = hashlib.sha256(password.encode()).hexdigest()
+    return secrets.compare_digest(password_hash, ADMIN_PASSWORD_HASH)
+
+def require_admin_configured():
     # Reject if admin credentials not configured
     if not ADMIN_USERNAME or not ADMIN_PASSWORD_HASH:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Admin not configured",
         )
+
+async def verify_admin_password(credentials: Optional[HTTPBasicCredentials] = Depends(security)):
+    """Verify admin Basic credentials with rate limiting"""
+    require_admin_configured()
+    
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Basic"},
+        )
     
     client_key = credentials.username
-    current_time = datetime.now(timezone.utc).timestamp()
     
     # Check if locked out
-    if client_key in failed_attempts:
-        attempts, lockout_time = failed_attempts[client_key]
-        if attempts >= MAX_FAILED_ATTEMPTS:
-            if current_time - lockout_time < LOCKOUT_DURATION:
-                raise HTTPException(
-                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                    detail="Too many failed attempts. Try again later.",
-                )
-            else:
-                # Reset after lockout period
-                del failed_attempts[client_key]
+    if await lockout_store.is_locked(client_key):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many failed attempts. Try again later.",
+        )
     
-    password_hash = hashlib.sha256(credentials.password.encode()).hexdigest()
     is_correct_username = secrets.compare_digest(credentials.username, ADMIN_USERNAME)
-    is_correct_password = secrets.compare_digest(password_hash, ADMIN_PASSWORD_HASH)
+    is_correct_password = await run_in_threadpool(check_admin_password, credentials.password)
     
     if not (is_correct_username and is_correct_password):
         # Track failed attempt
-        if client_key in failed_attempts:
-            attempts, _ = failed_attempts[client_key]
-            failed_attempts[client_key] = (attempts + 1, current_time)
-        else:
-            failed_attempts[client_key] = (1, current_time)
+        await lockout_store.record_failure(client_key)
         
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -95,11 +667,47 @@ def verify_admin(credentials: HTTPBasicCredentials = Depends(security)):
         )
     
     # Clear failed attempts on successful login
-    if client_key in failed_attempts:
-        del failed_attempts[client_key]
+    await lockout_store.clear(client_key)
     
     return credentials.username
 
+def issue_admin_token(username: str) -> str:
+    now = datetime.now(timezone.utc)
+    claims = {"sub": username, "iat": now, "exp": now + timedelta(seconds=ADMIN_TOKEN_TTL)}
+    return jwt.encode(claims, ADMIN_TOKEN_SECRET, algorithm="HS256")
+
+def verify_admin_token(token: str) -> str:
+    """Cheap per-request check of a session token issued by /admin/auth/login"""
+    try:
+        claims = jwt.decode(token, ADMIN_TOKEN_SECRET, algorithms=["HS256"], options={"require": ["exp", "sub"]})
+    except jwt.PyJWTError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    if not secrets.compare_digest(claims["sub"], ADMIN_USERNAME):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    return claims["sub"]
+
+async def verify_admin(
+    token: Optional[HTTPAuthorizationCredentials] = Depends(bearer),
+    credentials: Optional[HTTPBasicCredentials] = Depends(security),
+):
+    """Verify admin via bearer token, falling back to Basic credentials"""
+    require_admin_configured()
+    
+    if token is not None:
+        return verify_admin_token(token.credentials)
+    
+    return await verify_admin_password(credentials)
+
 # ============================================
 # ENUMS
 # ============================================
@@ -114,6 +722,10 @@ class ContactStatus(str, Enum):
     REVIEWED = "reviewed"
     ARCHIVED = "archived"
 
+class ListView(str, Enum):
+    FULL = "full"
+    SUMMARY = "summary"
+
 class AdminRole(str, Enum):
     REVIEWER = "reviewer"
     OWNER = "owner"
@@ -154,6 +766,9 @@ class QuestionnaireResponse(BaseModel):
     internal_notes: str = ""
     status: ResponseStatus = ResponseStatus.UNREVIEWED
     watched: bool = False  # Watch list feature
+    # Cache validators - bumped by every admin update
+    version: int = 1
+    updated_at: Optional[datetime] = None
 
 class ContactSubmissionCreate(BaseModel):
     """Contact form submission from frontend"""
@@ -181,6 +796,9 @@ class ContactSubmission(BaseModel):
     status: ContactStatus = ContactStatus.NEW
     internal_notes: str = ""
     watched: bool = False  # Watch list feature
+    # Cache validators - bumped by every admin update
+    version: int = 1
+    updated_at: Optional[datetime] = None
 
 class AnalyticsEvent(BaseModel):
     """Analytics event (consent-based)"""
@@ -193,6 +811,73 @@ class AnalyticsEvent(BaseModel):
     event_data: Dict[str, Any] = {}
     consent: bool = True
 
+class AnalyticsEventCreate(BaseModel):
+    """Analytics event from frontend (batch ingestion)"""
+    event_type: str
+    session_id: str
+    event_data: Dict[str, Any] = {}
+    consent: bool = True
+
+class QuestionnaireBulkOperation(BaseModel):
+    """One item of a bulk questionnaire request - field changes, or delete"""
+    id: str
+    status: Optional[ResponseStatus] = None
+    internal_notes: Optional[str] = None
+    watched: Optional[bool] = None
+    delete: bool = False
+
+class ContactBulkOperation(BaseModel):
+    """One item of a bulk contact request - field changes, or delete"""
+    id: str
+    status: Optional[ContactStatus] = None
+    internal_notes: Optional[str] = None
+    watched: Optional[bool] = None
+    delete: bool = False
+
+class ErasureRequest(BaseModel):
+    """Erasure subject - any combination of identifiers"""
+    session_id: Optional[str] = None  # raw, as held in the visitor's browser
+    hashed_session_id: Optional[str] = None  # as stored
+    email: Optional[str] = None
+
+class QuestionnaireSummary(BaseModel):
+    """List-page view of a response - no sections or free text"""
+    model_config = ConfigDict(extra="ignore")
+    
+    response_id: str
+    timestamp: datetime
+    status: ResponseStatus
+    watched: bool = False
+    wants_contact: bool = False
+    internal_score: InternalScore = Field(default_factory=InternalScore)
+    internal_notes: str = ""
+    version: int = 1
+    updated_at: Optional[datetime] = None
+
+class ContactSummary(BaseModel):
+    """List-page view of a contact submission"""
+    model_config = ConfigDict(extra="ignore")
+    
+    submission_id: str
+    timestamp: datetime
+    name: str
+    reason: str
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    status: ContactStatus
+    watched: bool = False
+    internal_notes: str = ""
+    version: int = 1
+    updated_at: Optional[datetime] = None
+
+# Precompiled validators/serializers for the admin list fast path
+QUESTIONNAIRE_LIST_ADAPTER = TypeAdapter(List[QuestionnaireResponse])
+CONTACT_LIST_ADAPTER = TypeAdapter(List[ContactSubmission])
+QUESTIONNAIRE_SUMMARY_ADAPTER = TypeAdapter(List[QuestionnaireSummary])
+CONTACT_SUMMARY_ADAPTER = TypeAdapter(List[ContactSummary])
+# fields= selections are arbitrary subsets, passed through unvalidated
+PROJECTED_LIST_ADAPTER = TypeAdapter(List[Dict[str, Any]])
+
 # Response models for public endpoints (no internal data)
 class QuestionnaireResponsePublic(BaseModel):
     """Public response - no internal scores"""
@@ -206,139 +891,1137 @@ class ContactSubmissionPublic(BaseModel):
     timestamp: datetime
 
 # ============================================
-# PUBLIC ENDPOINTS (Frontend-facing)
+# ANALYTICS WRITE-BEHIND BUFFER
 # ============================================
 
-@api_router.get("/")
-async def root():
-    return {"message": "HILLIA Governance Backend", "version": "0.1.0"}
+# Events are grouped across requests and written with insert_many,
+# flushed when the buffer reaches ANALYTICS_FLUSH_SIZE or every
+# ANALYTICS_FLUSH_INTERVAL seconds, whichever comes first.
+ANALYTICS_FLUSH_SIZE = int(os.environ.get('ANALYTICS_FLUSH_SIZE', '200'))
+ANALYTICS_FLUSH_INTERVAL = float(os.environ.get('ANALYTICS_FLUSH_INTERVAL', '2.0'))
+ANALYTICS_BUFFER_MAX = int(os.environ.get('ANALYTICS_BUFFER_MAX', '10000'))
+ANALYTICS_BATCH_MAX = 100  # Max events accepted per batch request
 
-@api_router.post("/questionnaire", response_model=QuestionnaireResponsePublic)
-async def submit_questionnaire(data: QuestionnaireResponseCreate):
-    """Submit questionnaire response"""
-    if not data.consent:
-        raise HTTPException(status_code=400, detail="Consent required for data persistence")
-    
-    response = QuestionnaireResponse(
-        session_id=hashlib.sha256(data.session_id.encode()).hexdigest()[:16],  # Hash session ID
-        consent=data.consent,
-        sections=data.sections,
-        free_text=data.free_text,
-        contact_info=data.contact_info if data.wants_contact else None,
-        wants_contact=data.wants_contact
+def hash_session_id(session_id: str) -> str:
+    """Session IDs are hashed before storage"""
+    return hashlib.sha256(session_id.encode()).hexdigest()[:16]
+
+def build_analytics_doc(event_type: str, session_id: str, event_data: Dict[str, Any], consent: bool) -> dict:
+    """Build the stored analytics document for one consented event"""
+    event = AnalyticsEvent(
+        session_id=hash_session_id(session_id),
+        event_type=event_type,
+        event_data=event_data,
+        consent=consent
     )
     
-    doc = response.model_dump()
-    doc['timestamp'] = doc['timestamp'].isoformat()
+    if ANALYTICS_TIMESERIES:
+        return timeseries_event_doc(ObjectId(), event.timestamp, event.session_id, event.event_type, event.event_data)
+    return event.model_dump()
+
+def analytics_event_fields(doc: dict) -> tuple:
+    """(event_type, session_id) of a stored analytics document in either layout"""
+    fields = doc['meta'] if ANALYTICS_TIMESERIES else doc
+    return fields['event_type'], fields['session_id']
+
+class AnalyticsBuffer:
+    """In-process buffer that batches analytics inserts (analytics is best-effort)"""
     
-    await db.questionnaire_responses.insert_one(doc)
+    def __init__(self, collection_name: str, flush_size: int, flush_interval: float, max_pending: int, setup=None):
+        self.collection_name = collection_name
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.dropped = 0
+        # When the flush timer (and with it the flush hooks) started in this process
+        self.started_at: Optional[datetime] = None
+        self._pending: List[dict] = []
+        self._timer: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+        self._flushes: set = set()
+        self._writes: set = set()
+        # Called with each successfully written batch (rollups etc.)
+        self.flush_hooks: List = []
+        # Run once before the first write (e.g. create the time-series collection)
+        self.setup = setup
+        self._ready = setup is None
+        self._setup_lock = asyncio.Lock()
     
-    logger.info(f"Questionnaire submitted: {response.response_id}")
+    def add(self, docs: List[dict]):
+        """Queue documents; schedules a flush once the size threshold is reached"""
+        if len(self._pending) + len(docs) > self.max_pending:
+            # Mongo is not keeping up - shed analytics rather than grow without bound
+            self.dropped += len(docs)
+            logger.warning(f"Analytics buffer full, dropped {len(docs)} events")
+            return
+        
+        self._pending.extend(docs)
+        
+        if len(self._pending) >= self.flush_size:
+            task = asyncio.get_running_loop().create_task(self.flush())
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
     
-    return QuestionnaireResponsePublic(
-        response_id=response.response_id,
-        timestamp=response.timestamp,
-        status="received"
-    )
-
-@api_router.post("/contact", response_model=ContactSubmissionPublic)
-async def submit_contact(data: ContactSubmissionCreate):
-    """Submit contact form"""
-    if not data.consent:
-        raise HTTPException(status_code=400, detail="Consent required for data persistence")
+    async def prepare(self):
+        """Run the one-time setup if it hasn't succeeded yet"""
+        if self._ready:
+            return
+        async with self._setup_lock:
+            if not self._ready:
+                await self.setup()
+                self._ready = True
     
-    submission = ContactSubmission(
-        name=data.name,
-        reason=data.reason,
-        city=data.city,
-        preferred_contact=data.preferred_contact,
-        email=data.email,
-        phone=data.phone,
-        consent=data.consent
-    )
+    async def flush(self):
+        """Write everything pending in a single insert_many"""
+        if not self._pending:
+            return
+        
+        batch, self._pending = self._pending, []
+        
+        try:
+            await self.prepare()
+            write = asyncio.ensure_future(db[self.collection_name].insert_many(batch, ordered=False))
+            self._writes.add(write)
+            write.add_done_callback(self._writes.discard)
+            await write
+        except Exception:
+            logger.exception(f"Analytics flush failed, {len(batch)} events lost")
+            return
+        
+        for hook in self.flush_hooks:
+            try:
+                await hook(batch)
+            except Exception:
+                logger.exception(f"Analytics flush hook {hook.__name__} failed")
     
-    doc = submission.model_dump()
-    doc['timestamp'] = doc['timestamp'].isoformat()
+    async def discard(self, predicate) -> int:
+        """Drop queued events matching predicate and wait out writes already in flight (erasure)"""
+        before = len(self._pending)
+        self._pending = [doc for doc in self._pending if not predicate(doc)]
+        if self._writes:
+            await asyncio.gather(*self._writes, return_exceptions=True)
+        return before - len(self._pending)
     
-    await db.contact_submissions.insert_one(doc)
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.flush_interval)
+                return
+            except asyncio.TimeoutError:
+                await self.flush()
     
-    logger.info(f"Contact submitted: {submission.submission_id}")
+    def start(self):
+        if self._timer is None:
+            self.started_at = datetime.now(timezone.utc)
+            self._stopping.clear()
+            self._timer = asyncio.get_running_loop().create_task(self._run())
     
-    return ContactSubmissionPublic(
-        submission_id=submission.submission_id,
-        timestamp=submission.timestamp
+    async def stop(self):
+        """Stop the timer and flush whatever is left (shutdown hook)"""
+        if self._timer is not None:
+            # Not cancel() - a flush in progress has already taken its batch off the buffer
+            self._stopping.set()
+            await self._timer
+            self._timer = None
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+        await self.flush()
+
+analytics_buffer = AnalyticsBuffer(
+    ANALYTICS_COLLECTION,
+    flush_size=ANALYTICS_FLUSH_SIZE,
+    flush_interval=ANALYTICS_FLUSH_INTERVAL,
+    max_pending=ANALYTICS_BUFFER_MAX,
+    setup=ensure_analytics_storage,
+)
+
+# ============================================
+# ANALYTICS ROLLUPS (hourly counts per event type)
+# ============================================
+
+# Event types the frontend sends; anything else is rolled up as "other"
+ANALYTICS_EVENT_TYPES = {
+    "homepage_entry",
+    "invitation_opened",
+    "questionnaire_started",
+    "questionnaire_completed",
+    "questionnaire_dropoff",
+    "contact_submitted",
+}
+FUNNEL_STEPS = ["homepage_entry", "invitation_opened", "questionnaire_started", "questionnaire_completed"]
+
+def rollup_event_type(event_type: str) -> str:
+    return event_type if event_type in ANALYTICS_EVENT_TYPES else "other"
+
+def floor_hour(timestamp: datetime) -> datetime:
+    return timestamp.replace(minute=0, second=0, microsecond=0)
+
+def rollup_id(event_type: str, hour: datetime) -> str:
+    return f"{event_type}|{hour:%Y-%m-%dT%H}"
+
+async def update_hourly_rollups(batch: List[dict]):
+    """Fold a flushed batch into analytics_rollups - one upsert per (type, hour)"""
+    counts = Counter((rollup_event_type(analytics_event_fields(doc)[0]), floor_hour(doc['timestamp'])) for doc in batch)
+    ops = [
+        UpdateOne(
+            {"_id": rollup_id(event_type, hour)},
+            {"$inc": {"count": count}, "$setOnInsert": {"event_type": event_type, "hour": hour}},
+            upsert=True
+        )
+        for (event_type, hour), count in counts.items()
+    ]
+    await db.analytics_rollups.bulk_write(ops, ordered=False)
+
+analytics_buffer.flush_hooks.append(update_hourly_rollups)
+
+ROLLUP_BACKFILL_ID = "analytics_rollups_backfill"
+
+async def persist_rollup_cutoff():
+    """Record when incremental rollups started counting; the earliest process wins ($min)"""
+    await db.migrations.update_one(
+        {"_id": ROLLUP_BACKFILL_ID},
+        {"$min": {"cutoff": analytics_buffer.started_at or datetime.now(timezone.utc)}},
+        upsert=True
     )
 
-@api_router.post("/analytics/event")
-async def track_event(event_type: str, session_id: str, event_data: Dict[str, Any] = {}, consent: bool = True):
-    """Track analytics event (consent-based)"""
-    if not consent:
-        return {"status": "skipped", "reason": "no consent"}
+async def backfill_hourly_rollups():
+    """Catch-up: roll up raw events written before incremental rollups existed.
     
-    event = AnalyticsEvent(
-        session_id=hashlib.sha256(session_id.encode()).hexdigest()[:16],
-        event_type=event_type,
-        event_data=event_data,
-        consent=consent
-    )
+    The cutoff is the moment the first process started counting incrementally
+    (persisted at startup, before serving); events before it land in a
+    separate "backfill" field with $set, so a rerun after a crash is idempotent
+    and never double counts the incremental "count".
+    """
+    migration_id = ROLLUP_BACKFILL_ID
+    await persist_rollup_cutoff()
+    state = await db.migrations.find_one({"_id": migration_id})
+    if state.get("done"):
+        return
     
-    doc = event.model_dump()
-    doc['timestamp'] = doc['timestamp'].isoformat()
+    pipeline = [
+        {"$match": {"timestamp": {"$lt": state["cutoff"]}}},
+        {"$group": {
+            "_id": {"event_type": f"${ANALYTICS_TYPE_FIELD}", "hour": {"$dateToString": {"date": "$timestamp", "format": "%Y-%m-%dT%H"}}},
+            "count": {"$sum": 1},
+        }},
+    ]
+    backfill = Counter()
+    async for row in db[ANALYTICS_COLLECTION].aggregate(pipeline, allowDiskUse=True):
+        hour = datetime.strptime(row["_id"]["hour"], "%Y-%m-%dT%H").replace(tzinfo=timezone.utc)
+        backfill[(rollup_event_type(row["_id"]["event_type"]), hour)] += row["count"]
     
-    await db.analytics_events.insert_one(doc)
+    ops = [
+        UpdateOne(
+            {"_id": rollup_id(event_type, hour)},
+            {"$set": {"backfill": count}, "$setOnInsert": {"event_type": event_type, "hour": hour}},
+            upsert=True
+        )
+        for (event_type, hour), count in backfill.items()
+    ]
+    for i in range(0, len(ops), MIGRATION_BATCH_SIZE):
+        await db.analytics_rollups.bulk_write(ops[i:i + MIGRATION_BATCH_SIZE], ordered=False)
     
-    return {"status": "recorded", "event_id": event.event_id}
+    await db.migrations.update_one({"_id": migration_id}, {"$set": {"done": True}})
+    logger.info(f"Analytics rollup backfill: {len(ops)} hourly buckets")
 
 # ============================================
-# ADMIN ENDPOINTS (Internal only)
+# UNIQUE SESSION SKETCHES (HyperLogLog per event type per day)
 # ============================================
 
-@api_router.get("/admin/questionnaire", response_model=List[QuestionnaireResponse])
-async def get_questionnaire_responses(
-    status: Optional[ResponseStatus] = None,
-    watched: Optional[bool] = None,
-    limit: int = 50,
-    skip: int = 0,
-    admin: str = Depends(verify_admin)
-):
-    """Admin: List questionnaire responses"""
-    query = {}
-    if status:
-        query['status'] = status.value
-    if watched is not None:
-        query['watched'] = watched
+HLL_PRECISION = 12  # 4096 registers -> ~1.6% standard error
+HLL_REGISTERS = 1 << HLL_PRECISION
+HLL_ALPHA = 0.7213 / (1 + 1.079 / HLL_REGISTERS)
+HLL_POWERS = [2.0 ** -rank for rank in range(65)]
+SKETCH_MERGE_RETRIES = 5
+
+class HyperLogLog:
+    """Fixed-size distinct counter; sketches merge by register-wise max"""
+    __slots__ = ("registers",)
     
-    responses = await db.questionnaire_responses.find(query, {"_id": 0}).sort("timestamp", -1).skip(skip).limit(limit).to_list(limit)
+    def __init__(self, registers: Optional[bytes] = None):
+        self.registers = bytearray(registers) if registers else bytearray(HLL_REGISTERS)
     
-    for resp in responses:
-        if isinstance(resp.get('timestamp'), str):
-            resp['timestamp'] = datetime.fromisoformat(resp['timestamp'])
+    def add(self, value: str):
+        x = int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+        index = x >> (64 - HLL_PRECISION)
+        rest = x & ((1 << (64 - HLL_PRECISION)) - 1)
+        rank = (64 - HLL_PRECISION) - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
     
-    return responses
-
-@api_router.get("/admin/questionnaire/{response_id}", response_model=QuestionnaireResponse)
-async def get_questionnaire_response(response_id: str, admin: str = Depends(verify_admin)):
-    """Admin: Get single questionnaire response"""
-    response = await db.questionnaire_responses.find_one({"response_id": response_id}, {"_id": 0})
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        return HyperLogLog(bytes(map(max, self.registers, other.registers)))
     
-    if not response:
-        raise HTTPException(status_code=404, detail="Response not found")
+    def count(self) -> int:
+        estimate = HLL_ALPHA * HLL_REGISTERS * HLL_REGISTERS / sum(HLL_POWERS[r] for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * HLL_REGISTERS and zeros:
+            # Small-range correction (linear counting)
+            estimate = HLL_REGISTERS * math.log(HLL_REGISTERS / zeros)
+        return round(estimate)
     
-    if isinstance(response.get('timestamp'), str):
-        response['timestamp'] = datetime.fromisoformat(response['timestamp'])
+    def to_bson(self) -> Binary:
+        # Mostly-empty registers compress to a few hundred bytes
+        return Binary(zlib.compress(bytes(self.registers)))
     
-    return response
+    @classmethod
+    def from_bson(cls, data: bytes) -> "HyperLogLog":
+        return cls(zlib.decompress(data))
 
-@api_router.patch("/admin/questionnaire/{response_id}")
-async def update_questionnaire_response(
-    response_id: str,
-    status: Optional[ResponseStatus] = None,
-    internal_notes: Optional[str] = None,
-    internal_score: Optional[InternalScore] = None,
-    watched: Optional[bool] = None,
-    admin: str = Depends(verify_admin)
-):
-    """Admin: Update questionnaire response (notes, status, score, watched)"""
+def sketch_id(event_type: str, day: str) -> str:
+    return f"{event_type}|{day}"
+
+async def merge_sketch(event_type: str, day: str, sketch: HyperLogLog):
+    """Merge into the stored sketch; a version check keeps concurrent workers from losing updates"""
+    key = sketch_id(event_type, day)
+    for _ in range(SKETCH_MERGE_RETRIES):
+        doc = await db.analytics_sketches.find_one({"_id": key})
+        if doc is None:
+            try:
+                await db.analytics_sketches.insert_one(
+                    {"_id": key, "event_type": event_type, "day": day, "registers": sketch.to_bson(), "version": 1}
+                )
+                return
+            except DuplicateKeyError:
+                continue
+        
+        stored = HyperLogLog.from_bson(doc["registers"])
+        merged = stored.merge(sketch)
+        if merged.registers == stored.registers:
+            return  # Only sessions already counted - nothing to write
+        
+        result = await db.analytics_sketches.update_one(
+            {"_id": key, "version": doc["version"]},
+            {"$set": {"registers": merged.to_bson()}, "$inc": {"version": 1}}
+        )
+        if result.modified_count:
+            return
+    
+    logger.warning(f"Sketch merge for {key} gave up after {SKETCH_MERGE_RETRIES} conflicts")
+
+async def update_session_sketches(batch: List[dict]):
+    """Flush hook: add each event's hashed session to its (type, day) sketch"""
+    sketches: Dict[tuple, HyperLogLog] = {}
+    for doc in batch:
+        event_type, session_id = analytics_event_fields(doc)
+        key = (rollup_event_type(event_type), f"{doc['timestamp']:%Y-%m-%d}")
+        sketch = sketches.get(key)
+        if sketch is None:
+            sketch = sketches[key] = HyperLogLog()
+        sketch.add(session_id)
+    
+    await asyncio.gather(*(merge_sketch(event_type, day, sketch) for (event_type, day), sketch in sketches.items()))
+
+analytics_buffer.flush_hooks.append(update_session_sketches)
+
+# ============================================
+# POST-SUBMIT TASKS (in-process queue + worker pool)
+# ============================================
+
+TASK_WORKERS = int(os.environ.get('TASK_WORKERS', '4'))
+TASK_QUEUE_MAX = int(os.environ.get('TASK_QUEUE_MAX', '10000'))
+TASK_MAX_ATTEMPTS = int(os.environ.get('TASK_MAX_ATTEMPTS', '5'))
+TASK_RETRY_DELAY = 1.0  # seconds, doubled per attempt
+TASK_RETRY_MAX = 60.0
+TASK_DRAIN_TIMEOUT = float(os.environ.get('TASK_DRAIN_TIMEOUT', '10'))
+
+class TaskQueue:
+    """Follow-up work run off the request path by a fixed pool of workers.
+    
+    Tasks are coroutine functions called with the arguments they were
+    submitted with. A failing task is re-queued with exponential backoff
+    (without holding a worker) up to max_attempts. Tasks live in memory only,
+    and a retry or a spool replay can run one twice - they must be idempotent.
+    """
+    
+    def __init__(self, workers: int, max_pending: int, max_attempts: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+        self.completed = 0
+        self.failed = 0  # gave up after max_attempts
+        self.retried = 0
+        self.dropped = 0  # queue full or shutting down
+        self.running = 0
+        self.delayed = 0  # waiting out a retry backoff
+        self.wait_latency = Histogram()  # submit -> start of (first) run
+        self.run_latency: Dict[str, Histogram] = {}
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._workers: List[asyncio.Task] = []
+        self._accepting = False
+        self._idle = asyncio.Event()
+        self._idle.set()
+    
+    @property
+    def queued(self) -> int:
+        return self._queue.qsize() + self.delayed
+    
+    @property
+    def outstanding(self) -> int:
+        return self.queued + self.running
+    
+    def submit(self, fn, *args) -> bool:
+        """Queue fn(*args); False (and counted as dropped) if the queue is full or shutting down"""
+        if not self._accepting or self.outstanding >= self.max_pending:
+            self.dropped += 1
+            logger.warning(f"Task queue {'full' if self._accepting else 'stopped'}, dropped {fn.__name__}")
+            return False
+        self._idle.clear()
+        self._queue.put_nowait((fn, args, 1, time.perf_counter()))
+        return True
+    
+    def _requeue(self, item: tuple):
+        self.delayed -= 1
+        self._queue.put_nowait(item)
+    
+    async def _worker(self):
+        while True:
+            fn, args, attempt, submitted = await self._queue.get()
+            if attempt == 1:
+                self.wait_latency.observe(time.perf_counter() - submitted)
+            self.running += 1
+            start = time.perf_counter()
+            try:
+                await fn(*args)
+                self.completed += 1
+            except Exception:
+                if attempt < self.max_attempts:
+                    delay = min(TASK_RETRY_DELAY * 2 ** (attempt - 1), TASK_RETRY_MAX)
+                    logger.warning(f"Task {fn.__name__} failed (attempt {attempt}), retrying in {delay:.0f}s", exc_info=True)
+                    self.retried += 1
+                    self.delayed += 1
+                    asyncio.get_running_loop().call_later(delay, self._requeue, (fn, args, attempt + 1, submitted))
+                else:
+                    logger.exception(f"Task {fn.__name__} failed after {attempt} attempts, giving up")
+                    self.failed += 1
+            finally:
+                self.running -= 1
+                histogram = self.run_latency.get(fn.__name__)
+                if histogram is None:
+                    histogram = self.run_latency[fn.__name__] = Histogram()
+                histogram.observe(time.perf_counter() - start)
+                if not self.outstanding:
+                    self._idle.set()
+    
+    def start(self):
+        self._accepting = True
+        while len(self._workers) < self.workers:
+            self._workers.append(asyncio.get_running_loop().create_task(self._worker()))
+    
+    async def stop(self, timeout: float):
+        """Stop accepting, let queued work (and retries) finish within timeout, then cancel the workers"""
+        self._accepting = False
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Task queue: {self.outstanding} tasks abandoned at shutdown")
+        for worker in self._workers:
+            worker.cancel()
+        self._workers = []
+
+task_queue = TaskQueue(TASK_WORKERS, max_pending=TASK_QUEUE_MAX, max_attempts=TASK_MAX_ATTEMPTS)
+
+# Follow-up work per stored submission (notifications, derived fields, scoring
+# hints): coroutine functions taking the stored document, run by task_queue
+post_submit_hooks: Dict[str, List] = {"questionnaire_responses": [], "contact_submissions": []}
+
+def after_submission(collection: str, doc: dict):
+    """Queue the post-submit hooks for a document now in Mongo"""
+    for hook in post_submit_hooks[collection]:
+        task_queue.submit(hook, doc)
+
+# ============================================
+# SUBMISSION SPOOL (local write-ahead log in front of Mongo)
+# ============================================
+
+# SUBMISSION_SPOOL=on: public submissions are acknowledged once fsync'd to a
+# local log and written to Mongo in the background. SPOOL_DIR must be on a
+# persistent volume, or a redeploy loses whatever had not been drained.
+SUBMISSION_SPOOL = os.environ.get('SUBMISSION_SPOOL', 'off') == 'on'
+SPOOL_DIR = Path(os.environ.get('SPOOL_DIR', str(ROOT_DIR / 'spool')))
+SPOOL_SEGMENT_BYTES = int(os.environ.get('SPOOL_SEGMENT_BYTES', str(4 << 20)))
+SPOOL_MAX_BYTES = int(os.environ.get('SPOOL_MAX_BYTES', str(256 << 20)))
+SPOOL_DRAIN_BATCH = int(os.environ.get('SPOOL_DRAIN_BATCH', '200'))
+SPOOL_DRAIN_INTERVAL = float(os.environ.get('SPOOL_DRAIN_INTERVAL', '0.5'))
+SPOOL_RETRY_MAX = 30.0  # seconds, drain backoff ceiling while Mongo is failing
+SPOOL_RECORD_HEADER = struct.Struct(">II")  # payload length, crc32
+SPOOL_CODEC_OPTIONS = CodecOptions(tz_aware=True)
+
+# Spooled collection -> id field the drainer upserts on
+SPOOL_SOURCES = {"questionnaire_responses": "response_id", "contact_submissions": "submission_id"}
+
+class SpoolFull(Exception):
+    """The spool hit SPOOL_MAX_BYTES - Mongo has been unavailable for a long time"""
+
+class SubmissionSpool:
+    """Segment-based write-ahead log for public submissions.
+    
+    Appends from concurrent requests are group-committed: one write and one
+    fsync per batch, in a worker thread. Records are length-prefixed, CRC'd
+    BSON. A drainer replays sealed segments and the committed part of the
+    active one into Mongo as upserts on the submission id (so replaying a
+    record twice is harmless) and deletes each segment once it is applied.
+    
+    Each process owns a locked subdirectory of the spool root and checkpoints
+    its drain position there. At startup it adopts the segments of
+    directories whose owner is gone and replays them from their checkpoint,
+    so nothing acknowledged is lost and nothing drained (then perhaps erased)
+    comes back.
+    """
+    
+    def __init__(self, root: Path, sources: Dict[str, str], segment_bytes: int, max_bytes: int, batch_size: int, interval: float):
+        self.root = root
+        self.sources = sources
+        self.segment_bytes = segment_bytes
+        self.max_bytes = max_bytes
+        self.batch_size = batch_size
+        self.interval = interval
+        self.directory = root / f"worker-{uuid.uuid4().hex[:12]}"
+        self.bytes = 0  # on disk, not yet deleted
+        self.appended = 0
+        self.drained = 0
+        self.commit_latency = Histogram()
+        # Writer state - only touched by the commit thread once started
+        self._file = None
+        self._active_seq = 0
+        self._active_size = 0
+        # Committed (fsync'd) position, read by the drainer
+        self._lock = threading.Lock()
+        self._committed = (0, 0)  # (segment, bytes)
+        # Drainer position; only moves forward once a batch is in Mongo
+        self._read = (1, 0)
+        self._skip: Dict[int, int] = {}  # adopted segment -> offset already drained
+        self._lock_fd: Optional[int] = None
+        self._pending: List[tuple] = []  # (record, future)
+        self._committer: Optional[asyncio.Task] = None
+        self._drainer: Optional[asyncio.Task] = None
+        self._drain_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+    
+    def _segment_path(self, seq: int) -> Path:
+        return self.directory / f"{seq:012d}.log"
+    
+    def _fsync_directory(self):
+        """Make a newly created segment's directory entry durable"""
+        fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    
+    def _open(self):
+        """Claim our directory, adopt orphaned segments and open a fresh active segment"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock_fd = os.open(self.directory / "lock", os.O_CREAT | os.O_RDWR)
+        fcntl.flock(self._lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        
+        adopted = 0
+        for other in sorted(self.root.glob("worker-*")):
+            if other == self.directory:
+                continue
+            try:
+                fd = os.open(other / "lock", os.O_CREAT | os.O_RDWR)
+            except FileNotFoundError:
+                continue  # Another starting process adopted it first
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                continue  # A live process still owns it
+            checkpoint_seq, checkpoint_offset = self._read_checkpoint(other)
+            for segment in sorted(other.glob("*.log")):
+                seq = int(segment.stem)
+                if seq < checkpoint_seq:
+                    segment.unlink()  # Drained; the owner died before deleting it
+                    continue
+                adopted += 1
+                self.bytes += segment.stat().st_size
+                os.rename(segment, self._segment_path(adopted))
+                if seq == checkpoint_seq and checkpoint_offset:
+                    self._skip[adopted] = checkpoint_offset
+            for leftover in ("checkpoint", "checkpoint.tmp", "lock"):
+                (other / leftover).unlink(missing_ok=True)
+            os.close(fd)
+            other.rmdir()
+        
+        # A new segment even after a restart - an adopted tail may be torn
+        self._active_seq = adopted + 1
+        self._file = open(self._segment_path(self._active_seq), "ab")
+        self._committed = (self._active_seq, 0)
+        self._fsync_directory()
+        if adopted:
+            logger.info(f"Submission spool: replaying {adopted} segments ({self.bytes} bytes) left by a previous process")
+    
+    @staticmethod
+    def _read_checkpoint(directory: Path) -> tuple:
+        try:
+            seq, offset = (directory / "checkpoint").read_text().split()
+            return int(seq), int(offset)
+        except (FileNotFoundError, ValueError):
+            return 0, 0
+
+    def _checkpoint(self, position: tuple):
+        """Persist the drain position (drainer thread)"""
+        tmp = self.directory / "checkpoint.tmp"
+        with open(tmp, "w") as f:
+            f.write(f"{position[0]} {position[1]}")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.directory / "checkpoint")
+
+    def _write(self, records: List[bytes]):
+        """Append and fsync (commit thread)"""
+        for record in records:
+            if self._active_size and self._active_size + len(record) > self.segment_bytes:
+                self._file.close()
+                self._active_seq += 1
+                self._active_size = 0
+                self._file = open(self._segment_path(self._active_seq), "ab")
+                self._fsync_directory()
+            self._file.write(record)
+            self._active_size += len(record)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        with self._lock:
+            self._committed = (self._active_seq, self._active_size)
+    
+    async def _commit(self):
+        while self._pending:
+            batch, self._pending = self._pending, []
+            start = time.perf_counter()
+            try:
+                await run_in_threadpool(self._write, [record for record, _ in batch])
+            except OSError as e:
+                logger.exception("Submission spool write failed")
+                self.bytes -= sum(len(record) for record, _ in batch)
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            self.commit_latency.observe(time.perf_counter() - start)
+            self.appended += len(batch)
+            for _, future in batch:
+                future.set_result(None)
+            self._wakeup.set()
+    
+    async def append(self, collection: str, doc: dict):
+        """Returns once the document is durable on local disk"""
+        payload = bson.encode({"collection": collection, "doc": doc})
+        record = SPOOL_RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+        if self.bytes + len(record) > self.max_bytes:
+            raise SpoolFull()
+        self.bytes += len(record)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((record, future))
+        if self._committer is None or self._committer.done():
+            self._committer = asyncio.get_running_loop().create_task(self._commit())
+        await future
+    
+    def _read_batch(self) -> tuple:
+        """Up to batch_size committed records after the read position (drainer thread)"""
+        with self._lock:
+            committed_seq, committed_size = self._committed
+        seq, offset = self._read
+        records = []
+        finished = []  # sealed segments read to the end
+        
+        while len(records) < self.batch_size and seq <= committed_seq:
+            end = committed_size if seq == committed_seq else None
+            path = self._segment_path(seq)
+            if offset == 0:
+                offset = self._skip.get(seq, 0)
+            if path.exists():
+                with open(path, "rb") as f:
+                    f.seek(offset)
+                    while len(records) < self.batch_size and (end is None or offset < end):
+                        header = f.read(SPOOL_RECORD_HEADER.size)
+                        if len(header) < SPOOL_RECORD_HEADER.size:
+                            break
+                        length, crc = SPOOL_RECORD_HEADER.unpack(header)
+                        payload = f.read(length)
+                        if len(payload) < length or zlib.crc32(payload) != crc:
+                            # Torn write from a crash - it was never acknowledged
+                            logger.warning(f"Submission spool: discarding torn tail of segment {seq}")
+                            offset = path.stat().st_size
+                            break
+                        records.append(bson.decode(payload, codec_options=SPOOL_CODEC_OPTIONS))
+                        offset += SPOOL_RECORD_HEADER.size + length
+                if len(records) >= self.batch_size or seq == committed_seq:
+                    break
+            finished.append(seq)
+            seq, offset = seq + 1, 0
+        
+        return records, (seq, offset), finished
+    
+    async def _apply(self, records: List[dict]):
+        ops: Dict[str, list] = {}
+        for record in records:
+            collection = record["collection"]
+            id_field = self.sources[collection]
+            # $setOnInsert: a record replayed after a crash, or a document an admin has since edited, is left alone
+            ops.setdefault(collection, []).append(
+                UpdateOne({id_field: record["doc"][id_field]}, {"$setOnInsert": record["doc"]}, upsert=True)
+            )
+        await asyncio.gather(*(db[collection].bulk_write(batch, ordered=False) for collection, batch in ops.items()))
+        for record in records:
+            after_submission(record["collection"], record["doc"])
+    
+    async def drain_once(self) -> int:
+        """Move one batch into Mongo; returns how many records were applied"""
+        async with self._drain_lock:
+            records, position, finished = await run_in_threadpool(self._read_batch)
+            if records:
+                await self._apply(records)
+            if position != self._read:
+                await run_in_threadpool(self._checkpoint, position)
+            self._read = position
+            for seq in finished:
+                path = self._segment_path(seq)
+                if path.exists():
+                    self.bytes -= path.stat().st_size
+                    path.unlink()
+            self.drained += len(records)
+            return len(records)
+    
+    async def drain(self):
+        """Apply everything committed so far (erasure, shutdown)"""
+        while await self.drain_once():
+            pass
+    
+    async def _run(self):
+        delay = self.interval
+        while True:
+            try:
+                if await self.drain_once():
+                    delay = self.interval
+                    continue
+            except (PyMongoError, OSError):
+                logger.warning(f"Submission spool drain failed, {self.bytes} bytes waiting, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, SPOOL_RETRY_MAX)
+                continue
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+    
+    async def start(self):
+        await run_in_threadpool(self._open)
+        if self._drainer is None:
+            self._drainer = asyncio.get_running_loop().create_task(self._run())
+    
+    async def stop(self, timeout: float):
+        """Finish pending appends and drain what Mongo will take within timeout; the rest is replayed on restart"""
+        if self._committer is not None:
+            await asyncio.gather(self._committer, return_exceptions=True)
+        if self._drainer is not None:
+            self._drainer.cancel()
+            self._drainer = None
+        try:
+            await asyncio.wait_for(self.drain(), timeout)
+        except (PyMongoError, asyncio.TimeoutError):
+            logger.warning(f"Submission spool: {self.bytes} bytes left on disk for the next start")
+        if self._file is not None:
+            self._file.close()
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+
+submission_spool = SubmissionSpool(
+    SPOOL_DIR,
+    SPOOL_SOURCES,
+    segment_bytes=SPOOL_SEGMENT_BYTES,
+    max_bytes=SPOOL_MAX_BYTES,
+    batch_size=SPOOL_DRAIN_BATCH,
+    interval=SPOOL_DRAIN_INTERVAL,
+) if SUBMISSION_SPOOL else None
+
+async def store_submission(collection: str, doc: dict):
+    """Insert a public submission (through the spool when SUBMISSION_SPOOL is on); post-submit hooks run once it is in Mongo"""
+    if submission_spool is None:
+        await db[collection].insert_one(doc)
+        after_submission(collection, doc)
+        return
+    try:
+        await submission_spool.append(collection, doc)
+    except SpoolFull:
+        logger.error("Submission spool full - rejecting submissions until Mongo catches up")
+        raise HTTPException(status_code=503, detail="Temporarily unavailable, please try again shortly")
+
+# ============================================
+# PUBLIC ENDPOINTS (Frontend-facing)
+# ============================================
+
+@api_router.get("/")
+async def root():
+    return {"message": "HILLIA Governance Backend", "version": "0.1.0"}
+
+@api_router.post("/questionnaire", response_model=QuestionnaireResponsePublic)
+async def submit_questionnaire(data: QuestionnaireResponseCreate):
+    """Submit questionnaire response"""
+    if not data.consent:
+        raise HTTPException(status_code=400, detail="Consent required for data persistence")
+    
+    response = QuestionnaireResponse(
+        session_id=hash_session_id(data.session_id),
+        consent=data.consent,
+        sections=data.sections,
+        free_text=data.free_text,
+        contact_info=data.contact_info if data.wants_contact else None,
+        wants_contact=data.wants_contact
+    )
+    
+    doc = response.model_dump()
+    doc['search_text'] = questionnaire_search_text(response.free_text)
+    
+    await store_submission("questionnaire_responses", doc)
+    
+    logger.info(f"Questionnaire submitted: {response.response_id}")
+    
+    return QuestionnaireResponsePublic(
+        response_id=response.response_id,
+        timestamp=response.timestamp,
+        status="received"
+    )
+
+@api_router.post("/contact", response_model=ContactSubmissionPublic)
+async def submit_contact(data: ContactSubmissionCreate):
+    """Submit contact form"""
+    if not data.consent:
+        raise HTTPException(status_code=400, detail="Consent required for data persistence")
+    
+    submission = ContactSubmission(
+        name=data.name,
+        reason=data.reason,
+        city=data.city,
+        preferred_contact=data.preferred_contact,
+        email=data.email,
+        phone=data.phone,
+        consent=data.consent
+    )
+    
+    doc = submission.model_dump()
+    
+    await store_submission("contact_submissions", doc)
+    
+    logger.info(f"Contact submitted: {submission.submission_id}")
+    
+    return ContactSubmissionPublic(
+        submission_id=submission.submission_id,
+        timestamp=submission.timestamp
+    )
+
+@api_router.post("/analytics/event")
+async def track_event(event_type: str, session_id: str, event_data: Dict[str, Any] = {}, consent: bool = True):
+    """Track analytics event (consent-based)"""
+    if not consent:
+        return {"status": "skipped", "reason": "no consent"}
+    
+    doc = build_analytics_doc(event_type, session_id, event_data, consent)
+    analytics_buffer.add([doc])
+    
+    event_id = str(doc['_id']) if ANALYTICS_TIMESERIES else doc['event_id']
+    return {"status": "recorded", "event_id": event_id}
+
+@api_router.post("/analytics/events")
+async def track_events(events: List[AnalyticsEventCreate]):
+    """Track a batch of analytics events (consent-based)"""
+    if len(events) > ANALYTICS_BATCH_MAX:
+        raise HTTPException(status_code=413, detail=f"At most {ANALYTICS_BATCH_MAX} events per batch")
+    
+    docs = [
+        build_analytics_doc(e.event_type, e.session_id, e.event_data, e.consent)
+        for e in events
+        if e.consent
+    ]
+    analytics_buffer.add(docs)
+    
+    return {"status": "recorded", "recorded": len(docs), "skipped": len(events) - len(docs)}
+
+# ============================================
+# ADMIN ENDPOINTS (Internal only)
+# ============================================
+
+def encode_cursor(doc: dict, id_field: str) -> str:
+    """Opaque keyset cursor for the (timestamp, id) position after doc"""
+    timestamp = doc['timestamp']
+    if isinstance(timestamp, datetime):
+        timestamp = timestamp.isoformat()
+    position = json.dumps([timestamp, doc[id_field]])
+    return base64.urlsafe_b64encode(position.encode()).decode()
+
+def apply_cursor(query: dict, cursor: str, id_field: str):
+    """Restrict query to documents sorted after the cursor position"""
+    try:
+        timestamp, last_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        timestamp = datetime.fromisoformat(timestamp)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    
+    query['$or'] = [
+        {"timestamp": {"$lt": timestamp}},
+        {"timestamp": timestamp, id_field: {"$lt": last_id}},
+    ]
+
+# Admin reads are revalidated on every use; unchanged data comes back as a bodiless 304
+ADMIN_CACHE_CONTROL = "private, no-cache"
+
+def version_projection(id_field: str) -> dict:
+    return {"_id": 0, id_field: 1, "timestamp": 1, "version": 1, "updated_at": 1}
+
+def last_modified(doc: dict) -> Optional[datetime]:
+    """updated_at or timestamp; None for an unparseable legacy value the timestamp migration left behind"""
+    value = doc.get('updated_at') or doc.get('timestamp')
+    if isinstance(value, str):
+        try:
+            value = parse_timestamp(value)
+        except ValueError:
+            return None
+    return value if isinstance(value, datetime) else None
+
+def doc_validator(doc: dict) -> str:
+    """Version token of one document; updated_at also separates never-versioned documents edited once"""
+    modified = last_modified(doc)
+    if modified is None:
+        return str(doc.get('version', 1))
+    return f"{doc.get('version', 1)}.{int(modified.timestamp() * 1000)}"
+
+def page_etag(docs: List[dict], id_field: str) -> str:
+    digest = hashlib.sha1()
+    for doc in docs:
+        digest.update(f"{doc[id_field]}:{doc_validator(doc)};".encode())
+    return f'W/"{digest.hexdigest()[:20]}"'
+
+def cache_headers(etag: str, modified: Optional[datetime] = None) -> dict:
+    headers = {"ETag": etag, "Cache-Control": ADMIN_CACHE_CONTROL}
+    if modified:
+        headers["Last-Modified"] = format_datetime(modified.astimezone(timezone.utc), usegmt=True)
+    return headers
+
+def is_fresh(if_none_match: Optional[str], if_modified_since: Optional[str], etag: str, modified: Optional[datetime] = None) -> bool:
+    """Whether the client's copy is current; If-None-Match takes precedence (RFC 9110)"""
+    if if_none_match:
+        if if_none_match.strip() == "*":
+            return True
+        # Weak comparison - gzip changes the bytes, not the representation
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag.removeprefix("W/") in tags
+    if if_modified_since and modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return modified.replace(microsecond=0) <= since
+    return False
+
+async def detail_response(
+    collection: str,
+    id_field: str,
+    doc_id: str,
+    model: type,
+    if_none_match: Optional[str],
+    if_modified_since: Optional[str],
+    not_found: str,
+) -> Response:
+    """Single-document read; a conditional hit costs one projected lookup and no body"""
+    if if_none_match or if_modified_since:
+        current = await db[collection].find_one({id_field: doc_id}, version_projection(id_field))
+        if not current:
+            raise HTTPException(status_code=404, detail=not_found)
+        etag = f'W/"{doc_validator(current)}"'
+        if is_fresh(if_none_match, if_modified_since, etag, last_modified(current)):
+            return Response(status_code=304, headers=cache_headers(etag, last_modified(current)))
+    
+    doc = await db[collection].find_one({id_field: doc_id}, {"_id": 0})
+    
+    if not doc:
+        raise HTTPException(status_code=404, detail=not_found)
+    
+    headers = cache_headers(f'W/"{doc_validator(doc)}"', last_modified(doc))
+    return Response(content=model.model_validate(doc).model_dump_json(), media_type="application/json", headers=headers)
+
+def list_projection(
+    view: ListView,
+    fields: Optional[str],
+    model: type,
+    summary_model: type,
+    id_field: str,
+    adapter: TypeAdapter,
+    summary_adapter: TypeAdapter,
+) -> tuple:
+    """Mongo projection and serializer for a list request (view=summary or fields=a,b,c)"""
+    if fields:
+        if view != ListView.FULL:
+            raise HTTPException(status_code=400, detail="Use either fields or view, not both")
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = requested - model.model_fields.keys()
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+        # id and timestamp build the cursor, version and updated_at the ETag
+        projection = {"_id": 0, id_field: 1, "timestamp": 1, "version": 1, "updated_at": 1, **{name: 1 for name in requested}}
+        return projection, PROJECTED_LIST_ADAPTER
+    
+    if view == ListView.SUMMARY:
+        return {"_id": 0, **{name: 1 for name in summary_model.model_fields}}, summary_adapter
+    
+    return {"_id": 0}, adapter
+
+async def find_page(
+    collection: str,
+    id_field: str,
+    query: dict,
+    limit: int,
+    skip: int,
+    cursor: Optional[str],
+    projection: Optional[dict] = None,
+) -> tuple:
+    """Newest-first page of a collection; keyset when a cursor is given, skip otherwise.
+    
+    Returns (docs, next_cursor) - next_cursor is None when the page is not full.
+    """
+    if cursor:
+        apply_cursor(query, cursor, id_field)
+        skip = 0
+    
+    docs = await db[collection].find(query, projection or {"_id": 0}).sort([("timestamp", -1), (id_field, -1)]).skip(skip).limit(limit).to_list(limit)
+    
+    next_cursor = encode_cursor(docs[-1], id_field) if docs and len(docs) == limit else None
+    
+    return docs, next_cursor
+
+def list_json_response(adapter: TypeAdapter, docs: List[dict], next_cursor: Optional[str], etag: Optional[str] = None) -> Response:
+    """Fast path for list endpoints: one validation pass, then straight to JSON bytes.
+    
+    Returning a Response skips FastAPI's response_model handling (validate,
+    dump to Python objects, json.dumps); the bytes are identical.
+    """
+    headers = cache_headers(etag) if etag else {}
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    body = adapter.dump_json(adapter.validate_python(docs))
+    return Response(content=body, media_type="application/json", headers=headers)
+
+async def list_page_response(
+    collection: str,
+    id_field: str,
+    query: dict,
+    limit: int,
+    skip: int,
+    cursor: Optional[str],
+    projection: dict,
+    adapter: TypeAdapter,
+    if_none_match: Optional[str],
+) -> Response:
+    """List page with an ETag over its (id, version) pairs; revalidation checks those first"""
+    if if_none_match:
+        current, _ = await find_page(collection, id_field, dict(query), limit, skip, cursor, version_projection(id_field))
+        etag = page_etag(current, id_field)
+        if is_fresh(if_none_match, None, etag):
+            return Response(status_code=304, headers=cache_headers(etag))
+    
+    docs, next_cursor = await find_page(collection, id_field, query, limit, skip, cursor, projection)
+    
+    return list_json_response(adapter, docs, next_cursor, page_etag(docs, id_field))
+
+@api_router.get("/admin/questionnaire", response_model=List[QuestionnaireResponse])
+async def get_questionnaire_responses(
+    status: Optional[ResponseStatus] = None,
+    watched: Optional[bool] = None,
+    limit: int = 50,
+    skip: int = 0,
+    cursor: Optional[str] = None,
+    view: ListView = ListView.FULL,
+    fields: Optional[str] = None,
+    if_none_match: Optional[str] = Header(default=None),
+    admin: str = Depends(verify_admin)
+):
+    """Admin: List questionnaire responses (next page cursor in X-Next-Cursor)"""
+    projection, adapter = list_projection(
+        view, fields, QuestionnaireResponse, QuestionnaireSummary, "response_id",
+        QUESTIONNAIRE_LIST_ADAPTER, QUESTIONNAIRE_SUMMARY_ADAPTER
+    )
+    
+    query = {}
+    if status:
+        query['status'] = status.value
+    if watched is not None:
+        query['watched'] = watched
+    
+    return await list_page_response(
+        "questionnaire_responses", "response_id", query, limit, skip, cursor, projection, adapter, if_none_match
+    )
+
+@api_router.get("/admin/questionnaire/{response_id}", response_model=QuestionnaireResponse)
+async def get_questionnaire_response(
+    response_id: str,
+    if_none_match: Optional[str] = Header(default=None),
+    if_modified_since: Optional[str] = Header(default=None),
+    admin: str = Depends(verify_admin)
+):
+    """Admin: Get single questionnaire response (ETag / Last-Modified, 304 when unchanged)"""
+    return await detail_response(
+        "questionnaire_responses", "response_id", response_id, QuestionnaireResponse,
+        if_none_match, if_modified_since, "Response not found"
+    )
+
+BULK_MAX_OPERATIONS = 500
+
+def versioned_update(update_data: dict) -> dict:
+    """$set plus a version bump, so cached copies (ETags) go stale"""
+    return {"$set": {**update_data, "updated_at": datetime.now(timezone.utc)}, "$inc": {"version": 1}}
+
+async def apply_bulk_operations(collection_name: str, id_field: str, operations: List[BaseModel]) -> dict:
+    """Apply per-document changes/deletes as one unordered bulk_write, with a result per item"""
+    if len(operations) > BULK_MAX_OPERATIONS:
+        raise HTTPException(status_code=413, detail=f"At most {BULK_MAX_OPERATIONS} operations per request")
+    
+    results = [{"id": op.id} for op in operations]
+    writes = []
+    positions = []  # index into operations for each write
+    
+    for i, op in enumerate(operations):
+        if op.delete:
+            writes.append(DeleteOne({id_field: op.id}))
+        else:
+            update_data = op.model_dump(mode="json", exclude={"id", "delete"}, exclude_none=True)
+            if not update_data:
+                results[i].update(result="invalid", detail="No update data provided")
+                continue
+            writes.append(UpdateOne({id_field: op.id}, versioned_update(update_data)))
+        positions.append(i)
+    
+    if writes:
+        # One indexed lookup tells us which ids exist, so each item gets its own outcome
+        ids = [operations[i].id for i in positions]
+        existing = set(await db[collection_name].distinct(id_field, {id_field: {"$in": ids}}))
+        
+        failed = {}
+        try:
+            await db[collection_name].bulk_write(writes, ordered=False)
+        except BulkWriteError as e:
+            failed = {error["index"]: error["errmsg"] for error in e.details.get("writeErrors", [])}
+        
+        for n, i in enumerate(positions):
+            op = operations[i]
+            if n in failed:
+                results[i].update(result="error", detail=failed[n])
+            elif op.id not in existing:
+                results[i]["result"] = "not_found"
+            else:
+                results[i]["result"] = "deleted" if op.delete else "updated"
+    
+    return {"results": results, "summary": dict(Counter(r["result"] for r in results))}
+
+@api_router.patch("/admin/questionnaire/{response_id}")
+async def update_questionnaire_response(
+    response_id: str,
+    status: Optional[ResponseStatus] = None,
+    internal_notes: Optional[str] = None,
+    internal_score: Optional[InternalScore] = None,
+    watched: Optional[bool] = None,
+    admin: str = Depends(verify_admin)
+):
+    """Admin: Update questionnaire response (notes, status, score, watched)"""
     update_data = {}
     
     if status:
@@ -355,7 +2038,7 @@ async def update_questionnaire_response(
     
     result = await db.questionnaire_responses.update_one(
         {"response_id": response_id},
-        {"$set": update_data}
+        versioned_update(update_data)
     )
     
     if result.matched_count == 0:
@@ -377,28 +2060,42 @@ async def delete_questionnaire_response(response_id: str, admin: str = Depends(v
     
     return {"status": "deleted", "response_id": response_id}
 
+@api_router.post("/admin/questionnaire/bulk")
+async def bulk_questionnaire_operations(operations: List[QuestionnaireBulkOperation], admin: str = Depends(verify_admin)):
+    """Admin: Update or delete many questionnaire responses in one request"""
+    result = await apply_bulk_operations("questionnaire_responses", "response_id", operations)
+    
+    logger.info(f"Admin {admin} bulk-updated questionnaire responses: {result['summary']}")
+    
+    return result
+
 @api_router.get("/admin/contact", response_model=List[ContactSubmission])
 async def get_contact_submissions(
     status: Optional[ContactStatus] = None,
     watched: Optional[bool] = None,
     limit: int = 50,
     skip: int = 0,
+    cursor: Optional[str] = None,
+    view: ListView = ListView.FULL,
+    fields: Optional[str] = None,
+    if_none_match: Optional[str] = Header(default=None),
     admin: str = Depends(verify_admin)
 ):
-    """Admin: List contact submissions"""
+    """Admin: List contact submissions (next page cursor in X-Next-Cursor)"""
+    projection, adapter = list_projection(
+        view, fields, ContactSubmission, ContactSummary, "submission_id",
+        CONTACT_LIST_ADAPTER, CONTACT_SUMMARY_ADAPTER
+    )
+    
     query = {}
     if status:
         query['status'] = status.value
     if watched is not None:
         query['watched'] = watched
     
-    submissions = await db.contact_submissions.find(query, {"_id": 0}).sort("timestamp", -1).skip(skip).limit(limit).to_list(limit)
-    
-    for sub in submissions:
-        if isinstance(sub.get('timestamp'), str):
-            sub['timestamp'] = datetime.fromisoformat(sub['timestamp'])
-    
-    return submissions
+    return await list_page_response(
+        "contact_submissions", "submission_id", query, limit, skip, cursor, projection, adapter, if_none_match
+    )
 
 @api_router.patch("/admin/contact/{submission_id}")
 async def update_contact_submission(
@@ -423,7 +2120,7 @@ async def update_contact_submission(
     
     result = await db.contact_submissions.update_one(
         {"submission_id": submission_id},
-        {"$set": update_data}
+        versioned_update(update_data)
     )
     
     if result.matched_count == 0:
@@ -443,39 +2140,733 @@ async def delete_contact_submission(submission_id: str, admin: str = Depends(ver
     
     return {"status": "deleted", "submission_id": submission_id}
 
+@api_router.post("/admin/contact/bulk")
+async def bulk_contact_operations(operations: List[ContactBulkOperation], admin: str = Depends(verify_admin)):
+    """Admin: Update or delete many contact submissions in one request"""
+    result = await apply_bulk_operations("contact_submissions", "submission_id", operations)
+    
+    logger.info(f"Admin {admin} bulk-updated contact submissions: {result['summary']}")
+    
+    return result
+
 @api_router.get("/admin/contact/{submission_id}", response_model=ContactSubmission)
-async def get_contact_submission(submission_id: str, admin: str = Depends(verify_admin)):
-    """Admin: Get single contact submission"""
-    submission = await db.contact_submissions.find_one({"submission_id": submission_id}, {"_id": 0})
+async def get_contact_submission(
+    submission_id: str,
+    if_none_match: Optional[str] = Header(default=None),
+    if_modified_since: Optional[str] = Header(default=None),
+    admin: str = Depends(verify_admin)
+):
+    """Admin: Get single contact submission (ETag / Last-Modified, 304 when unchanged)"""
+    return await detail_response(
+        "contact_submissions", "submission_id", submission_id, ContactSubmission,
+        if_none_match, if_modified_since, "Submission not found"
+    )
+
+async def count_by_conditions(collection: str, conditions: Dict[str, tuple]) -> Dict[str, int]:
+    """Count a collection's total and each (field, value) condition in one aggregation pass"""
+    group = {"_id": None, "total": {"$sum": 1}}
+    for name, (field, value) in conditions.items():
+        group[name] = {"$sum": {"$cond": [{"$eq": [f"${field}", value]}, 1, 0]}}
     
-    if not submission:
-        raise HTTPException(status_code=404, detail="Submission not found")
+    rows = await db[collection].aggregate([{"$group": group}]).to_list(1)
+    row = rows[0] if rows else {}
+    
+    return {name: row.get(name, 0) for name in ["total", *conditions]}
+
+@api_router.get("/admin/analytics/funnel")
+async def get_analytics_funnel(
+    start: Optional[datetime] = Query(default=None, alias="from"),
+    end: Optional[datetime] = Query(default=None, alias="to"),
+    admin: str = Depends(verify_admin)
+):
+    """Admin: Funnel counts from hourly rollups (default: last 30 days, hour granularity)"""
+    end = end or datetime.now(timezone.utc)
+    start = start or end - timedelta(days=30)
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    if start >= end:
+        raise HTTPException(status_code=400, detail="'from' must be before 'to'")
+    
+    pipeline = [
+        {"$match": {"hour": {"$gte": floor_hour(start), "$lt": end}}},
+        {"$group": {
+            "_id": "$event_type",
+            "count": {"$sum": {"$add": [{"$ifNull": ["$count", 0]}, {"$ifNull": ["$backfill", 0]}]}},
+        }},
+    ]
+    counts = {row["_id"]: row["count"] async for row in db.analytics_rollups.aggregate(pipeline)}
     
-    if isinstance(submission.get('timestamp'), str):
-        submission['timestamp'] = datetime.fromisoformat(submission['timestamp'])
+    funnel = []
+    previous = None
+    for step in FUNNEL_STEPS:
+        count = counts.get(step, 0)
+        funnel.append({
+            "step": step,
+            "count": count,
+            "conversion_from_previous": round(count / previous * 100, 1) if previous else None,
+        })
+        previous = count
     
-    return submission
+    return {
+        "from": floor_hour(start),
+        "to": end,
+        "counts": counts,
+        "funnel": funnel,
+        "dropoff": counts.get("questionnaire_dropoff", 0),
+    }
+
+@api_router.get("/admin/analytics/uniques")
+async def get_analytics_uniques(
+    start: Optional[date] = Query(default=None, alias="from"),
+    end: Optional[date] = Query(default=None, alias="to"),
+    admin: str = Depends(verify_admin)
+):
+    """Admin: Approximate unique sessions per event type (inclusive days, default last 30)"""
+    end = end or datetime.now(timezone.utc).date()
+    start = start or end - timedelta(days=29)
+    if start > end:
+        raise HTTPException(status_code=400, detail="'from' must not be after 'to'")
+    if (end - start).days > 366:
+        raise HTTPException(status_code=400, detail="Range is limited to one year")
+    
+    query = {"day": {"$gte": start.isoformat(), "$lte": end.isoformat()}}
+    merged: Dict[str, HyperLogLog] = {}
+    async for doc in db.analytics_sketches.find(query, {"event_type": 1, "registers": 1}):
+        sketch = HyperLogLog.from_bson(doc["registers"])
+        event_type = doc["event_type"]
+        merged[event_type] = merged[event_type].merge(sketch) if event_type in merged else sketch
+    
+    visitors = HyperLogLog()
+    for sketch in merged.values():
+        visitors = visitors.merge(sketch)
+    
+    by_event_type = {event_type: sketch.count() for event_type, sketch in merged.items()}
+    
+    def rate(part: str, whole: int):
+        return round(min(by_event_type.get(part, 0) / whole * 100, 100.0), 1) if whole else None
+    
+    unique_visitors = visitors.count()
+    started = by_event_type.get("questionnaire_started", 0)
+    
+    return {
+        "from": start,
+        "to": end,
+        "unique_visitors": unique_visitors,
+        "by_event_type": by_event_type,
+        "conversion": {
+            "started_from_visitors": rate("questionnaire_started", unique_visitors),
+            "completed_from_started": rate("questionnaire_completed", started),
+        },
+    }
+
+# ============================================
+# GDPR ERASURE
+# ============================================
+
+def submission_targets(sessions: List[str], email: Optional[str]) -> List[tuple]:
+    """(collection, query, collation) deletes for a subject's responses and contact submissions.
+    
+    Email and session matches are separate queries: a collation applies to the
+    whole query, and only the email indexes are built with EMAIL_COLLATION.
+    """
+    targets = []
+    if email:
+        targets.append(("questionnaire_responses", {"contact_info.email": email}, EMAIL_COLLATION))
+        targets.append(("contact_submissions", {"email": email}, EMAIL_COLLATION))
+    if sessions:
+        targets.append(("questionnaire_responses", {"session_id": {"$in": sessions}}, None))
+    return targets
+
+# Keys the email digest in erasure receipts. Must stay the same across restarts, workers and
+# admin token secret rotations, or past receipts can no longer be checked - so there is no default
+ERASURE_RECEIPT_SECRET = os.environ.get('ERASURE_RECEIPT_SECRET')
+
+def email_digest(email: str) -> str:
+    """Keyed digest for receipts - a plain hash of an email is reversible by dictionary"""
+    return hmac.new(ERASURE_RECEIPT_SECRET.encode(), email.strip().lower().encode(), hashlib.sha256).hexdigest()
+
+def analytics_session_targets(sessions: List[str]) -> List[tuple]:
+    """(collection, query) pairs holding analytics for these hashed sessions"""
+    targets = [(ANALYTICS_COLLECTION, {ANALYTICS_SESSION_FIELD: {"$in": sessions}})]
+    if ANALYTICS_TIMESERIES:
+        # Legacy collection until the operator drops it after migration
+        targets.append(("analytics_events", {"session_id": {"$in": sessions}}))
+    return targets
+
+async def delete_count(collection: str, query: dict, collation: Optional[Collation] = None) -> int:
+    result = await db[collection].delete_many(query, collation=collation)
+    return result.deleted_count
+
+async def erase_late_analytics(receipt_id: str, sessions: List[str]):
+    """Second pass once other workers' buffers have flushed"""
+    await asyncio.sleep(ANALYTICS_FLUSH_INTERVAL * 2)
+    try:
+        counts = await asyncio.gather(*(delete_count(c, q) for c, q in analytics_session_targets(sessions)))
+        await db.erasure_receipts.update_one({"receipt_id": receipt_id}, {"$set": {"late_analytics_events": sum(counts)}})
+    except PyMongoError:
+        logger.exception(f"Late analytics erasure failed for receipt {receipt_id}")
+
+async def erase_late_submissions(receipt_id: str, targets: List[tuple]):
+    """Second pass for submissions still in other workers' spools"""
+    await asyncio.sleep(max(SPOOL_DRAIN_INTERVAL * 4, 2.0))
+    try:
+        counts = await asyncio.gather(*(delete_count(*target) for target in targets))
+        await db.erasure_receipts.update_one({"receipt_id": receipt_id}, {"$set": {"late_submissions": sum(counts)}})
+    except PyMongoError:
+        logger.exception(f"Late submission erasure failed for receipt {receipt_id}")
+
+@api_router.post("/admin/erasure")
+async def erase_subject(request: ErasureRequest, admin: str = Depends(verify_admin)):
+    """Admin: Erase everything held for a session and/or email in one pass (GDPR)"""
+    sessions = set()
+    if request.session_id:
+        sessions.add(hash_session_id(request.session_id))
+    if request.hashed_session_id:
+        sessions.add(request.hashed_session_id)
+    if not sessions and not request.email:
+        raise HTTPException(status_code=400, detail="Provide session_id, hashed_session_id or email")
+    if request.email and not ERASURE_RECEIPT_SECRET:
+        raise HTTPException(status_code=503, detail="Erasure by email needs ERASURE_RECEIPT_SECRET to be configured")
+    
+    started = time.perf_counter()
+    email = request.email.strip() if request.email else None
+    
+    if email:
+        # Responses that left contact details also identify their session's analytics
+        cursor = db.questionnaire_responses.find({"contact_info.email": email}, {"_id": 0, "session_id": 1}, collation=EMAIL_COLLATION)
+        sessions.update([doc["session_id"] async for doc in cursor])
+    
+    sessions = sorted(sessions)
+    targets = submission_targets(sessions, email)
+    
+    # Submissions this process accepted but has not yet written to Mongo
+    if submission_spool is not None:
+        await submission_spool.drain()
+    
+    # Events still queued in this process never reach Mongo
+    discarded = await analytics_buffer.discard(lambda doc: analytics_event_fields(doc)[1] in sessions)
+    
+    analytics_deletes = [delete_count(c, q) for c, q in analytics_session_targets(sessions)] if sessions else []
+    counts = await asyncio.gather(*(delete_count(*target) for target in targets), *analytics_deletes)
+    # A response matched by both email and session is deleted (and counted) by one of them only
+    deleted = Counter()
+    for (collection, _, _), count in zip(targets, counts):
+        deleted[collection] += count
+    analytics_count = sum(counts[len(targets):]) + discarded
+    
+    receipt = {
+        "receipt_id": str(uuid.uuid4()),
+        "timestamp": datetime.now(timezone.utc),
+        "admin": admin,
+        # Identifiers only in stored (hashed) form - the receipt must not re-identify anyone
+        "subject": {
+            "hashed_session_ids": sessions,
+            "email_hmac": email_digest(email) if email else None,
+        },
+        "deleted": {
+            "questionnaire_responses": deleted["questionnaire_responses"],
+            "contact_submissions": deleted["contact_submissions"],
+            "analytics_events": analytics_count,
+        },
+        "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+    await db.erasure_receipts.insert_one(receipt)
+    receipt.pop("_id", None)
+    
+    if sessions:
+        spawn(erase_late_analytics(receipt["receipt_id"], sessions))
+    if submission_spool is not None:
+        spawn(erase_late_submissions(receipt["receipt_id"], targets))
+    
+    logger.info(f"Admin {admin} erased subject, receipt {receipt['receipt_id']}: {receipt['deleted']}")
+    
+    return receipt
+
+# ============================================
+# ADMIN EXPORT (streaming)
+# ============================================
+
+EXPORT_BATCH_SIZE = 500
+
+class ExportCollection(str, Enum):
+    QUESTIONNAIRE = "questionnaire"
+    CONTACT = "contact"
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+# collection name, id field, model, status enum
+EXPORT_SOURCES = {
+    ExportCollection.QUESTIONNAIRE: ("questionnaire_responses", "response_id", QuestionnaireResponse, ResponseStatus),
+    ExportCollection.CONTACT: ("contact_submissions", "submission_id", ContactSubmission, ContactStatus),
+}
+
+async def iter_export_batches(collection: str, id_field: str, query: dict):
+    """Yield documents a batch at a time - only one batch is held in memory"""
+    cursor = db[collection].find(query, {"_id": 0}).sort([("timestamp", -1), (id_field, -1)]).batch_size(EXPORT_BATCH_SIZE)
+    while True:
+        batch = await cursor.to_list(EXPORT_BATCH_SIZE)
+        if not batch:
+            return
+        yield batch
+
+async def stream_ndjson(batches, model: type):
+    adapter = TypeAdapter(model)
+    async for batch in batches:
+        yield b"".join(adapter.dump_json(adapter.validate_python(doc)) + b"\n" for doc in batch)
+
+# Leading characters a spreadsheet treats as a formula (OWASP CSV injection)
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+# A signed plain number or phone number ("+91 98765 43210", "-3.5") has no formula to run and stays as typed
+CSV_SIGNED_NUMBER = re.compile(r"[+-][\d ().-]+")
+
+def csv_cell(value):
+    """Applicant text opened in a spreadsheet must not run as a formula - quote it with a leading '"""
+    if isinstance(value, (dict, list)):
+        # Nested answers / scores go in as JSON so each document stays one row
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES) and not CSV_SIGNED_NUMBER.fullmatch(value):
+        return "'" + value
+    return value
+
+async def stream_csv(batches, model: type):
+    columns = list(model.model_fields)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    
+    def drain() -> bytes:
+        data = buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+    
+    writer.writerow(columns)
+    yield drain()
+    
+    async for batch in batches:
+        for doc in batch:
+            row = model.model_validate(doc).model_dump(mode="json")
+            writer.writerow([csv_cell(row[c]) for c in columns])
+        yield drain()
+
+@api_router.get("/admin/export/{collection}")
+async def export_collection(
+    collection: ExportCollection,
+    format: ExportFormat = ExportFormat.NDJSON,
+    status: Optional[str] = None,
+    watched: Optional[bool] = None,
+    admin: str = Depends(verify_admin)
+):
+    """Admin: Stream a full export (NDJSON or CSV) for offline review"""
+    collection_name, id_field, model, status_enum = EXPORT_SOURCES[collection]
+    
+    query = {}
+    if status:
+        if status not in {s.value for s in status_enum}:
+            raise HTTPException(status_code=400, detail=f"Invalid status for {collection.value}")
+        query['status'] = status
+    if watched is not None:
+        query['watched'] = watched
+    
+    batches = iter_export_batches(collection_name, id_field, query)
+    if format == ExportFormat.CSV:
+        body, media_type = stream_csv(batches, model), "text/csv"
+    else:
+        body, media_type = stream_ndjson(batches, model), "application/x-ndjson"
+    
+    filename = f"hillia-{collection.value}-{datetime.now(timezone.utc):%Y%m%d}.{format.value}"
+    
+    logger.info(f"Admin {admin} exported {collection.value} as {format.value}")
+    
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+# ============================================
+# ADMIN SEARCH (text indexes)
+# ============================================
+
+SEARCH_MAX_LIMIT = 100
+SEARCH_MAX_DEPTH = 1000  # skip + limit; relevance pages are re-ranked per request
+
+# Result rows reuse the list-page summaries
+SEARCH_SUMMARIES = {
+    ExportCollection.QUESTIONNAIRE: QuestionnaireSummary,
+    ExportCollection.CONTACT: ContactSummary,
+}
+
+def questionnaire_search_text(free_text: Dict[str, str]) -> str:
+    """Free-text answers flattened into one string - text indexes can't see inside a dict with arbitrary keys"""
+    return "\n".join(text for text in free_text.values() if text)
+
+async def migrate_search_text():
+    """Fill search_text on responses stored before it existed (resumable, _id order)"""
+    migration_id = "questionnaire_search_text"
+    state = await db.migrations.find_one({"_id": migration_id}) or {}
+    if state.get("done"):
+        return
+    
+    last_id = state.get("last_id")
+    migrated = 0
+    
+    while True:
+        query = {"search_text": {"$exists": False}}
+        if last_id is not None:
+            query["_id"] = {"$gt": last_id}
+        
+        batch = await db.questionnaire_responses.find(query, {"_id": 1, "free_text": 1}).sort("_id", 1).limit(MIGRATION_BATCH_SIZE).to_list(MIGRATION_BATCH_SIZE)
+        if not batch:
+            break
+        
+        ops = [
+            UpdateOne({"_id": doc['_id']}, {"$set": {"search_text": questionnaire_search_text(doc.get('free_text') or {})}})
+            for doc in batch
+        ]
+        await db.questionnaire_responses.bulk_write(ops, ordered=False)
+        
+        migrated += len(ops)
+        last_id = batch[-1]['_id']
+        await db.migrations.update_one({"_id": migration_id}, {"$set": {"last_id": last_id}}, upsert=True)
+        await asyncio.sleep(MIGRATION_BATCH_PAUSE)
+    
+    await db.migrations.update_one(
+        {"_id": migration_id},
+        {"$set": {"done": True, "completed_at": datetime.now(timezone.utc)}},
+        upsert=True
+    )
+    logger.info(f"Search text migration: {migrated} questionnaire responses indexed")
+
+async def search_collection(collection: ExportCollection, q: str, status: Optional[str], watched: Optional[bool], depth: int) -> List[dict]:
+    """Top `depth` matches of one collection by text score, as summary rows"""
+    collection_name, id_field, _, _ = EXPORT_SOURCES[collection]
+    summary = SEARCH_SUMMARIES[collection]
+    
+    query = {"$text": {"$search": q}}
+    if status:
+        query['status'] = status
+    if watched is not None:
+        query['watched'] = watched
+    
+    projection = {"_id": 0, "score": {"$meta": "textScore"}, **{name: 1 for name in summary.model_fields}}
+    docs = await db[collection_name].find(query, projection).sort(
+        [("score", {"$meta": "textScore"}), ("timestamp", -1), (id_field, -1)]
+    ).limit(depth).to_list(depth)
+    
+    return [
+        {"collection": collection.value, "score": round(doc["score"], 4), **summary.model_validate(doc).model_dump()}
+        for doc in docs
+    ]
+
+@api_router.get("/admin/search")
+async def search_admin(
+    q: str = Query(min_length=1, max_length=200),
+    collection: Optional[ExportCollection] = None,
+    status: Optional[str] = None,
+    watched: Optional[bool] = None,
+    limit: int = Query(default=20, ge=1, le=SEARCH_MAX_LIMIT),
+    skip: int = Query(default=0, ge=0),
+    admin: str = Depends(verify_admin)
+):
+    """Admin: Relevance-ranked search over free text, notes and contact name/reason"""
+    if skip + limit > SEARCH_MAX_DEPTH:
+        raise HTTPException(status_code=400, detail=f"Search results are limited to the first {SEARCH_MAX_DEPTH}")
+    
+    collections = [collection] if collection else list(SEARCH_SUMMARIES)
+    if status:
+        # Statuses differ per collection - only search where the filter means something
+        collections = [c for c in collections if status in {s.value for s in EXPORT_SOURCES[c][3]}]
+        if not collections:
+            raise HTTPException(status_code=400, detail="Invalid status for the searched collections")
+    
+    depth = skip + limit + 1  # one extra row tells whether there is another page
+    found = await asyncio.gather(*(search_collection(c, q, status, watched, depth) for c in collections))
+    results = sorted((row for rows in found for row in rows), key=lambda row: row["score"], reverse=True)
+    
+    return {
+        "query": q,
+        "results": results[skip:skip + limit],
+        "has_more": len(results) > skip + limit,
+    }
+
+# ============================================
+# ADMIN LIVE FEED (one change stream per process, fanned out over SSE)
+# ============================================
+
+FEED_QUEUE_SIZE = 100  # per subscriber; a client this far behind is disconnected
+FEED_REPLAY_SIZE = int(os.environ.get('FEED_REPLAY_SIZE', '500'))
+FEED_HEARTBEAT = 15.0  # seconds between keep-alive comments
+FEED_RETRY_DELAY = 1.0  # watcher reconnect backoff, doubled up to FEED_RETRY_MAX
+FEED_RETRY_MAX = 30.0
+FEED_OPERATIONS = ["insert", "update", "replace", "delete"]
+
+# Mongo collection -> (name in events, id field)
+FEED_SOURCES = {name: (collection.value, id_field) for collection, (name, id_field, _, _) in EXPORT_SOURCES.items()}
+
+# Server error codes: not a replica set / change streams unsupported, and resume token too old
+CHANGE_STREAM_UNSUPPORTED = {40573, 136}
+CHANGE_STREAM_HISTORY_LOST = {280, 286}
+NAMESPACE_NOT_FOUND = 26
+
+def sse_message(event: str, data: dict, event_id: Optional[str] = None) -> bytes:
+    lines = f"id: {event_id}\n" if event_id else ""
+    return f"{lines}event: {event}\ndata: {json.dumps(data, default=str)}\n\n".encode()
+
+# Sent when a client may have missed events - it should refetch lists and stats
+FEED_RESET = sse_message("reset", {})
+
+class ChangeFeed:
+    """Pushes inserts, updates and deletes on the review collections to connected admins.
+    
+    A single watcher task holds the one change-stream cursor for the process,
+    and only while someone is subscribed. Each event is encoded once and put on
+    every subscriber's queue. The watcher resumes from its last resume token
+    after errors and idle periods, and the last FEED_REPLAY_SIZE events are
+    kept so a client reconnecting with Last-Event-ID misses nothing.
+    """
+    
+    def __init__(self, sources: Dict[str, tuple], queue_size: int, replay_size: int):
+        self.sources = sources
+        self.queue_size = queue_size
+        # Event ids are "<epoch>-<sequence>"; another worker's or a previous process's ids mean a reset
+        self.epoch = uuid.uuid4().hex[:8]
+        self.sequence = 0
+        self.recent: deque = deque(maxlen=replay_size)  # (sequence, message)
+        self.resume_token = None
+        self.unsupported = False
+        self.published = 0
+        self.restarts = 0
+        self.overflows = 0
+        # None until checked; then whether deletes come with their pre-image (Mongo 6.0+)
+        self.pre_images: Optional[bool] = None
+        self._subscribers: set = set()
+        self._task: Optional[asyncio.Task] = None
+    
+    def pipeline(self) -> List[dict]:
+        id_fields = {id_field for _, id_field in self.sources.values()}
+        return [
+            {"$match": {"ns.coll": {"$in": list(self.sources)}, "operationType": {"$in": FEED_OPERATIONS}}},
+            # Names of changed fields only - values (notes, contact details) never leave the server
+            {"$project": {
+                "operationType": 1,
+                "ns": 1,
+                "clusterTime": 1,
+                **{f"fullDocument.{field}": 1 for field in sorted(id_fields)},
+                **{f"fullDocumentBeforeChange.{field}": 1 for field in sorted(id_fields)},
+                "fullDocument.status": 1,
+                "fullDocument.version": 1,
+                "changed": {"$map": {
+                    "input": {"$objectToArray": {"$ifNull": ["$updateDescription.updatedFields", {}]}},
+                    "in": "$$this.k",
+                }},
+            }},
+        ]
+    
+    def event(self, change: dict) -> dict:
+        name, id_field = self.sources[change["ns"]["coll"]]
+        # Deletes have no fullDocument; the pre-image (projected to the id) names the removed document
+        document = change.get("fullDocument") or change.get("fullDocumentBeforeChange") or {}
+        return {
+            "collection": name,
+            "operation": change["operationType"],
+            "id": document.get(id_field),
+            "status": document.get("status"),
+            "version": document.get("version"),
+            "changed": change.get("changed") or [],
+            "at": change["clusterTime"].as_datetime() if "clusterTime" in change else None,
+        }
+    
+    def publish(self, event: dict):
+        self.sequence += 1
+        self.published += 1
+        message = sse_message("change", event, f"{self.epoch}-{self.sequence}")
+        self.recent.append((self.sequence, message))
+        for queue in list(self._subscribers):
+            self._offer(queue, message)
+    
+    def _offer(self, queue: asyncio.Queue, message: Optional[bytes]):
+        if queue.qsize() < self.queue_size:
+            queue.put_nowait(message)
+            return
+        # Too far behind - end its stream; it reconnects and catches up from the replay buffer
+        self.overflows += 1
+        self._subscribers.discard(queue)
+        queue.put_nowait(None)
+    
+    def replay(self, last_event_id: Optional[str]) -> List[bytes]:
+        """Messages a reconnecting client missed, or a reset if they are no longer buffered"""
+        if not last_event_id:
+            return []
+        epoch, _, sequence = last_event_id.partition("-")
+        if epoch != self.epoch or not sequence.isdigit():
+            return [FEED_RESET]
+        sequence = int(sequence)
+        if sequence >= self.sequence:
+            return []
+        if not self.recent or self.recent[0][0] > sequence + 1:
+            return [FEED_RESET]
+        return [message for seq, message in self.recent if seq > sequence]
+    
+    def subscribe(self, last_event_id: Optional[str] = None) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue()
+        missed = self.replay(last_event_id)
+        for message in missed[-self.queue_size:]:
+            queue.put_nowait(message)
+        self._subscribers.add(queue)
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return queue
+    
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.discard(queue)
+        if not self._subscribers and self._task is not None:
+            # Nobody listening - release the cursor; the resume token picks up from here next time
+            self._task.cancel()
+            self._task = None
+    
+    async def enable_pre_images(self):
+        """Turn on change stream pre-images for the watched collections; without them deleted ids are null"""
+        if self.pre_images is not None:
+            return
+        try:
+            for collection in self.sources:
+                await db.command("collMod", collection, changeStreamPreAndPostImages={"enabled": True})
+            self.pre_images = True
+        except OperationFailure as e:
+            if e.code == NAMESPACE_NOT_FOUND:
+                return  # nothing submitted yet - check again on the next watch
+            logger.warning(f"Change stream pre-images unavailable ({e.code}) - deletes in the live feed will have a null id")
+            self.pre_images = False
+    
+    async def _watch(self):
+        await self.enable_pre_images()
+        options = {"full_document_before_change": "whenAvailable"} if self.pre_images else {}
+        async with db.watch(self.pipeline(), full_document="updateLookup", resume_after=self.resume_token, **options) as stream:
+            async for change in stream:
+                self.resume_token = stream.resume_token
+                self.publish(self.event(change))
+    
+    async def _run(self):
+        delay = FEED_RETRY_DELAY
+        while True:
+            started = time.monotonic()
+            try:
+                await self._watch()
+            except OperationFailure as e:
+                if e.code in CHANGE_STREAM_UNSUPPORTED:
+                    logger.warning("Change streams unavailable (Mongo is not a replica set) - admin live feed disabled")
+                    self.unsupported = True
+                    self.close()
+                    return
+                if e.code in CHANGE_STREAM_HISTORY_LOST and self.resume_token is not None:
+                    logger.warning("Change stream resume token expired, restarting from now")
+                    self.resume_token = None
+                    for queue in list(self._subscribers):
+                        self._offer(queue, FEED_RESET)
+                else:
+                    logger.warning(f"Change stream failed ({e.code}), retrying in {delay:.0f}s")
+            except PyMongoError as e:
+                logger.warning(f"Change stream interrupted ({type(e).__name__}), retrying in {delay:.0f}s")
+            
+            self.restarts += 1
+            if time.monotonic() - started > FEED_RETRY_MAX:
+                delay = FEED_RETRY_DELAY  # The stream was healthy for a while - start backoff over
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, FEED_RETRY_MAX)
+    
+    def close(self):
+        """End every subscriber's stream and stop watching (shutdown hook)"""
+        for queue in list(self._subscribers):
+            queue.put_nowait(None)
+        self._subscribers.clear()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+    
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+    
+    @property
+    def watching(self) -> bool:
+        return self._task is not None
+
+change_feed = ChangeFeed(FEED_SOURCES, queue_size=FEED_QUEUE_SIZE, replay_size=FEED_REPLAY_SIZE)
+
+@api_router.get("/admin/stream")
+async def admin_stream(
+    last_event_id: Optional[str] = Header(default=None),
+    admin: str = Depends(verify_admin)
+):
+    """Admin: Server-Sent Events for inserts/updates/deletes on responses and contacts"""
+    if change_feed.unsupported:
+        raise HTTPException(status_code=503, detail="Live feed unavailable: change streams need a replica set")
+    
+    # Credentials are only checked on connect - end the stream when a session token would have expired
+    deadline = time.monotonic() + ADMIN_TOKEN_TTL
+    
+    async def events():
+        queue = change_feed.subscribe(last_event_id)
+        try:
+            yield b"retry: 3000\n\n"
+            while time.monotonic() < deadline:
+                try:
+                    message = await asyncio.wait_for(queue.get(), FEED_HEARTBEAT)
+                except asyncio.TimeoutError:
+                    message = b": keep-alive\n\n"
+                if message is None:
+                    return
+                yield message
+        finally:
+            change_feed.unsubscribe(queue)
+    
+    logger.info(f"Admin {admin} opened the live feed")
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 @api_router.get("/admin/stats")
 async def get_admin_stats(admin: str = Depends(verify_admin)):
     """Admin: Get aggregated statistics (counts and percentages only)"""
-    # Questionnaire counts by status
-    questionnaire_total = await db.questionnaire_responses.count_documents({})
-    questionnaire_unreviewed = await db.questionnaire_responses.count_documents({"status": "unreviewed"})
-    questionnaire_reviewed = await db.questionnaire_responses.count_documents({"status": "reviewed"})
-    questionnaire_archived = await db.questionnaire_responses.count_documents({"status": "archived"})
-    questionnaire_watched = await db.questionnaire_responses.count_documents({"watched": True})
-    
-    # Contact submission counts by status
-    contact_total = await db.contact_submissions.count_documents({})
-    contact_new = await db.contact_submissions.count_documents({"status": "new"})
-    contact_reviewed = await db.contact_submissions.count_documents({"status": "reviewed"})
-    contact_archived = await db.contact_submissions.count_documents({"status": "archived"})
-    contact_watched = await db.contact_submissions.count_documents({"watched": True})
-    
-    # Questionnaire responses wanting contact
-    wants_contact_yes = await db.questionnaire_responses.count_documents({"wants_contact": True})
-    wants_contact_no = await db.questionnaire_responses.count_documents({"wants_contact": False})
+    # One pass per collection, both collections concurrently
+    q, c = await asyncio.gather(
+        count_by_conditions("questionnaire_responses", {
+            "unreviewed": ("status", "unreviewed"),
+            "reviewed": ("status", "reviewed"),
+            "archived": ("status", "archived"),
+            "watched": ("watched", True),
+            # Questionnaire responses wanting contact
+            "wants_contact_yes": ("wants_contact", True),
+            "wants_contact_no": ("wants_contact", False),
+        }),
+        count_by_conditions("contact_submissions", {
+            "new": ("status", "new"),
+            "reviewed": ("status", "reviewed"),
+            "archived": ("status", "archived"),
+            "watched": ("watched", True),
+        }),
+    )
+    
+    questionnaire_total = q["total"]
+    questionnaire_unreviewed = q["unreviewed"]
+    questionnaire_reviewed = q["reviewed"]
+    questionnaire_archived = q["archived"]
+    questionnaire_watched = q["watched"]
+    wants_contact_yes = q["wants_contact_yes"]
+    wants_contact_no = q["wants_contact_no"]
+    
+    contact_total = c["total"]
+    contact_new = c["new"]
+    contact_reviewed = c["reviewed"]
+    contact_archived = c["archived"]
+    contact_watched = c["watched"]
     
     def pct(part, total):
         return round((part / total * 100), 1) if total > 0 else 0
@@ -505,6 +2896,54 @@ async def get_admin_stats(admin: str = Depends(verify_admin)):
         }
     }
 
+@api_router.get("/admin/indexes")
+async def get_index_health(admin: str = Depends(verify_admin)):
+    """Admin: Index usage stats and query plans for the hot admin queries"""
+    indexes = {}
+    for collection in COLLECTION_INDEXES:
+        try:
+            rows = await db[collection].aggregate([{"$indexStats": {}}]).to_list(None)
+            indexes[collection] = [
+                {
+                    "name": row["name"],
+                    "key": row["key"],
+                    "ops": row["accesses"]["ops"],
+                    "since": row["accesses"]["since"],
+                }
+                for row in rows
+            ]
+        except PyMongoError as e:
+            indexes[collection] = {"error": str(e)}
+    
+    queries = []
+    for hot in HOT_QUERIES:
+        find = {"find": hot["collection"], "filter": hot["filter"], "limit": 50}
+        if hot["sort"]:
+            find["sort"] = hot["sort"]
+        try:
+            explain = await db.command({"explain": find, "verbosity": "queryPlanner"})
+            stages = plan_stages(explain["queryPlanner"]["winningPlan"])
+            queries.append({"name": hot["name"], "stages": stages, "collscan": "COLLSCAN" in stages})
+        except PyMongoError as e:
+            queries.append({"name": hot["name"], "error": str(e)})
+    
+    return {
+        "indexes": indexes,
+        "queries": queries,
+        "collscan": [q["name"] for q in queries if q.get("collscan")],
+    }
+
+@api_router.post("/admin/auth/login")
+async def admin_login(admin: str = Depends(verify_admin_password)):
+    """Admin: Exchange Basic credentials for a short-lived session token"""
+    logger.info(f"Admin {admin} logged in")
+    
+    return {
+        "access_token": issue_admin_token(admin),
+        "token_type": "bearer",
+        "expires_in": ADMIN_TOKEN_TTL,
+    }
+
 @api_router.post("/admin/auth/verify")
 async def verify_admin_auth(admin: str = Depends(verify_admin)):
     """Admin: Verify credentials are valid"""
@@ -513,18 +2952,607 @@ async def verify_admin_auth(admin: str = Depends(verify_admin)):
 # Include the router in the main app
 app.include_router(api_router)
 
-# Health check endpoint for Kubernetes liveness/readiness probes
+# Health check endpoint for Kubernetes liveness probes
 @app.get("/health")
 async def health_check():
-    """Health check endpoint for Kubernetes"""
+    """Liveness check endpoint for Kubernetes (see /ready for DB readiness)"""
     return {"status": "healthy"}
 
+# ============================================
+# READINESS (cached background ping)
+# ============================================
+
+READINESS_PING_INTERVAL = float(os.environ.get('READINESS_PING_INTERVAL', '5'))
+READINESS_PING_TIMEOUT = 2.0
+WARMUP_TIMEOUT = 10.0
+
+class DatabaseProbe:
+    """Pings Mongo in the background; readiness checks read the cached result"""
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.reachable = False
+        self.latency_ms: Optional[float] = None
+        self.checked_at: Optional[float] = None  # time.monotonic()
+        self.error: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    async def ping(self):
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(client.admin.command("ping"), READINESS_PING_TIMEOUT)
+            self.reachable, self.error = True, None
+            self.latency_ms = round((time.perf_counter() - start) * 1000, 2)
+        except (PyMongoError, asyncio.TimeoutError) as e:
+            self.reachable, self.error = False, type(e).__name__
+            self.latency_ms = None
+        self.checked_at = time.monotonic()
+    
+    async def _run(self):
+        while True:
+            await self.ping()
+            await asyncio.sleep(self.interval)
+    
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+    
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+    
+    def is_stale(self) -> bool:
+        return self.checked_at is None or time.monotonic() - self.checked_at > 3 * self.interval
+
+db_probe = DatabaseProbe(READINESS_PING_INTERVAL)
+
+async def warm_connection_pool():
+    """Open MONGO_MIN_POOL_SIZE connections before serving (TLS handshakes happen here, not on a request)"""
+    start = time.perf_counter()
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*(client.admin.command("ping") for _ in range(MONGO_MIN_POOL_SIZE))),
+            WARMUP_TIMEOUT
+        )
+        logger.info(f"Mongo pool warmed: {pool_metrics.open()} connections in {time.perf_counter() - start:.2f}s")
+    except (PyMongoError, asyncio.TimeoutError):
+        logger.warning("Mongo pool warmup failed - starting anyway, readiness will report it")
+
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe - reports the cached DB ping, never queries Mongo itself"""
+    in_use = pool_metrics.in_use()
+    ready = db_probe.reachable and not db_probe.is_stale()
+    body = {
+        "status": "ready" if ready else "unavailable",
+        "database": {
+            "reachable": db_probe.reachable,
+            "ping_ms": db_probe.latency_ms,
+            "checked_seconds_ago": round(time.monotonic() - db_probe.checked_at, 1) if db_probe.checked_at else None,
+            "error": db_probe.error,
+        },
+        "pool": {
+            "open": pool_metrics.open(),
+            "in_use": in_use,
+            "max_size": MONGO_MAX_POOL_SIZE,
+            "saturation": round(in_use / MONGO_MAX_POOL_SIZE, 3),
+        },
+        "admission": {"capacity": admission.capacity, "active": admission.active, "classes": admission.snapshot()},
+    }
+    return JSONResponse(body, status_code=200 if ready else 503)
+
+# Metrics endpoint - served only with "Authorization: Bearer <METRICS_TOKEN>"; without a token it is
+# disabled, since route names, admin traffic and pool stats would otherwise be public on the API host
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+
+def render_metrics() -> str:
+    lines = [
+        "# HELP hillia_http_requests_in_flight Requests currently being handled",
+        "# TYPE hillia_http_requests_in_flight gauge",
+        f"hillia_http_requests_in_flight {http_metrics.in_flight}",
+        "# HELP hillia_http_request_duration_seconds Request latency by route",
+        "# TYPE hillia_http_request_duration_seconds histogram",
+    ]
+    for (method, route), histogram in list(http_metrics.latency.items()):
+        lines += histogram.render("hillia_http_request_duration_seconds", f'method="{method}",route="{route}"')
+    
+    lines += [
+        "# HELP hillia_http_requests_total Requests by route and status code",
+        "# TYPE hillia_http_requests_total counter",
+    ]
+    for (method, route, status_code), count in list(http_metrics.statuses.items()):
+        lines.append(f'hillia_http_requests_total{{method="{method}",route="{route}",status="{status_code}"}} {count}')
+    
+    lines += [
+        "# HELP hillia_mongo_command_duration_seconds Mongo command latency by collection and command",
+        "# TYPE hillia_mongo_command_duration_seconds histogram",
+    ]
+    for (collection, command), histogram in mongo_metrics.snapshot().items():
+        lines += histogram.render("hillia_mongo_command_duration_seconds", f'collection="{collection}",command="{command}"')
+    
+    lines += [
+        "# HELP hillia_analytics_buffer_pending Analytics events waiting to be written",
+        "# TYPE hillia_analytics_buffer_pending gauge",
+        f"hillia_analytics_buffer_pending {len(analytics_buffer._pending)}",
+        "# HELP hillia_analytics_events_dropped_total Analytics events shed because the buffer was full",
+        "# TYPE hillia_analytics_events_dropped_total counter",
+        f"hillia_analytics_events_dropped_total {analytics_buffer.dropped}",
+    ]
+    if submission_spool is not None:
+        lines += [
+            "# HELP hillia_spool_bytes Submission spool bytes on disk not yet drained to Mongo",
+            "# TYPE hillia_spool_bytes gauge",
+            f"hillia_spool_bytes {submission_spool.bytes}",
+            "# HELP hillia_spool_appended_total Submissions written to the spool",
+            "# TYPE hillia_spool_appended_total counter",
+            f"hillia_spool_appended_total {submission_spool.appended}",
+            "# HELP hillia_spool_drained_total Spooled submissions applied to Mongo",
+            "# TYPE hillia_spool_drained_total counter",
+            f"hillia_spool_drained_total {submission_spool.drained}",
+            "# HELP hillia_spool_commit_duration_seconds Group commit (write + fsync) latency",
+            "# TYPE hillia_spool_commit_duration_seconds histogram",
+        ]
+        lines += submission_spool.commit_latency.render("hillia_spool_commit_duration_seconds", 'spool="submissions"')
+    lines += [
+        "# HELP hillia_tasks_queued Post-submit tasks waiting (queued or backing off)",
+        "# TYPE hillia_tasks_queued gauge",
+        f"hillia_tasks_queued {task_queue.queued}",
+        "# HELP hillia_tasks_running Post-submit tasks running",
+        "# TYPE hillia_tasks_running gauge",
+        f"hillia_tasks_running {task_queue.running}",
+        "# HELP hillia_tasks_total Post-submit task outcomes",
+        "# TYPE hillia_tasks_total counter",
+        f'hillia_tasks_total{{outcome="completed"}} {task_queue.completed}',
+        f'hillia_tasks_total{{outcome="retried"}} {task_queue.retried}',
+        f'hillia_tasks_total{{outcome="failed"}} {task_queue.failed}',
+        f'hillia_tasks_total{{outcome="dropped"}} {task_queue.dropped}',
+        "# HELP hillia_task_queue_wait_seconds Time from submit to a task's first run",
+        "# TYPE hillia_task_queue_wait_seconds histogram",
+    ]
+    lines += task_queue.wait_latency.render("hillia_task_queue_wait_seconds", 'queue="post_submit"')
+    lines += [
+        "# HELP hillia_task_duration_seconds Task run time by task",
+        "# TYPE hillia_task_duration_seconds histogram",
+    ]
+    for name, histogram in list(task_queue.run_latency.items()):
+        lines += histogram.render("hillia_task_duration_seconds", f'task="{name}"')
+    lines += [
+        "# HELP hillia_admission_active Requests running per route class",
+        "# TYPE hillia_admission_active gauge",
+    ]
+    for cls in admission.classes:
+        lines.append(f'hillia_admission_active{{class="{cls.name}"}} {cls.active}')
+    lines += [
+        "# HELP hillia_admission_limit Concurrent request limit per route class",
+        "# TYPE hillia_admission_limit gauge",
+    ]
+    for cls in admission.classes:
+        lines.append(f'hillia_admission_limit{{class="{cls.name}"}} {cls.limit}')
+    lines += [
+        "# HELP hillia_admission_queued Requests waiting for a slot per route class",
+        "# TYPE hillia_admission_queued gauge",
+    ]
+    for cls in admission.classes:
+        lines.append(f'hillia_admission_queued{{class="{cls.name}"}} {len(cls.waiters)}')
+    lines += [
+        "# HELP hillia_admission_queue_limit Wait queue bound per route class",
+        "# TYPE hillia_admission_queue_limit gauge",
+    ]
+    for cls in admission.classes:
+        lines.append(f'hillia_admission_queue_limit{{class="{cls.name}"}} {cls.max_queue}')
+    lines += [
+        "# HELP hillia_admission_requests_total Admission outcomes per route class",
+        "# TYPE hillia_admission_requests_total counter",
+    ]
+    for cls in admission.classes:
+        lines.append(f'hillia_admission_requests_total{{class="{cls.name}",outcome="admitted"}} {cls.admitted}')
+        lines.append(f'hillia_admission_requests_total{{class="{cls.name}",outcome="rejected"}} {cls.rejected}')
+        lines.append(f'hillia_admission_requests_total{{class="{cls.name}",outcome="timed_out"}} {cls.timed_out}')
+    lines += [
+        "# HELP hillia_rate_limit_requests_total Rate-limited routes by outcome",
+        "# TYPE hillia_rate_limit_requests_total counter",
+    ]
+    for path, limiter in rate_limiters.items():
+        lines.append(f'hillia_rate_limit_requests_total{{route="{path}",outcome="allowed"}} {limiter.allowed}')
+        lines.append(f'hillia_rate_limit_requests_total{{route="{path}",outcome="limited"}} {limiter.limited}')
+    lines += [
+        "# HELP hillia_rate_limit_clients Clients currently tracked per route",
+        "# TYPE hillia_rate_limit_clients gauge",
+    ]
+    for path, limiter in rate_limiters.items():
+        lines.append(f'hillia_rate_limit_clients{{route="{path}"}} {len(limiter.slots)}')
+    lines += [
+        "# HELP hillia_rate_limit_evictions_total Tracked clients evicted to stay within RATE_LIMIT_MAX_CLIENTS",
+        "# TYPE hillia_rate_limit_evictions_total counter",
+    ]
+    for path, limiter in rate_limiters.items():
+        lines.append(f'hillia_rate_limit_evictions_total{{route="{path}"}} {limiter.evicted}')
+    lines += [
+        "# HELP hillia_feed_subscribers Admins connected to the live feed",
+        "# TYPE hillia_feed_subscribers gauge",
+        f"hillia_feed_subscribers {change_feed.subscribers}",
+        "# HELP hillia_feed_watching Change stream cursor open",
+        "# TYPE hillia_feed_watching gauge",
+        f"hillia_feed_watching {int(change_feed.watching)}",
+        "# HELP hillia_feed_events_total Change events published to the live feed",
+        "# TYPE hillia_feed_events_total counter",
+        f"hillia_feed_events_total {change_feed.published}",
+        "# HELP hillia_feed_restarts_total Change stream reconnects",
+        "# TYPE hillia_feed_restarts_total counter",
+        f"hillia_feed_restarts_total {change_feed.restarts}",
+        "# HELP hillia_feed_overflows_total Subscribers disconnected for falling behind",
+        "# TYPE hillia_feed_overflows_total counter",
+        f"hillia_feed_overflows_total {change_feed.overflows}",
+    ]
+    lines += [
+        "# HELP hillia_mongo_pool_connections_in_use Connections checked out of the pool",
+        "# TYPE hillia_mongo_pool_connections_in_use gauge",
+        f"hillia_mongo_pool_connections_in_use {pool_metrics.in_use()}",
+        "# HELP hillia_mongo_pool_connections_open Open pool connections",
+        "# TYPE hillia_mongo_pool_connections_open gauge",
+        f"hillia_mongo_pool_connections_open {pool_metrics.open()}",
+        "# HELP hillia_mongo_reachable Last background ping succeeded",
+        "# TYPE hillia_mongo_reachable gauge",
+        f"hillia_mongo_reachable {int(db_probe.reachable)}",
+    ]
+    return "\n".join(lines) + "\n"
+
+@app.get("/metrics")
+async def metrics(authorization: Optional[str] = Header(default=None)):
+    """Prometheus scrape endpoint"""
+    if not METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not secrets.compare_digest(authorization or "", f"Bearer {METRICS_TOKEN}"):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token")
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording latency / status per route template"""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        
+        status_code = 500
+        
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        http_metrics.in_flight += 1
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_metrics.in_flight -= 1
+            # Route templates, not raw paths, keep label cardinality bounded
+            route = scope.get("route")
+            http_metrics.observe(scope["method"], route.path if route else "unmatched", status_code, time.perf_counter() - start)
+
+# ============================================
+# RATE LIMITING (public form and analytics endpoints)
+# ============================================
+
+def parse_rate_limit(value: str) -> Optional[tuple]:
+    """'burst/seconds' -> (burst, seconds); 'off' disables the limit"""
+    if value == "off":
+        return None
+    burst, period = value.split("/")
+    return int(burst), float(period)
+
+# A burst of N requests per client, refilled evenly over the period
+RATE_LIMIT_FORMS = parse_rate_limit(os.environ.get('RATE_LIMIT_FORMS', '30/600'))
+RATE_LIMIT_ANALYTICS = parse_rate_limit(os.environ.get('RATE_LIMIT_ANALYTICS', '300/60'))
+RATE_LIMIT_MAX_CLIENTS = int(os.environ.get('RATE_LIMIT_MAX_CLIENTS', '10000'))  # tracked per route
+# Proxies in front of the app that append to X-Forwarded-For - 1 for Railway's edge proxy.
+# Set 0 when clients connect directly (the header is then client-controlled); the socket peer is used
+RATE_LIMIT_FORWARDED_HOPS = int(os.environ.get('RATE_LIMIT_FORWARDED_HOPS', '1'))
+RATE_LIMIT_EVICTION_SCAN = 8
+
+class TokenBucketLimiter:
+    """Token buckets for one route, keyed by client IP.
+    
+    Bucket state lives in two preallocated float arrays indexed by slot, and
+    a dict maps client -> slot, so memory is fixed at construction. Buckets
+    refill lazily when their client is next seen. Once every slot is taken,
+    a clock hand reclaims the first idle (fully refilled) slot within a short
+    scan, or the slot under the hand if none is idle.
+    """
+    __slots__ = ("burst", "rate", "slots", "keys", "tokens", "updated", "hand", "allowed", "limited", "evicted")
+    
+    def __init__(self, burst: int, period: float, capacity: int):
+        self.burst = float(burst)
+        self.rate = burst / period  # tokens per second
+        self.slots: Dict[str, int] = {}
+        self.keys: List[Optional[str]] = [None] * capacity
+        self.tokens = array("d", bytes(8 * capacity))
+        self.updated = array("d", bytes(8 * capacity))
+        self.hand = 0
+        self.allowed = 0
+        self.limited = 0
+        self.evicted = 0
+    
+    def _claim(self, key: str, now: float) -> int:
+        slot = len(self.slots)
+        if slot == len(self.keys):
+            capacity = len(self.keys)
+            slot = self.hand
+            for step in range(RATE_LIMIT_EVICTION_SCAN):
+                candidate = (self.hand + step) % capacity
+                if self.tokens[candidate] + (now - self.updated[candidate]) * self.rate >= self.burst:
+                    slot = candidate
+                    break
+            self.hand = (slot + 1) % capacity
+            del self.slots[self.keys[slot]]
+            self.evicted += 1
+        self.slots[key] = slot
+        self.keys[slot] = key
+        self.tokens[slot] = self.burst
+        self.updated[slot] = now
+        return slot
+    
+    def acquire(self, key: str, now: float) -> float:
+        """Take a token: 0.0 if allowed, else seconds until one is available"""
+        slot = self.slots.get(key)
+        if slot is None:
+            slot = self._claim(key, now)
+        tokens = min(self.burst, self.tokens[slot] + (now - self.updated[slot]) * self.rate)
+        self.updated[slot] = now
+        if tokens >= 1.0:
+            self.tokens[slot] = tokens - 1.0
+            self.allowed += 1
+            return 0.0
+        self.tokens[slot] = tokens
+        self.limited += 1
+        return (1.0 - tokens) / self.rate
+
+def build_rate_limiters() -> Dict[str, TokenBucketLimiter]:
+    """One limiter per rate-limited POST path"""
+    routes = {
+        "/api/questionnaire": RATE_LIMIT_FORMS,
+        "/api/contact": RATE_LIMIT_FORMS,
+        "/api/analytics/event": RATE_LIMIT_ANALYTICS,
+        "/api/analytics/events": RATE_LIMIT_ANALYTICS,
+    }
+    return {path: TokenBucketLimiter(*limit, RATE_LIMIT_MAX_CLIENTS) for path, limit in routes.items() if limit}
+
+rate_limiters = build_rate_limiters()
+
+RATE_LIMITED_BODY = json.dumps({"detail": "Too many requests. Try again later."}).encode()
+
+def client_address(scope) -> str:
+    if RATE_LIMIT_FORWARDED_HOPS:
+        for name, value in scope["headers"]:
+            if name == b"x-forwarded-for":
+                hops = value.split(b",")
+                if len(hops) >= RATE_LIMIT_FORWARDED_HOPS:
+                    return hops[-RATE_LIMIT_FORWARDED_HOPS].strip().decode("latin-1")
+                break
+    client = scope.get("client")
+    return client[0] if client else ""
+
+class RateLimitMiddleware:
+    """Pure ASGI middleware - rejects over-limit clients before body parsing or Mongo"""
+    
+    def __init__(self, app, limiters: Dict[str, TokenBucketLimiter]):
+        self.app = app
+        self.limiters = limiters
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST":
+            return await self.app(scope, receive, send)
+        limiter = self.limiters.get(scope["path"])
+        if limiter is None:
+            return await self.app(scope, receive, send)
+        
+        retry_after = limiter.acquire(client_address(scope), time.monotonic())
+        if not retry_after:
+            return await self.app(scope, receive, send)
+        
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(RATE_LIMITED_BODY)).encode()),
+                (b"retry-after", str(math.ceil(retry_after)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": RATE_LIMITED_BODY})
+
+# ============================================
+# ADMISSION CONTROL (concurrency limits for Mongo-bound routes)
+# ============================================
+
+def parse_admission(value: str) -> tuple:
+    """'limit/queue' -> (concurrent requests, waiting requests)"""
+    limit, queue = value.split("/")
+    return int(limit), int(queue)
+
+# Shared ceiling across classes - by default one request per pooled connection
+ADMISSION_CAPACITY = int(os.environ.get('ADMISSION_CAPACITY', str(MONGO_MAX_POOL_SIZE)))
+ADMISSION_QUEUE_TIMEOUT = float(os.environ.get('ADMISSION_QUEUE_TIMEOUT', '2.0'))  # seconds
+ADMISSION_RETRY_AFTER = "1"
+# Route classes in priority order - freed slots go to the first class with a waiter
+ADMISSION_CLASSES = [
+    ("admin", *parse_admission(os.environ.get('ADMISSION_ADMIN', '20/50'))),
+    ("public_writes", *parse_admission(os.environ.get('ADMISSION_PUBLIC', '60/200'))),
+    ("analytics", *parse_admission(os.environ.get('ADMISSION_ANALYTICS', '30/100'))),
+]
+
+class AdmissionClass:
+    """Limit, wait queue and counters for one route class"""
+    __slots__ = ("name", "limit", "max_queue", "active", "waiters", "admitted", "rejected", "timed_out")
+    
+    def __init__(self, name: str, limit: int, max_queue: int):
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self.active = 0
+        self.waiters: deque = deque()
+        self.admitted = 0
+        self.rejected = 0  # queue full
+        self.timed_out = 0  # waited ADMISSION_QUEUE_TIMEOUT without a slot
+
+class AdmissionController:
+    """Bounds concurrent requests per route class under one shared capacity.
+    
+    A request runs at once if its class and the shared capacity have room and
+    nobody in its class is already waiting; otherwise it waits in its class's
+    bounded FIFO queue. A full queue, or a wait longer than the timeout, is
+    answered with a fast 503 instead of piling up in the driver's pool. When
+    a slot frees up it goes to the highest-priority class that can use it.
+    """
+    
+    def __init__(self, capacity: int, classes: List[tuple], timeout: float):
+        self.capacity = capacity
+        self.timeout = timeout
+        self.active = 0
+        self.classes = [AdmissionClass(*spec) for spec in classes]  # priority order
+        self.by_name = {c.name: c for c in self.classes}
+    
+    def classify(self, method: str, path: str) -> Optional[AdmissionClass]:
+        if path.startswith("/api/admin/"):
+            # The live feed is long-lived and doesn't query per request
+            return None if path == "/api/admin/stream" else self.by_name["admin"]
+        if method == "POST" and path in ("/api/questionnaire", "/api/contact"):
+            return self.by_name["public_writes"]
+        if method == "POST" and path.startswith("/api/analytics/"):
+            return self.by_name["analytics"]
+        return None
+    
+    def _has_room(self, cls: AdmissionClass) -> bool:
+        return cls.active < cls.limit and self.active < self.capacity
+    
+    def _admit(self, cls: AdmissionClass):
+        cls.active += 1
+        self.active += 1
+        cls.admitted += 1
+    
+    def _expire(self, cls: AdmissionClass, future: asyncio.Future):
+        if not future.done():
+            cls.waiters.remove(future)
+            cls.timed_out += 1
+            future.set_result(False)
+    
+    async def acquire(self, cls: AdmissionClass) -> bool:
+        """True once admitted; False when the request should be shed"""
+        if self._has_room(cls) and not cls.waiters:
+            self._admit(cls)
+            return True
+        if len(cls.waiters) >= cls.max_queue:
+            cls.rejected += 1
+            return False
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        cls.waiters.append(future)
+        expiry = loop.call_later(self.timeout, self._expire, cls, future)
+        try:
+            return await future
+        except asyncio.CancelledError:
+            # Client went away while waiting - give back a slot granted in the meantime
+            if future.cancelled():
+                if future in cls.waiters:
+                    cls.waiters.remove(future)
+            elif future.result():
+                self.release(cls)
+            raise
+        finally:
+            expiry.cancel()
+    
+    def release(self, cls: AdmissionClass):
+        cls.active -= 1
+        self.active -= 1
+        for waiting in self.classes:
+            while waiting.waiters and self._has_room(waiting):
+                future = waiting.waiters.popleft()
+                if future.done():
+                    continue  # Cancelled; its task hasn't run its cleanup yet
+                self._admit(waiting)
+                future.set_result(True)
+            if self.active >= self.capacity:
+                return
+    
+    def snapshot(self) -> Dict[str, dict]:
+        return {
+            c.name: {"active": c.active, "limit": c.limit, "queued": len(c.waiters), "max_queue": c.max_queue}
+            for c in self.classes
+        }
+
+admission = AdmissionController(ADMISSION_CAPACITY, ADMISSION_CLASSES, ADMISSION_QUEUE_TIMEOUT)
+
+ADMISSION_REJECTED_BODY = json.dumps({"detail": "Server busy. Try again shortly."}).encode()
+
+# Streams GZipMiddleware would buffer until they end (SSE events must go out as they happen)
+UNCOMPRESSED_PATHS = {"/api/admin/stream"}
+
+class StreamSafeGZipMiddleware:
+    """GZipMiddleware for every path except skip_paths"""
+    
+    def __init__(self, app, minimum_size: int, skip_paths: set):
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+        self.skip_paths = skip_paths
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in self.skip_paths:
+            return await self.app(scope, receive, send)
+        await self.gzip(scope, receive, send)
+
+class AdmissionMiddleware:
+    """Pure ASGI middleware holding an admission slot for the whole request (streamed bodies included)"""
+    
+    def __init__(self, app, controller: AdmissionController):
+        self.app = app
+        self.controller = controller
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        cls = self.controller.classify(scope["method"], scope["path"])
+        if cls is None:
+            return await self.app(scope, receive, send)
+        
+        if not await self.controller.acquire(cls):
+            await send({
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(ADMISSION_REJECTED_BODY)).encode()),
+                    (b"retry-after", ADMISSION_RETRY_AFTER.encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": ADMISSION_REJECTED_BODY})
+            return
+        
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(cls)
+
+# Large list/export bodies; inside the metrics middleware so timings include compression
+app.add_middleware(StreamSafeGZipMiddleware, minimum_size=1024, skip_paths=UNCOMPRESSED_PATHS)
+# Inside the metrics middleware, so route latency includes time spent queued
+app.add_middleware(AdmissionMiddleware, controller=admission)
+app.add_middleware(MetricsMiddleware)
+# Outside the metrics middleware (rejections are counted by the limiter), inside CORS so 429s stay readable
+app.add_middleware(RateLimitMiddleware, limiters=rate_limiters)
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
     allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Configure logging
@@ -534,6 +3562,36 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def start_background_tasks():
+    http_metrics.preallocate(app.routes)
+    await warm_connection_pool()
+    db_probe.start()
+    if not os.environ.get('ADMIN_TOKEN_SECRET'):
+        logger.warning("ADMIN_TOKEN_SECRET not set - admin tokens won't survive restarts or work across workers")
+    if not ERASURE_RECEIPT_SECRET:
+        logger.warning("ERASURE_RECEIPT_SECRET not set - erasure by email is refused")
+    if not METRICS_TOKEN:
+        logger.warning("METRICS_TOKEN not set - /metrics is disabled")
+    # Index builds and migrations can take a while on large collections - don't block startup
+    spawn(run_startup_maintenance())
+    analytics_buffer.start()
+    # Before serving - the rollup backfill must stop where incremental counting began
+    try:
+        await asyncio.wait_for(persist_rollup_cutoff(), WARMUP_TIMEOUT)
+    except (PyMongoError, asyncio.TimeoutError):
+        logger.warning("Rollup backfill cutoff not persisted, the backfill will record it")
+    task_queue.start()
+    if submission_spool is not None:
+        await submission_spool.start()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    db_probe.stop()
+    change_feed.close()
+    await analytics_buffer.stop()
+    if submission_spool is not None:
+        await submission_spool.stop(timeout=WARMUP_TIMEOUT)
+    # After the spool - its final drain queues post-submit tasks
+    await task_queue.stop(timeout=TASK_DRAIN_TIMEOUT)
     client.close()
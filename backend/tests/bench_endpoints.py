@@ -0,0 +1,220 @@
+"""
+HILLIA Endpoint Load Benchmark
+Drives the FastAPI app in-process (no network, no uvicorn) at fixed
+concurrency levels and reports throughput and p50/p95/p99 latency per
+endpoint to a JSON file, tagged with the git commit so runs can be
+compared across commits.
+
+Database: a local mongod when BENCH_MONGO_URL is set (uses a throwaway
+database that is dropped afterwards), otherwise an in-memory stand-in
+(mongomock-motor). Only compare results taken against the same backend.
+
+Run:
+    python tests/bench_endpoints.py --output bench.json
+    python tests/bench_endpoints.py --output new.json --compare bench.json
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+BENCH_USERNAME = "bench_admin"
+BENCH_PASSWORD = "bench_password"
+
+BENCH_MONGO_URL = os.environ.get('BENCH_MONGO_URL')
+os.environ['MONGO_URL'] = BENCH_MONGO_URL or 'mongodb://localhost:27017'
+os.environ['DB_NAME'] = os.environ.get('BENCH_DB_NAME', 'hillia_bench')
+os.environ['ADMIN_USERNAME'] = BENCH_USERNAME
+os.environ['ADMIN_PASSWORD_HASH'] = hashlib.sha256(BENCH_PASSWORD.encode()).hexdigest()
+# Every request comes from one client address; per-client rate limits would 429 it
+os.environ['RATE_LIMIT_FORMS'] = 'off'
+os.environ['RATE_LIMIT_ANALYTICS'] = 'off'
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx  # noqa: E402
+
+import server  # noqa: E402
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+DEFAULT_CONCURRENCY = [1, 10, 50]
+DEFAULT_REQUESTS = 300
+SEED_DOCUMENTS = 500
+
+
+def questionnaire_payload(i):
+    return {
+        "session_id": f"bench-{i}",
+        "consent": True,
+        "sections": {f"section_{s}": {f"q{q}": "Option B" for q in range(6)} for s in range(8)},
+        "free_text": {"q1": "Slower mornings, a school we can walk to, and neighbours who stay."},
+        "wants_contact": False,
+    }
+
+
+def contact_payload(i):
+    return {"name": f"Bench {i}", "reason": "Load benchmark", "city": "Dehradun", "consent": True}
+
+
+# name -> (method, path, payload factory, needs admin auth)
+SCENARIOS = {
+    "public_questionnaire": ("POST", "/api/questionnaire", questionnaire_payload, False),
+    "public_contact": ("POST", "/api/contact", contact_payload, False),
+    "public_analytics_event": ("POST", "/api/analytics/event?event_type=homepage_entry&session_id=bench", lambda i: {}, False),
+    "admin_questionnaire_list": ("GET", "/api/admin/questionnaire", None, True),
+    "admin_questionnaire_filtered": ("GET", "/api/admin/questionnaire?status=unreviewed&limit=20", None, True),
+    "admin_contact_list": ("GET", "/api/admin/contact", None, True),
+    "admin_stats": ("GET", "/api/admin/stats", None, True),
+}
+
+
+def use_database():
+    """Point the app at the benchmark database; returns a label for the report"""
+    if BENCH_MONGO_URL:
+        return "mongod"
+    from mongomock_motor import AsyncMongoMockClient
+    server.client = AsyncMongoMockClient(tz_aware=True)
+    server.db = server.client[os.environ['DB_NAME']]
+    return "mongomock"
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+async def run_scenario(client, scenario, concurrency, total, headers):
+    method, path, payload, needs_auth = scenario
+    latencies = []
+    errors = 0
+    issued = 0
+
+    async def worker():
+        nonlocal errors, issued
+        while issued < total:
+            i = issued
+            issued += 1
+            kwargs = {"headers": headers if needs_auth else None}
+            if payload is not None:
+                kwargs["json"] = payload(i)
+            start = time.perf_counter()
+            response = await client.request(method, path, **kwargs)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": total,
+        "errors": errors,
+        "throughput_rps": round(total / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+async def run(concurrency_levels, total, selected):
+    results = {}
+    await server.app.router.startup()
+    try:
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for i in range(SEED_DOCUMENTS):
+                for path, payload in (("/api/questionnaire", questionnaire_payload(i)), ("/api/contact", contact_payload(i))):
+                    response = await client.post(path, json=payload)
+                    assert response.status_code == 200, f"seeding {path} failed: {response.status_code} {response.text}"
+
+            login = await client.post("/api/admin/auth/login", auth=(BENCH_USERNAME, BENCH_PASSWORD))
+            login.raise_for_status()
+            headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+            for name in selected:
+                results[name] = {}
+                for concurrency in concurrency_levels:
+                    stats = await run_scenario(client, SCENARIOS[name], concurrency, total, headers)
+                    results[name][str(concurrency)] = stats
+                    print(f"{name:<30} c={concurrency:<4} {stats['throughput_rps']:>9.1f} rps  "
+                          f"p50 {stats['p50_ms']:>8.2f}ms  p95 {stats['p95_ms']:>8.2f}ms  p99 {stats['p99_ms']:>8.2f}ms"
+                          f"{'  errors ' + str(stats['errors']) if stats['errors'] else ''}")
+                    if stats['errors']:
+                        # Latencies of error responses say nothing about the endpoint - don't report them
+                        raise SystemExit(f"{name} at c={concurrency}: {stats['errors']}/{total} requests failed, aborting")
+    finally:
+        if BENCH_MONGO_URL:
+            await server.client.drop_database(os.environ['DB_NAME'])
+        await server.app.router.shutdown()
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True, cwd=REPO_ROOT).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(current, baseline_path):
+    """Print p95 and throughput deltas against an earlier report"""
+    baseline = json.loads(Path(baseline_path).read_text())
+    if baseline["backend"] != current["backend"]:
+        print(f"WARNING: baseline ran against {baseline['backend']}, this run against {current['backend']}")
+    print(f"\nvs {baseline['commit']}:")
+    for name, levels in current["results"].items():
+        for concurrency, stats in levels.items():
+            before = baseline["results"].get(name, {}).get(concurrency)
+            if not before:
+                continue
+            p95 = (stats["p95_ms"] - before["p95_ms"]) / before["p95_ms"] * 100 if before["p95_ms"] else 0.0
+            rps = (stats["throughput_rps"] - before["throughput_rps"]) / before["throughput_rps"] * 100
+            print(f"{name:<30} c={concurrency:<4} p95 {p95:+6.1f}%  throughput {rps:+6.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--concurrency", default=",".join(map(str, DEFAULT_CONCURRENCY)),
+                        help="comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS, help="requests per scenario per level")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="comma-separated scenario names")
+    parser.add_argument("--compare", help="earlier report to diff against")
+    args = parser.parse_args()
+
+    backend = use_database()
+    concurrency_levels = [int(c) for c in args.concurrency.split(",")]
+    selected = [s for s in args.scenarios.split(",") if s]
+
+    results = asyncio.run(run(concurrency_levels, args.requests, selected))
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "backend": backend,
+        "python": platform.python_version(),
+        "requests_per_level": args.requests,
+        "seed_documents": SEED_DOCUMENTS,
+        "results": results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2))
+    print(f"\nWrote {args.output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
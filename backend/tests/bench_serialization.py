@@ -0,0 +1,97 @@
+"""
+HILLIA Admin List Serialization Benchmark
+Per-document cost of the admin list response path: FastAPI response_model
+handling vs the precompiled TypeAdapter fast path. Also checks that both
+produce byte-identical JSON.
+
+Run: python tests/bench_serialization.py
+"""
+
+import asyncio
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'hillia_bench')
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+
+import server  # noqa: E402
+
+ROW_COUNTS = [50, 500, 5000]
+REPEATS = 5
+
+
+def make_questionnaire_doc(i):
+    """A realistic stored questionnaire document"""
+    return {
+        "response_id": str(uuid.uuid4()),
+        "timestamp": datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=i),
+        "session_id": f"{i:016x}",
+        "consent": True,
+        "sections": {
+            f"section_{s}": {f"q{q}": ["Option A", "Option C"] if q % 2 else "Option B" for q in range(6)}
+            for s in range(8)
+        },
+        "free_text": {f"q{q}": "We want the children to grow up near the hills, unhurried. " * 4 for q in range(3)},
+        "contact_info": None,
+        "wants_contact": i % 3 == 0,
+        "internal_score": {"community_fit": "Medium", "lifestyle_alignment": None, "decision_maturity": "High"},
+        "internal_notes": "Follow up after monsoon" if i % 5 == 0 else "",
+        "status": "unreviewed",
+        "watched": i % 7 == 0,
+    }
+
+
+def route_field(path):
+    """The response_model field FastAPI built for a route"""
+    for route in server.app.routes:
+        if getattr(route, "path", None) == path:
+            return route.response_field
+    raise LookupError(path)
+
+
+async def response_model_path(field, docs):
+    content = await serialize_response(field=field, response_content=docs, is_coroutine=True)
+    return JSONResponse(content).body
+
+
+def fast_path(docs):
+    return server.list_json_response(server.QUESTIONNAIRE_LIST_ADAPTER, docs, None).body
+
+
+def best_of(fn):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    loop = asyncio.new_event_loop()
+    field = route_field("/api/admin/questionnaire")
+    
+    print(f"{'rows':>6} {'response_model us/doc':>22} {'fast path us/doc':>17} {'speedup':>8}")
+    for rows in ROW_COUNTS:
+        docs = [make_questionnaire_doc(i) for i in range(rows)]
+        
+        slow_body = loop.run_until_complete(response_model_path(field, docs))
+        assert fast_path(docs) == slow_body, "fast path output differs from response_model output"
+        
+        slow = best_of(lambda: loop.run_until_complete(response_model_path(field, docs)))
+        fast = best_of(lambda: fast_path(docs))
+        print(f"{rows:>6} {slow / rows * 1e6:>22.1f} {fast / rows * 1e6:>17.1f} {slow / fast:>7.1f}x")
+    
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
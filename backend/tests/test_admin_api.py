@@ -7,7 +7,8 @@ import pytest
 import requests
 import os
 import base64
-import hashlib
+import json
+import time
 from datetime import datetime
 
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
@@ -24,6 +25,14 @@ def get_auth_header(username, password):
     return {"Authorization": f"Basic {encoded}"}
 
 
+def get_metrics_header():
+    """Bearer header for /metrics, which is disabled on servers without METRICS_TOKEN"""
+    token = os.environ.get('METRICS_TOKEN')
+    if not token:
+        pytest.skip("METRICS_TOKEN not set")
+    return {"Authorization": f"Bearer {token}"}
+
+
 class TestHealthCheck:
     """Basic API health check tests"""
     
@@ -35,6 +44,31 @@ class TestHealthCheck:
         assert "message" in data
         assert "HILLIA" in data["message"]
         print(f"SUCCESS: API root returns: {data}")
+    
+    def test_readiness_reports_database(self):
+        """Test that /ready reports DB reachability and pool usage"""
+        response = requests.get(f"{BASE_URL}/ready")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "ready"
+        assert data["database"]["reachable"] is True
+        assert "saturation" in data["pool"]
+        assert set(data["admission"]["classes"]) == {"admin", "public_writes", "analytics"}
+        print(f"SUCCESS: Readiness - {data}")
+    
+    def test_metrics_endpoint_prometheus_format(self):
+        """Test that /metrics exposes per-route latency histograms"""
+        requests.get(f"{BASE_URL}/api/")
+        
+        headers = get_metrics_header()
+        response = requests.get(f"{BASE_URL}/metrics", headers=headers)
+        
+        assert response.status_code == 200
+        assert response.headers["Content-Type"].startswith("text/plain")
+        assert 'hillia_http_request_duration_seconds_bucket{method="GET",route="/api/"' in response.text
+        assert "hillia_http_requests_in_flight" in response.text
+        print("SUCCESS: Metrics endpoint returns Prometheus text")
 
 
 class TestAdminAuthentication:
@@ -74,6 +108,42 @@ class TestAdminAuthentication:
         print("SUCCESS: Admin stats endpoint requires authentication")
 
 
+class TestAdminTokenAuth:
+    """Admin session token tests"""
+    
+    def test_login_issues_token_usable_on_admin_endpoints(self):
+        """Test that a login token authenticates admin requests"""
+        headers = get_auth_header(ADMIN_USERNAME, ADMIN_PASSWORD)
+        response = requests.post(f"{BASE_URL}/api/admin/auth/login", headers=headers)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["token_type"] == "bearer"
+        assert data["expires_in"] > 0
+        
+        token_headers = {"Authorization": f"Bearer {data['access_token']}"}
+        stats_response = requests.get(f"{BASE_URL}/api/admin/stats", headers=token_headers)
+        
+        assert stats_response.status_code == 200
+        print("SUCCESS: Token accepted on admin endpoint")
+    
+    def test_login_with_invalid_credentials(self):
+        """Test that login rejects wrong credentials"""
+        headers = get_auth_header(ADMIN_USERNAME, WRONG_PASSWORD)
+        response = requests.post(f"{BASE_URL}/api/admin/auth/login", headers=headers)
+        
+        assert response.status_code == 401
+        print("SUCCESS: Login with invalid credentials rejected")
+    
+    def test_invalid_token_rejected(self):
+        """Test that a forged token is rejected"""
+        headers = {"Authorization": "Bearer not.a.token"}
+        response = requests.get(f"{BASE_URL}/api/admin/stats", headers=headers)
+        
+        assert response.status_code == 401
+        print("SUCCESS: Invalid token rejected with 401")
+
+
 class TestAdminStats:
     """Admin statistics endpoint tests"""
     
@@ -109,6 +179,23 @@ class TestAdminStats:
         print(f"SUCCESS: Admin stats returned - Questionnaire total: {data['questionnaire']['total']}, Contact total: {data['contact']['total']}")
 
 
+class TestIndexHealth:
+    """Index bootstrap / index health report tests"""
+    
+    def test_index_health_report(self):
+        """Test that hot admin queries are served by indexes"""
+        headers = get_auth_header(ADMIN_USERNAME, ADMIN_PASSWORD)
+        response = requests.get(f"{BASE_URL}/api/admin/indexes", headers=headers)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert "questionnaire_responses" in data["indexes"]
+        assert "contact_submissions" in data["indexes"]
+        assert len(data["queries"]) > 0
+        assert data["collscan"] == [], f"Hot queries falling back to COLLSCAN: {data['collscan']}"
+        print(f"SUCCESS: Index health - {len(data['queries'])} hot queries checked")
+
+
 class TestQuestionnaireSubmission:
     """Public questionnaire submission tests"""
     
@@ -151,6 +238,23 @@ class TestQuestionnaireSubmission:
         
         assert response.status_code == 400
         print("SUCCESS: Questionnaire without consent correctly rejected")
+    
+    def test_submitted_response_reaches_database(self):
+        """Test that an acknowledged submission becomes readable (spooled or direct)"""
+        payload = {"session_id": f"test_session_{datetime.now().timestamp()}", "consent": True, "sections": {}}
+        response_id = requests.post(f"{BASE_URL}/api/questionnaire", json=payload).json()["response_id"]
+        headers = get_auth_header(ADMIN_USERNAME, ADMIN_PASSWORD)
+        
+        # With SUBMISSION_SPOOL=on the write lands a drain interval later
+        for _ in range(20):
+            response = requests.get(f"{BASE_URL}/api/admin/questionnaire/{response_id}", headers=headers)
+            if response.status_code == 200:
+                break
+            time.sleep(0.25)
+        
+        assert response.status_code == 200
+        assert "search_text" not in response.json()
+        print(f"SUCCESS: Submission {response_id} stored")
 
 
 class TestAdminQuestionnaireManagement:
@@ -192,6 +296,59 @@ class TestAdminQuestionnaireManagement:
         
         print(f"SUCCESS: Retrieved {len(data)} unreviewed questionnaire responses")
     
+    def test_get_questionnaire_list_cursor_pagination(self):
+        """Test that following X-Next-Cursor walks the same order as skip"""
+        first_page = requests.get(f"{BASE_URL}/api/admin/questionnaire?limit=1", headers=self.headers)
+        assert first_page.status_code == 200
+        
+        next_cursor = first_page.headers.get("X-Next-Cursor")
+        if not next_cursor:
+            pytest.skip("Not enough questionnaire responses for pagination")
+        
+        cursor_page = requests.get(f"{BASE_URL}/api/admin/questionnaire?limit=1&cursor={next_cursor}", headers=self.headers)
+        skip_page = requests.get(f"{BASE_URL}/api/admin/questionnaire?limit=1&skip=1", headers=self.headers)
+        
+        assert cursor_page.status_code == 200
+        assert cursor_page.json() == skip_page.json()
+        print("SUCCESS: Cursor page matches skip page")
+    
+    def test_get_questionnaire_list_invalid_cursor(self):
+        """Test that a malformed cursor is rejected"""
+        response = requests.get(f"{BASE_URL}/api/admin/questionnaire?cursor=not-a-cursor", headers=self.headers)
+        
+        assert response.status_code == 400
+        print("SUCCESS: Invalid cursor correctly rejected")
+    
+    def test_get_questionnaire_list_summary_view(self):
+        """Test that the summary view omits the questionnaire payload"""
+        response = requests.get(f"{BASE_URL}/api/admin/questionnaire?view=summary", headers=self.headers)
+        
+        assert response.status_code == 200
+        data = response.json()
+        if len(data) > 0:
+            assert "status" in data[0]
+            assert "sections" not in data[0]
+            assert "free_text" not in data[0]
+        print(f"SUCCESS: Summary view returned {len(data)} responses")
+    
+    def test_get_questionnaire_list_field_projection(self):
+        """Test that fields= returns only the requested fields plus id and timestamp"""
+        response = requests.get(f"{BASE_URL}/api/admin/questionnaire?fields=status", headers=self.headers)
+        
+        assert response.status_code == 200
+        data = response.json()
+        if len(data) > 0:
+            assert {"response_id", "timestamp", "status"} <= set(data[0])
+            assert "sections" not in data[0]
+        print("SUCCESS: Field projection applied")
+    
+    def test_get_questionnaire_list_unknown_field(self):
+        """Test that unknown projection fields are rejected"""
+        response = requests.get(f"{BASE_URL}/api/admin/questionnaire?fields=status,password", headers=self.headers)
+        
+        assert response.status_code == 400
+        print("SUCCESS: Unknown projection field rejected")
+    
     def test_get_single_questionnaire_response(self):
         """Test getting a single questionnaire response by ID"""
         # First get the list to find an ID
@@ -285,6 +442,187 @@ class TestAdminQuestionnaireManagement:
         print(f"SUCCESS: Added internal notes to questionnaire: {test_note}")
 
 
+class TestAdminConditionalRequests:
+    """ETag / Last-Modified revalidation and compression tests"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup auth headers"""
+        self.headers = get_auth_header(ADMIN_USERNAME, ADMIN_PASSWORD)
+    
+    def create_response(self):
+        payload = {"session_id": f"test_etag_{datetime.now().timestamp()}", "consent": True, "sections": {}}
+        return requests.post(f"{BASE_URL}/api/questionnaire", json=payload).json()["response_id"]
+    
+    def test_detail_etag_revalidation(self):
+        """Test 304 on a matching ETag and a new ETag after PATCH"""
+        response_id = self.create_response()
+        url = f"{BASE_URL}/api/admin/questionnaire/{response_id}"
+        
+        first = requests.get(url, headers=self.headers)
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+        assert first.headers["Cache-Control"] == "private, no-cache"
+        assert "Last-Modified" in first.headers
+        
+        cached = requests.get(url, headers={**self.headers, "If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        
+        requests.patch(f"{url}?status=reviewed", headers=self.headers)
+        changed = requests.get(url, headers={**self.headers, "If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+        assert changed.json()["version"] == 2
+        print(f"SUCCESS: Detail revalidation - {etag} -> {changed.headers['ETag']}")
+    
+    def test_list_etag_revalidation(self):
+        """Test 304 on an unchanged list page"""
+        url = f"{BASE_URL}/api/admin/questionnaire?view=summary"
+        
+        first = requests.get(url, headers=self.headers)
+        assert first.status_code == 200
+        
+        cached = requests.get(url, headers={**self.headers, "If-None-Match": first.headers["ETag"]})
+        assert cached.status_code == 304
+        print("SUCCESS: List revalidation returns 304")
+    
+    def test_large_list_is_compressed(self):
+        """Test gzip on list bodies over the size threshold"""
+        for _ in range(5):
+            self.create_response()
+        
+        response = requests.get(
+            f"{BASE_URL}/api/admin/questionnaire", headers={**self.headers, "Accept-Encoding": "gzip"}
+        )
+        
+        assert response.status_code == 200
+        assert response.headers.get("Content-Encoding") == "gzip"
+        print("SUCCESS: Large list gzip-compressed")
+
+
+class TestAdminBulkOperations:
+    """Admin bulk update/delete tests"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup auth headers"""
+        self.headers = get_auth_header(ADMIN_USERNAME, ADMIN_PASSWORD)
+    
+    def create_response(self):
+        payload = {"session_id": f"test_bulk_{datetime.now().timestamp()}", "consent": True, "sections": {}}
+        return requests.post(f"{BASE_URL}/api/questionnaire", json=payload).json()["response_id"]
+    
+    def test_bulk_update_and_delete(self):
+        """Test per-item results for updates, deletes and unknown ids"""
+        first, second = self.create_response(), self.create_response()
+        operations = [
+            {"id": first, "status": "archived", "watched": True},
+            {"id": second, "delete": True},
+            {"id": "nonexistent-id-12345", "status": "reviewed"},
+        ]
+        
+        response = requests.post(f"{BASE_URL}/api/admin/questionnaire/bulk", json=operations, headers=self.headers)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["result"] for r in data["results"]] == ["updated", "deleted", "not_found"]
+        assert data["summary"] == {"updated": 1, "deleted": 1, "not_found": 1}
+        
+        updated = requests.get(f"{BASE_URL}/api/admin/questionnaire/{first}", headers=self.headers).json()
+        assert updated["status"] == "archived"
+        assert updated["watched"] is True
+        deleted = requests.get(f"{BASE_URL}/api/admin/questionnaire/{second}", headers=self.headers)
+        assert deleted.status_code == 404
+        print(f"SUCCESS: Bulk operations - {data['summary']}")
+    
+    def test_bulk_item_without_changes_is_invalid(self):
+        """Test that an item with nothing to change is reported, not applied"""
+        response = requests.post(f"{BASE_URL}/api/admin/contact/bulk", json=[{"id": "any"}], headers=self.headers)
+        
+        assert response.status_code == 200
+        assert response.json()["results"][0]["result"] == "invalid"
+        print("SUCCESS: Empty bulk item reported invalid")
+    
+    def test_bulk_rejects_other_collection_status(self):
+        """Test that contact statuses are validated per collection"""
+        response = requests.post(
+            f"{BASE_URL}/api/admin/contact/bulk", json=[{"id": "any", "status": "unreviewed"}], headers=self.headers
+        )
+        
+        assert response.status_code == 422
+        print("SUCCESS: Invalid bulk status rejected")
+    
+    def test_bulk_too_large(self):
+        """Test that oversized bulk requests are rejected"""
+        operations = [{"id": f"id-{i}", "watched": True} for i in range(501)]
+        response = requests.post(f"{BASE_URL}/api/admin/questionnaire/bulk", json=operations, headers=self.headers)
+        
+        assert response.status_code == 413
+        print("SUCCESS: Oversized bulk request rejected")
+    
+    def test_bulk_requires_auth(self):
+        """Test that bulk operations are admin-only"""
+        response = requests.post(f"{BASE_URL}/api/admin/questionnaire/bulk", json=[{"id": "any", "delete": True}])
+        
+        assert response.status_code == 401
+        print("SUCCESS: Bulk operations require auth")
+
+
+class TestAdminErasure:
+    """Admin GDPR erasure tests"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup auth headers"""
+        self.headers = get_auth_header(ADMIN_USERNAME, ADMIN_PASSWORD)
+    
+    def test_erase_by_session_and_email(self):
+        """Test one request erases responses, contacts and analytics with a receipt"""
+        stamp = datetime.now().timestamp()
+        session_id = f"test_erasure_{stamp}"
+        email = f"erasure_{stamp}@example.com"
+        
+        questionnaire = {
+            "session_id": session_id, "consent": True, "sections": {},
+            "contact_info": {"email": email}, "wants_contact": True
+        }
+        response_id = requests.post(f"{BASE_URL}/api/questionnaire", json=questionnaire).json()["response_id"]
+        requests.post(f"{BASE_URL}/api/contact", json={"name": "Erasure Test", "reason": "Testing", "email": email.upper()})
+        events = [{"event_type": "homepage_entry", "session_id": session_id} for _ in range(3)]
+        requests.post(f"{BASE_URL}/api/analytics/events", json=events)
+        
+        response = requests.post(
+            f"{BASE_URL}/api/admin/erasure", json={"session_id": session_id, "email": email}, headers=self.headers
+        )
+        
+        assert response.status_code == 200
+        receipt = response.json()
+        assert receipt["receipt_id"]
+        assert receipt["deleted"]["questionnaire_responses"] == 1
+        assert receipt["deleted"]["contact_submissions"] == 1
+        assert receipt["deleted"]["analytics_events"] == 3
+        assert email not in json.dumps(receipt)
+        
+        gone = requests.get(f"{BASE_URL}/api/admin/questionnaire/{response_id}", headers=self.headers)
+        assert gone.status_code == 404
+        print(f"SUCCESS: Erasure receipt {receipt['receipt_id']} - {receipt['deleted']}")
+    
+    def test_erasure_requires_identifier(self):
+        """Test that an empty erasure request is rejected"""
+        response = requests.post(f"{BASE_URL}/api/admin/erasure", json={}, headers=self.headers)
+        
+        assert response.status_code == 400
+        print("SUCCESS: Erasure without identifiers rejected")
+    
+    def test_erasure_requires_auth(self):
+        """Test that erasure is admin-only"""
+        response = requests.post(f"{BASE_URL}/api/admin/erasure", json={"session_id": "any"})
+        
+        assert response.status_code == 401
+        print("SUCCESS: Erasure requires auth")
+
+
 class TestContactSubmission:
     """Public contact submission tests"""
     
@@ -456,6 +794,303 @@ class TestAdminContactManagement:
         print(f"SUCCESS: Added internal notes to contact: {test_note}")
 
 
+class TestAdminExport:
+    """Streaming export tests"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup auth headers"""
+        self.headers = get_auth_header(ADMIN_USERNAME, ADMIN_PASSWORD)
+    
+    def test_export_questionnaire_ndjson(self):
+        """Test NDJSON export returns one JSON document per line"""
+        response = requests.get(f"{BASE_URL}/api/admin/export/questionnaire", headers=self.headers)
+        
+        assert response.status_code == 200
+        assert response.headers["Content-Type"].startswith("application/x-ndjson")
+        lines = [line for line in response.text.splitlines() if line]
+        for line in lines:
+            assert "response_id" in json.loads(line)
+        print(f"SUCCESS: Exported {len(lines)} questionnaire responses")
+    
+    def test_export_contact_csv(self):
+        """Test CSV export starts with a header row"""
+        response = requests.get(f"{BASE_URL}/api/admin/export/contact?format=csv&status=new", headers=self.headers)
+        
+        assert response.status_code == 200
+        assert response.headers["Content-Type"].startswith("text/csv")
+        assert response.text.splitlines()[0].startswith("submission_id,timestamp")
+        print("SUCCESS: Contact CSV export returned")
+    
+    def test_export_csv_neutralises_formulas(self):
+        """Test that cells a spreadsheet would evaluate are prefixed with a quote"""
+        name = f"=HYPERLINK(\"http://example.com\",\"{datetime.now().timestamp()}\")"
+        requests.post(f"{BASE_URL}/api/contact", json={"name": name, "reason": "@SUM(A1)", "consent": True})
+        
+        response = requests.get(f"{BASE_URL}/api/admin/export/contact?format=csv&status=new", headers=self.headers)
+        
+        assert response.status_code == 200
+        assert f"'{name}".replace('"', '""') in response.text
+        assert "'@SUM(A1)" in response.text
+        print("SUCCESS: CSV export neutralises formula cells")
+    
+    def test_export_rejects_status_from_other_collection(self):
+        """Test that status values are checked per collection"""
+        response = requests.get(f"{BASE_URL}/api/admin/export/contact?status=unreviewed", headers=self.headers)
+        
+        assert response.status_code == 400
+        print("SUCCESS: Invalid export status correctly rejected")
+
+
+class TestAdminSearch:
+    """Admin full-text search tests"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup auth headers"""
+        self.headers = get_auth_header(ADMIN_USERNAME, ADMIN_PASSWORD)
+    
+    def test_search_finds_free_text(self):
+        """Test that a word from a free-text answer finds its response"""
+        word = f"monsoon{int(datetime.now().timestamp() * 1000)}"
+        payload = {
+            "session_id": f"test_search_{datetime.now().timestamp()}",
+            "consent": True,
+            "sections": {},
+            "free_text": {"q1": f"Worried about {word} access to the site"},
+        }
+        response_id = requests.post(f"{BASE_URL}/api/questionnaire", json=payload).json()["response_id"]
+        
+        response = requests.get(
+            f"{BASE_URL}/api/admin/search", params={"q": word, "status": "unreviewed"}, headers=self.headers
+        )
+        
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["response_id"] for r in results] == [response_id]
+        assert results[0]["collection"] == "questionnaire"
+        assert results[0]["score"] > 0
+        assert "search_text" not in results[0]
+        print(f"SUCCESS: Search found {response_id}")
+    
+    def test_search_rejects_status_from_no_collection(self):
+        """Test that a status valid for neither searched collection is rejected"""
+        response = requests.get(
+            f"{BASE_URL}/api/admin/search", params={"q": "access", "collection": "contact", "status": "unreviewed"},
+            headers=self.headers
+        )
+        
+        assert response.status_code == 400
+        print("SUCCESS: Invalid search status correctly rejected")
+    
+    def test_search_requires_auth(self):
+        """Test that search requires authentication"""
+        response = requests.get(f"{BASE_URL}/api/admin/search", params={"q": "access"})
+        
+        assert response.status_code == 401
+        print("SUCCESS: Search requires auth")
+
+
+class TestAdminLiveFeed:
+    """Server-Sent Events live feed tests"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup auth headers"""
+        self.headers = get_auth_header(ADMIN_USERNAME, ADMIN_PASSWORD)
+    
+    def test_stream_pushes_new_submission(self):
+        """Test that a new questionnaire response arrives as a change event"""
+        with requests.get(f"{BASE_URL}/api/admin/stream", headers=self.headers, stream=True, timeout=20) as stream:
+            if stream.status_code == 503:
+                pytest.skip("Change streams need a replica set")
+            assert stream.status_code == 200
+            assert stream.headers["Content-Type"].startswith("text/event-stream")
+            
+            payload = {"session_id": f"test_feed_{datetime.now().timestamp()}", "consent": True, "sections": {}}
+            response_id = requests.post(f"{BASE_URL}/api/questionnaire", json=payload).json()["response_id"]
+            
+            for line in stream.iter_lines(decode_unicode=True):
+                if line.startswith("data:"):
+                    event = json.loads(line[len("data:"):])
+                    if event.get("id") == response_id:
+                        break
+            
+            assert event["collection"] == "questionnaire"
+            assert event["operation"] == "insert"
+            assert event["status"] == "unreviewed"
+        print(f"SUCCESS: Live feed delivered insert of {response_id}")
+    
+    def test_stream_not_compressed(self):
+        """Test that events are delivered uncompressed when the client accepts gzip"""
+        headers = {**self.headers, "Accept-Encoding": "gzip"}
+        with requests.get(f"{BASE_URL}/api/admin/stream", headers=headers, stream=True, timeout=10) as stream:
+            if stream.status_code == 503:
+                pytest.skip("Change streams need a replica set")
+            assert stream.status_code == 200
+            assert stream.headers.get("Content-Encoding") != "gzip"
+            
+            first = next(stream.iter_lines(decode_unicode=True))
+            assert first.startswith("retry:")
+        print("SUCCESS: Live feed is not gzip-buffered")
+    
+    def test_stream_requires_auth(self):
+        """Test that the live feed rejects unauthenticated clients"""
+        response = requests.get(f"{BASE_URL}/api/admin/stream", timeout=5)
+        
+        assert response.status_code == 401
+        print("SUCCESS: Live feed requires auth")
+
+
+class TestPublicRateLimits:
+    """Public endpoint rate limiting tests"""
+    
+    def test_rate_limit_counters_exposed(self):
+        """Test that public POSTs pass through the limiter and are counted"""
+        params = {"event_type": "homepage_entry", "session_id": f"test_rl_{datetime.now().timestamp()}"}
+        response = requests.post(f"{BASE_URL}/api/analytics/event", params=params, json={})
+        assert response.status_code == 200
+        
+        headers = get_metrics_header()
+        metrics = requests.get(f"{BASE_URL}/metrics", headers=headers).text
+        
+        assert 'hillia_rate_limit_requests_total{route="/api/analytics/event",outcome="allowed"}' in metrics
+        assert 'hillia_rate_limit_clients{route="/api/questionnaire"}' in metrics
+        print("SUCCESS: Rate limit counters exposed")
+
+
+class TestAdmissionControl:
+    """Per route class admission control tests"""
+    
+    def test_admission_counters_exposed(self):
+        """Test that admin requests are admitted through the admin route class"""
+        requests.get(f"{BASE_URL}/api/admin/stats", headers=get_auth_header(ADMIN_USERNAME, ADMIN_PASSWORD))
+        
+        headers = get_metrics_header()
+        metrics = requests.get(f"{BASE_URL}/metrics", headers=headers).text
+        
+        assert 'hillia_admission_requests_total{class="admin",outcome="admitted"}' in metrics
+        assert 'hillia_admission_queue_limit{class="analytics"}' in metrics
+        print("SUCCESS: Admission counters exposed")
+
+
+class TestPostSubmitTasks:
+    """Post-submit task queue tests"""
+    
+    def test_task_queue_metrics_exposed(self):
+        """Test that post-submit task queue depth and outcomes are reported"""
+        headers = get_metrics_header()
+        metrics = requests.get(f"{BASE_URL}/metrics", headers=headers).text
+        
+        assert "hillia_tasks_queued " in metrics
+        assert 'hillia_tasks_total{outcome="failed"}' in metrics
+        assert 'hillia_task_queue_wait_seconds_count{queue="post_submit"}' in metrics
+        print("SUCCESS: Task queue metrics exposed")
+
+
+class TestAnalyticsEvents:
+    """Public analytics ingestion tests"""
+    
+    def test_track_single_event(self):
+        """Test the single-event endpoint still records"""
+        params = {"event_type": "homepage_entry", "session_id": "test_session_analytics"}
+        response = requests.post(f"{BASE_URL}/api/analytics/event", params=params, json={})
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "recorded"
+        assert "event_id" in data
+        print(f"SUCCESS: Event recorded - ID: {data['event_id']}")
+    
+    def test_track_event_batch(self):
+        """Test batch ingestion skips events without consent"""
+        payload = [
+            {"event_type": "homepage_entry", "session_id": "test_session_batch", "event_data": {}},
+            {"event_type": "questionnaire_started", "session_id": "test_session_batch"},
+            {"event_type": "questionnaire_started", "session_id": "test_session_batch", "consent": False},
+        ]
+        response = requests.post(f"{BASE_URL}/api/analytics/events", json=payload)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["recorded"] == 2
+        assert data["skipped"] == 1
+        print(f"SUCCESS: Batch recorded - {data}")
+    
+    def test_track_event_batch_too_large(self):
+        """Test oversized batches are rejected"""
+        payload = [{"event_type": "homepage_entry", "session_id": "test_session_batch"}] * 101
+        response = requests.post(f"{BASE_URL}/api/analytics/events", json=payload)
+        
+        assert response.status_code == 413
+        print("SUCCESS: Oversized batch correctly rejected")
+
+
+class TestAnalyticsFunnel:
+    """Admin analytics funnel (hourly rollups) tests"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup auth headers"""
+        self.headers = get_auth_header(ADMIN_USERNAME, ADMIN_PASSWORD)
+    
+    def test_get_funnel(self):
+        """Test funnel returns ordered steps with counts"""
+        response = requests.get(f"{BASE_URL}/api/admin/analytics/funnel", headers=self.headers)
+        
+        assert response.status_code == 200
+        data = response.json()
+        steps = [step["step"] for step in data["funnel"]]
+        assert steps[0] == "homepage_entry"
+        assert "questionnaire_completed" in steps
+        assert "dropoff" in data
+        print(f"SUCCESS: Funnel - {data['funnel']}")
+    
+    def test_get_funnel_rejects_inverted_range(self):
+        """Test that from must precede to"""
+        params = {"from": "2024-02-01T00:00:00Z", "to": "2024-01-01T00:00:00Z"}
+        response = requests.get(f"{BASE_URL}/api/admin/analytics/funnel", params=params, headers=self.headers)
+        
+        assert response.status_code == 400
+        print("SUCCESS: Inverted funnel range rejected")
+
+
+class TestAnalyticsUniques:
+    """Admin unique-session (sketch) tests"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup auth headers"""
+        self.headers = get_auth_header(ADMIN_USERNAME, ADMIN_PASSWORD)
+    
+    def test_get_uniques(self):
+        """Test uniques returns visitor estimate and conversion rates"""
+        response = requests.get(f"{BASE_URL}/api/admin/analytics/uniques", headers=self.headers)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert isinstance(data["unique_visitors"], int)
+        assert isinstance(data["by_event_type"], dict)
+        assert "started_from_visitors" in data["conversion"]
+        assert "completed_from_started" in data["conversion"]
+        print(f"SUCCESS: Uniques - {data['unique_visitors']} visitors")
+    
+    def test_uniques_require_auth(self):
+        """Test uniques are admin-only"""
+        response = requests.get(f"{BASE_URL}/api/admin/analytics/uniques")
+        
+        assert response.status_code == 401
+        print("SUCCESS: Uniques require auth")
+    
+    def test_get_uniques_rejects_inverted_range(self):
+        """Test that from must not be after to"""
+        params = {"from": "2024-02-01", "to": "2024-01-01"}
+        response = requests.get(f"{BASE_URL}/api/admin/analytics/uniques", params=params, headers=self.headers)
+        
+        assert response.status_code == 400
+        print("SUCCESS: Inverted uniques range rejected")
+
+
 class TestRateLimiting:
     """Rate limiting tests for admin authentication"""
     
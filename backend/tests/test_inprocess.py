@@ -0,0 +1,681 @@
+"""
+HILLIA In-Process Tests
+Drive the FastAPI app in-process (no network, no uvicorn) against an
+in-memory Mongo stand-in (mongomock-motor), for behaviour the live API tests
+can't reach: legacy documents written before a migration, background
+workers and shutdown.
+
+Run:
+    pytest tests/test_inprocess.py -v
+"""
+
+import asyncio
+import hashlib
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+TEST_USERNAME = "inprocess_admin"
+TEST_PASSWORD = "inprocess_password"
+
+os.environ['MONGO_URL'] = 'mongodb://localhost:27017'
+os.environ['DB_NAME'] = 'hillia_inprocess'
+os.environ['ADMIN_USERNAME'] = TEST_USERNAME
+os.environ['ADMIN_PASSWORD_HASH'] = hashlib.sha256(TEST_PASSWORD.encode()).hexdigest()
+# Every request comes from one client address; per-client rate limits would 429 it
+os.environ['RATE_LIMIT_FORMS'] = 'off'
+os.environ['RATE_LIMIT_ANALYTICS'] = 'off'
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx  # noqa: E402
+import mongomock  # noqa: E402
+from mongomock_motor import AsyncMongoMockClient  # noqa: E402
+
+import server  # noqa: E402
+
+# Email matching passes EMAIL_COLLATION; mongomock compares case-sensitively instead of refusing
+mongomock.ignore_feature('collation')
+
+
+@pytest.fixture(scope="module")
+def loop():
+    """One event loop for the module - the app's queues and events bind to the first loop that uses them"""
+    loop = asyncio.new_event_loop()
+    server.client = AsyncMongoMockClient(tz_aware=True)
+    server.db = server.client[os.environ['DB_NAME']]
+
+    async def start():
+        await server.app.router.startup()
+        # Let index bootstrap and migrations finish before tests write legacy data
+        await asyncio.gather(*server.background_tasks)
+
+    loop.run_until_complete(start())
+    yield loop
+    loop.run_until_complete(server.app.router.shutdown())
+    loop.close()
+
+
+@pytest.fixture
+def call(loop):
+    """Run an async scenario(client) on the module loop"""
+    def run(scenario):
+        async def main():
+            transport = httpx.ASGITransport(app=server.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test", auth=(TEST_USERNAME, TEST_PASSWORD)) as client:
+                return await scenario(client)
+        return loop.run_until_complete(main())
+    return run
+
+
+class TestLegacyDocuments:
+    """Reads of documents the timestamp migration hasn't rewritten"""
+
+    def test_string_timestamp_reads(self, call):
+        """Test that list, summary and detail reads serve a document with a string timestamp"""
+        response_id = "legacy-string-timestamp"
+        timestamp = "2024-01-15T10:30:00"
+
+        async def scenario(client):
+            await server.db.questionnaire_responses.insert_one({
+                "response_id": response_id, "session_id": "legacy", "timestamp": timestamp,
+                "consent": True, "sections": {}, "status": "unreviewed",
+            })
+            detail = await client.get(f"/api/admin/questionnaire/{response_id}")
+            listing = await client.get("/api/admin/questionnaire", params={"limit": 500})
+            summary = await client.get("/api/admin/questionnaire", params={"view": "summary", "limit": 500})
+            revalidated = await client.get(f"/api/admin/questionnaire/{response_id}", headers={"If-None-Match": detail.headers["ETag"]})
+            return detail, listing, summary, revalidated
+
+        detail, listing, summary, revalidated = call(scenario)
+
+        assert detail.status_code == 200
+        assert listing.status_code == 200
+        assert summary.status_code == 200
+        assert revalidated.status_code == 304
+        assert detail.headers["ETag"]
+
+    def test_validator_falls_back_to_version(self):
+        """Test that an unparseable timestamp leaves the ETag on version and drops Last-Modified"""
+        doc = {"response_id": "x", "timestamp": "garbage", "version": 3}
+
+        assert server.last_modified(doc) is None
+        assert server.doc_validator(doc) == "3"
+        assert server.last_modified({"timestamp": "2024-01-15T10:30:00"}) == datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+
+
+class TestAnalyticsRollups:
+    """Incremental rollups and the one-off backfill"""
+
+    def test_backfill_skips_incrementally_counted_events(self, call):
+        """Test that events flushed before the backfill runs are counted once"""
+        async def scenario(client):
+            # As on a first deploy where index builds delay the backfill past the first flushes
+            await server.db.migrations.delete_one({"_id": server.ROLLUP_BACKFILL_ID})
+            for i in range(5):
+                params = {"event_type": "questionnaire_dropoff", "session_id": f"rollup-{i}"}
+                assert (await client.post("/api/analytics/event", params=params, json={})).status_code == 200
+            await server.analytics_buffer.flush()
+            await server.backfill_hourly_rollups()
+            return (await client.get("/api/admin/analytics/funnel")).json()
+
+        funnel = call(scenario)
+
+        assert funnel["dropoff"] == 5
+
+
+class TestPostSubmitTasks:
+    """Background task queue behind the public submit endpoints"""
+
+    def test_hook_runs_after_insert(self, call, monkeypatch):
+        """Test that a registered post-submit hook gets the stored document once it is in Mongo"""
+        seen = []
+
+        async def record_submission(doc):
+            stored = await server.db.questionnaire_responses.find_one({"response_id": doc["response_id"]})
+            seen.append((doc["response_id"], stored is not None))
+
+        monkeypatch.setitem(server.post_submit_hooks, "questionnaire_responses", [record_submission])
+
+        async def scenario(client):
+            payload = {"session_id": "tasks-hook", "consent": True, "sections": {}}
+            response = await client.post("/api/questionnaire", json=payload)
+            assert response.status_code == 200
+            for _ in range(100):
+                if seen:
+                    break
+                await asyncio.sleep(0.01)
+            return response.json()["response_id"]
+
+        response_id = call(scenario)
+
+        assert seen == [(response_id, True)]
+
+    def test_retries_with_backoff_then_gives_up(self, loop, monkeypatch):
+        """Test that a failing task is retried with doubling delays up to max_attempts"""
+        monkeypatch.setattr(server, "TASK_RETRY_DELAY", 0.02)
+        attempts = []
+
+        async def always_fails(value):
+            attempts.append(time.perf_counter())
+            raise RuntimeError("hook failed")
+
+        async def scenario():
+            queue = server.TaskQueue(workers=2, max_pending=10, max_attempts=4)
+            queue.start()
+            assert queue.submit(always_fails, 1)
+            await queue.stop(timeout=5)
+            return queue
+
+        queue = loop.run_until_complete(scenario())
+
+        assert len(attempts) == 4
+        assert (queue.retried, queue.failed, queue.completed) == (3, 1, 0)
+        gaps = [later - earlier for earlier, later in zip(attempts, attempts[1:])]
+        for gap, delay in zip(gaps, [0.02, 0.04, 0.08]):
+            assert gap >= delay * 0.9
+
+    def test_drops_when_full(self, loop):
+        """Test that submit refuses and counts work beyond max_pending"""
+        async def scenario():
+            release = asyncio.Event()
+
+            async def blocked(value):
+                await release.wait()
+
+            queue = server.TaskQueue(workers=1, max_pending=2, max_attempts=1)
+            queue.start()
+            accepted = [queue.submit(blocked, i) for i in range(3)]
+            release.set()
+            await queue.stop(timeout=5)
+            return queue, accepted
+
+        queue, accepted = loop.run_until_complete(scenario())
+
+        assert accepted == [True, True, False]
+        assert (queue.dropped, queue.completed) == (1, 2)
+
+    def test_stop_drains_then_gives_up_at_timeout(self, loop):
+        """Test that shutdown finishes queued work within the timeout and abandons the rest"""
+        async def scenario():
+            async def quick(value):
+                await asyncio.sleep(0.01)
+
+            async def stuck(value):
+                await asyncio.Event().wait()
+
+            drained = server.TaskQueue(workers=2, max_pending=100, max_attempts=1)
+            drained.start()
+            for i in range(10):
+                drained.submit(quick, i)
+            await drained.stop(timeout=5)
+
+            abandoned = server.TaskQueue(workers=1, max_pending=100, max_attempts=1)
+            abandoned.start()
+            abandoned.submit(stuck, 0)
+            abandoned.submit(quick, 1)
+            start = time.perf_counter()
+            await abandoned.stop(timeout=0.1)
+            return drained, abandoned, time.perf_counter() - start, abandoned.submit(quick, 2)
+
+        drained, abandoned, elapsed, accepted_after_stop = loop.run_until_complete(scenario())
+
+        assert (drained.completed, drained.outstanding) == (10, 0)
+        assert abandoned.completed == 0
+        assert elapsed < 1
+        assert accepted_after_stop is False
+
+
+class TestAnalyticsBuffer:
+    """Batched analytics writes"""
+
+    def test_stop_waits_for_flush_in_progress(self, loop):
+        """Test that shutdown during a timer flush still writes that batch"""
+        async def slow_setup():
+            await asyncio.sleep(0.1)
+
+        async def scenario():
+            buffer = server.AnalyticsBuffer("analytics_stop_test", flush_size=1000, flush_interval=0.01, max_pending=1000, setup=slow_setup)
+            buffer.start()
+            buffer.add([{"n": i} for i in range(5)])
+            # The timer flush has taken the batch and is still in setup
+            await asyncio.sleep(0.05)
+            await buffer.stop()
+            return await server.db.analytics_stop_test.count_documents({})
+
+        assert loop.run_until_complete(scenario()) == 5
+
+
+class TestCsvExport:
+    """Formula quoting in the CSV export"""
+
+    def test_phone_numbers_are_not_quoted(self, call):
+        """Test that an international phone number comes out of the export exactly as submitted"""
+        name = f"Phone {time.time()}"
+
+        async def scenario(client):
+            payload = {"name": name, "reason": "=1+1", "preferred_contact": "phone", "phone": "+91 98765 43210"}
+            await client.post("/api/contact", json=payload)
+            return await client.get("/api/admin/export/contact?format=csv")
+
+        response = call(scenario)
+        row = next(line for line in response.text.splitlines() if name in line)
+
+        assert response.status_code == 200
+        assert ",+91 98765 43210," in row
+        assert ",'=1+1," in row
+
+    def test_only_signed_numbers_are_exempt(self):
+        """Test that signed numbers pass through while other +/- text is still quoted"""
+        assert server.csv_cell("+1 (555) 010-0100") == "+1 (555) 010-0100"
+        assert server.csv_cell("-3.5") == "-3.5"
+        assert server.csv_cell("+SUM(A1:A9)") == "'+SUM(A1:A9)"
+        assert server.csv_cell("-2+3") == "'-2+3"
+        assert server.csv_cell("+") == "'+"
+        assert server.csv_cell("@12") == "'@12"
+
+
+class TestErasure:
+    """GDPR erasure"""
+
+    def test_email_and_session_matches_counted_once(self, call, monkeypatch):
+        """Test that a response matched by email and by session is deleted and counted once"""
+        monkeypatch.setattr(server, "ERASURE_RECEIPT_SECRET", "receipt-secret")
+        email = "erasure-inprocess@example.com"
+
+        async def scenario(client):
+            payload = {"session_id": "erasure-inprocess", "consent": True, "sections": {}, "contact_info": {"email": email}, "wants_contact": True}
+            assert (await client.post("/api/questionnaire", json=payload)).status_code == 200
+            assert (await client.post("/api/contact", json={"name": "Erasure", "reason": "Testing", "email": email})).status_code == 200
+            response = await client.post("/api/admin/erasure", json={"session_id": "erasure-inprocess", "email": email})
+            return response.json()
+
+        receipt = call(scenario)
+
+        assert receipt["deleted"]["questionnaire_responses"] == 1
+        assert receipt["deleted"]["contact_submissions"] == 1
+        assert receipt["subject"]["email_hmac"] == server.email_digest(email)
+        assert receipt["subject"]["email_hmac"] != hashlib.sha256(email.encode()).hexdigest()
+
+    def test_email_erasure_refused_without_receipt_secret(self, call, monkeypatch):
+        """Test that erasure by email is refused while no persistent receipt secret is configured"""
+        monkeypatch.setattr(server, "ERASURE_RECEIPT_SECRET", None)
+
+        async def scenario(client):
+            return await client.post("/api/admin/erasure", json={"email": "nobody@example.com"})
+
+        assert call(scenario).status_code == 503
+
+
+class TestLockoutStore:
+    """Admin login lockout backends"""
+
+    def test_incomplete_backend_rejected_at_construction(self):
+        """Test that a store missing part of the interface can't be instantiated"""
+        class PartialStore(server.LockoutStore):
+            async def is_locked(self, key):
+                return False
+
+        with pytest.raises(TypeError):
+            PartialStore()
+
+
+class TestLiveFeed:
+    """Admin live feed encoding and transport"""
+
+    def test_delete_event_names_removed_document(self):
+        """Test that a delete takes its id from the change stream pre-image"""
+        feed = server.ChangeFeed(server.FEED_SOURCES, queue_size=10, replay_size=10)
+        change = {
+            "operationType": "delete",
+            "ns": {"coll": "questionnaire_responses"},
+            "fullDocumentBeforeChange": {"response_id": "deleted-response"},
+        }
+
+        event = feed.event(change)
+
+        assert (event["operation"], event["id"]) == ("delete", "deleted-response")
+
+    def test_gzip_skips_event_streams(self, loop):
+        """Test that SSE paths stream chunk by chunk while other responses are still gzipped"""
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/event-stream")]})
+            for _ in range(3):
+                await send({"type": "http.response.body", "body": b"data: " + b"x" * 50 + b"\n\n", "more_body": True})
+            await send({"type": "http.response.body", "body": b""})
+
+        middleware = server.StreamSafeGZipMiddleware(app, minimum_size=10, skip_paths={"/api/admin/stream"})
+
+        async def request(path):
+            sent = []
+
+            async def receive():
+                return {"type": "http.request", "body": b""}
+
+            async def send(message):
+                sent.append(message)
+
+            scope = {"type": "http", "method": "GET", "path": path, "headers": [(b"accept-encoding", b"gzip")]}
+            await middleware(scope, receive, send)
+            return dict(sent[0]["headers"]).get(b"content-encoding"), [len(m.get("body", b"")) for m in sent[1:]]
+
+        stream_encoding, stream_chunks = loop.run_until_complete(request("/api/admin/stream"))
+        other_encoding, _ = loop.run_until_complete(request("/api/admin/questionnaire"))
+
+        assert stream_encoding is None
+        assert stream_chunks == [58, 58, 58, 0]
+        assert other_encoding == b"gzip"
+
+
+def make_spool(root, batch_size=100):
+    return server.SubmissionSpool(
+        root, server.SPOOL_SOURCES, segment_bytes=1 << 20, max_bytes=1 << 24, batch_size=batch_size, interval=0.01,
+    )
+
+
+def crash(spool):
+    """Process death: the segment and flock are released, nothing more is drained"""
+    spool._file.close()
+    os.close(spool._lock_fd)
+
+
+def contact(i):
+    return {"submission_id": f"spool-{i}", "name": f"Spool {i}", "reason": "Testing", "consent": True,
+            "status": "new", "timestamp": datetime.now(timezone.utc)}
+
+
+class FailingDatabase:
+    """Mongo during an outage - every write fails"""
+
+    def __getitem__(self, name):
+        return self
+
+    async def bulk_write(self, *args, **kwargs):
+        raise server.PyMongoError("connection refused")
+
+
+class TestSubmissionSpool:
+    """Local write-ahead log in front of Mongo"""
+
+    @staticmethod
+    async def spooled_ids():
+        docs = await server.db.contact_submissions.find({"submission_id": {"$regex": "^spool-"}}, {"_id": 0, "submission_id": 1}).to_list(None)
+        return sorted(doc["submission_id"] for doc in docs)
+
+    @pytest.fixture(autouse=True)
+    def clean(self, loop):
+        loop.run_until_complete(server.db.contact_submissions.delete_many({"submission_id": {"$regex": "^spool-"}}))
+
+    def test_torn_tail_record_skipped(self, loop, tmp_path):
+        """Test that a record cut short by a crash is discarded and the ones before it replayed"""
+        async def scenario():
+            writer = make_spool(tmp_path)
+            writer._open()
+            for i in range(3):
+                await writer.append("contact_submissions", contact(i))
+            crash(writer)
+            segment = next(tmp_path.glob("worker-*/*.log"))
+            with open(segment, "r+b") as f:
+                f.truncate(segment.stat().st_size - 5)
+
+            replay = make_spool(tmp_path)
+            await replay.start()
+            await replay.drain()
+            await replay.stop(timeout=5)
+            return replay, await self.spooled_ids()
+
+        replay, ids = loop.run_until_complete(scenario())
+
+        assert ids == ["spool-0", "spool-1"]
+        assert replay.drained == 2
+
+    def test_abandoned_segment_replayed_once(self, loop, tmp_path):
+        """Test that a dead worker's segments are adopted from its checkpoint and deleted once applied"""
+        async def scenario():
+            writer = make_spool(tmp_path, batch_size=2)
+            writer._open()
+            for i in range(5):
+                await writer.append("contact_submissions", contact(i))
+            assert await writer.drain_once() == 2
+            crash(writer)
+            # Erased after it was drained - a replay must not bring it back
+            await server.db.contact_submissions.delete_one({"submission_id": "spool-0"})
+
+            replay = make_spool(tmp_path)
+            await replay.start()
+            await replay.drain()
+            await replay.stop(timeout=5)
+
+            again = make_spool(tmp_path)
+            await again.start()
+            await again.drain()
+            await again.stop(timeout=5)
+            return replay, again, await self.spooled_ids()
+
+        replay, again, ids = loop.run_until_complete(scenario())
+
+        assert ids == ["spool-1", "spool-2", "spool-3", "spool-4"]
+        assert (replay.drained, again.drained) == (3, 0)
+        assert [p.name for p in tmp_path.glob("worker-*/*.log") if p.stat().st_size] == []
+
+    def test_submissions_survive_outage(self, call, tmp_path, monkeypatch):
+        """Test that submissions are accepted while Mongo is down and drained once it is back"""
+        spool = make_spool(tmp_path)
+        database = server.db
+        monkeypatch.setattr(server, "submission_spool", spool)
+
+        async def scenario(client):
+            await spool.start()
+            server.db = FailingDatabase()
+            try:
+                for i in range(3):
+                    payload = {"name": f"Outage {i}", "reason": "Testing", "consent": True}
+                    assert (await client.post("/api/contact", json=payload)).status_code == 200
+                await asyncio.sleep(0.1)
+                assert spool.drained == 0
+            finally:
+                server.db = database
+            for _ in range(200):
+                if spool.drained == 3:
+                    break
+                await asyncio.sleep(0.01)
+            await spool.stop(timeout=5)
+            return await server.db.contact_submissions.count_documents({"name": {"$regex": "^Outage "}})
+
+        assert call(scenario) == 3
+        assert spool.drained == 3
+
+
+class TestPublicRateLimits:
+    """Per-client token buckets on the public POST endpoints"""
+
+    def test_limit_and_per_client_buckets(self, call, monkeypatch):
+        """Test that a client past its burst gets 429 with Retry-After while another client is unaffected"""
+        monkeypatch.setitem(server.rate_limiters, "/api/contact", server.TokenBucketLimiter(2, 600, 100))
+        payload = {"name": "Rate Limit", "reason": "Testing", "consent": True}
+
+        async def scenario(client):
+            first = {"X-Forwarded-For": "198.51.100.1"}
+            responses = [await client.post("/api/contact", json=payload, headers=first) for _ in range(3)]
+            other = await client.post("/api/contact", json=payload, headers={"X-Forwarded-For": "198.51.100.2"})
+            return responses, other
+
+        responses, other = call(scenario)
+
+        assert [r.status_code for r in responses] == [200, 200, 429]
+        assert int(responses[2].headers["Retry-After"]) > 0
+        assert other.status_code == 200
+
+
+class TestMetricsEndpoint:
+    """/metrics needs METRICS_TOKEN on the server and the bearer header on the request"""
+
+    def test_disabled_without_token(self, call, monkeypatch):
+        """Test that /metrics is not served at all when METRICS_TOKEN is unset"""
+        monkeypatch.setattr(server, "METRICS_TOKEN", None)
+
+        async def scenario(client):
+            return await client.get("/metrics")
+
+        assert call(scenario).status_code == 404
+
+    def test_requires_bearer_token(self, call, monkeypatch):
+        """Test that a missing or wrong bearer token is rejected and the right one is served"""
+        monkeypatch.setattr(server, "METRICS_TOKEN", "scrape-secret")
+
+        async def scenario(client):
+            # auth=None drops the client's basic auth so the bearer header goes through as sent
+            missing = await client.get("/metrics", auth=None)
+            wrong = await client.get("/metrics", headers={"Authorization": "Bearer nope"}, auth=None)
+            right = await client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"}, auth=None)
+            return missing, wrong, right
+
+        missing, wrong, right = call(scenario)
+
+        assert missing.status_code == 401
+        assert wrong.status_code == 401
+        assert right.status_code == 200
+        assert "# TYPE" in right.text
+
+
+class TestAdmissionControl:
+    """Concurrency limits per route class"""
+
+    @staticmethod
+    def controller(capacity=1, timeout=1.0, admin=(1, 5), analytics=(1, 5)):
+        return server.AdmissionController(capacity, [("admin", *admin), ("public_writes", 1, 5), ("analytics", *analytics)], timeout)
+
+    def test_full_queue_rejected_at_once(self, loop):
+        """Test that a request finding its class's queue full is shed without waiting"""
+        async def scenario():
+            controller = self.controller(analytics=(1, 1))
+            analytics = controller.by_name["analytics"]
+            assert await controller.acquire(analytics)
+            waiting = asyncio.ensure_future(controller.acquire(analytics))
+            await asyncio.sleep(0)
+            start = time.perf_counter()
+            shed = await controller.acquire(analytics)
+            elapsed = time.perf_counter() - start
+            controller.release(analytics)
+            return shed, elapsed, await waiting, analytics
+
+        shed, elapsed, waited, analytics = loop.run_until_complete(scenario())
+
+        assert shed is False
+        assert elapsed < 0.05
+        assert waited is True
+        assert (analytics.rejected, analytics.admitted) == (1, 2)
+
+    def test_wait_times_out(self, loop):
+        """Test that a queued request gives up after the queue timeout"""
+        async def scenario():
+            controller = self.controller(timeout=0.05)
+            admin = controller.by_name["admin"]
+            assert await controller.acquire(admin)
+            start = time.perf_counter()
+            admitted = await controller.acquire(admin)
+            return admitted, time.perf_counter() - start, admin
+
+        admitted, elapsed, admin = loop.run_until_complete(scenario())
+
+        assert admitted is False
+        assert 0.04 < elapsed < 0.5
+        assert (admin.timed_out, len(admin.waiters), admin.active) == (1, 0, 1)
+
+    def test_admin_served_before_analytics(self, loop):
+        """Test that a freed slot goes to a waiting admin request even if analytics queued first"""
+        async def scenario():
+            controller = self.controller(admin=(5, 5), analytics=(5, 5))
+            admin, analytics = controller.by_name["admin"], controller.by_name["analytics"]
+            order = []
+
+            async def request(cls):
+                if await controller.acquire(cls):
+                    order.append(cls.name)
+
+            assert await controller.acquire(analytics)
+            waiters = [asyncio.ensure_future(request(analytics)), asyncio.ensure_future(request(admin))]
+            await asyncio.sleep(0)
+            controller.release(analytics)
+            await asyncio.sleep(0)
+            first = list(order)
+            controller.release(admin)
+            await asyncio.gather(*waiters)
+            return first, order
+
+        first, order = loop.run_until_complete(scenario())
+
+        assert first == ["admin"]
+        assert order == ["admin", "analytics"]
+
+    def test_middleware_sheds_with_retry_after(self, loop):
+        """Test that the middleware answers 503 with Retry-After once a class is saturated"""
+        release = asyncio.Event()
+
+        async def app(scope, receive, send):
+            await release.wait()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+
+        middleware = server.AdmissionMiddleware(app, controller=self.controller(admin=(1, 0)))
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=middleware)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                held = asyncio.ensure_future(client.get("/api/admin/stats"))
+                await asyncio.sleep(0.01)
+                shed = await client.get("/api/admin/stats")
+                release.set()
+                return await held, shed
+
+        held, shed = loop.run_until_complete(scenario())
+
+        assert held.status_code == 200
+        assert shed.status_code == 503
+        assert shed.headers["Retry-After"] == "1"
+
+
+class TestHyperLogLog:
+    """Distinct session sketches behind /api/admin/analytics/uniques"""
+
+    @staticmethod
+    def sketch(ids):
+        sketch = server.HyperLogLog()
+        for value in ids:
+            sketch.add(value)
+        return sketch
+
+    def test_estimate_within_error(self):
+        """Test that 50k distinct ids are estimated within 3% (p=12 gives ~1.6% standard error)"""
+        ids = [f"session-{i}" for i in range(50_000)]
+
+        estimate = self.sketch(ids + ids[:10_000]).count()
+
+        assert abs(estimate - 50_000) / 50_000 < 0.03
+
+    def test_small_counts_near_exact(self):
+        """Test that linear counting keeps small days accurate"""
+        assert abs(self.sketch(f"small-{i}" for i in range(100)).count() - 100) <= 2
+
+    def test_merge_equals_union(self):
+        """Test that merging shard sketches gives exactly the sketch of the union"""
+        a = [f"session-{i}" for i in range(0, 30_000)]
+        b = [f"session-{i}" for i in range(20_000, 50_000)]
+
+        merged = self.sketch(a).merge(self.sketch(b))
+
+        assert merged.registers == self.sketch(a + b).registers
+        assert merged.count() == self.sketch(set(a) | set(b)).count()
+
+    def test_compressed_round_trip(self):
+        """Test that the stored (compressed) form restores the same registers"""
+        sketch = self.sketch(f"session-{i}" for i in range(5_000))
+
+        stored = sketch.to_bson()
+        restored = server.HyperLogLog.from_bson(stored)
+
+        assert restored.registers == sketch.registers
+        assert len(stored) < server.HLL_REGISTERS
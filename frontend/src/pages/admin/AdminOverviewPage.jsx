@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import AdminLayout from '../../components/admin/AdminLayout';
-import { getAdminStats } from '../../services/adminApi';
+import { getAdminStats, getAnalyticsUniques, subscribeAdminFeed } from '../../services/adminApi';
 
 /**
  * Admin Overview Page
@@ -9,18 +9,34 @@ import { getAdminStats } from '../../services/adminApi';
  */
 const AdminOverviewPage = () => {
   const [stats, setStats] = useState(null);
+  const [uniques, setUniques] = useState(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
 
   useEffect(() => {
     loadStats();
+    // Counts follow new submissions and status changes without polling;
+    // a burst of changes (bulk updates) triggers one reload
+    let timer = null;
+    const unsubscribe = subscribeAdminFeed(() => {
+      clearTimeout(timer);
+      timer = setTimeout(() => loadStats({ quiet: true }), 1000);
+    });
+    return () => {
+      clearTimeout(timer);
+      unsubscribe();
+    };
   }, []);
 
-  const loadStats = async () => {
+  const loadStats = async ({ quiet = false } = {}) => {
     try {
-      setLoading(true);
-      const data = await getAdminStats();
+      if (!quiet) setLoading(true);
+      const [data, visitors] = await Promise.all([
+        getAdminStats(),
+        getAnalyticsUniques().catch(() => null),
+      ]);
       setStats(data);
+      setUniques(visitors);
     } catch (err) {
       setError(err.message);
     } finally {
@@ -146,6 +162,37 @@ const AdminOverviewPage = () => {
             </div>
           </div>
         </div>
+
+        {uniques && (
+          <div className="admin-stats-section">
+            <h2 className="admin-section-title">Visitors (Last 30 Days, Approximate)</h2>
+            <div className="admin-stats-table">
+              <div className="admin-stats-row admin-stats-total">
+                <span className="admin-stats-label">Unique Visitors</span>
+                <span className="admin-stats-value">{uniques.unique_visitors}</span>
+              </div>
+              <div className="admin-stats-divider" />
+              <div className="admin-stats-row">
+                <span className="admin-stats-label">Started Questionnaire</span>
+                <span className="admin-stats-value">
+                  {uniques.by_event_type.questionnaire_started || 0}
+                  {uniques.conversion.started_from_visitors !== null && (
+                    <span className="admin-stats-pct">({uniques.conversion.started_from_visitors}%)</span>
+                  )}
+                </span>
+              </div>
+              <div className="admin-stats-row">
+                <span className="admin-stats-label">Completed Questionnaire</span>
+                <span className="admin-stats-value">
+                  {uniques.by_event_type.questionnaire_completed || 0}
+                  {uniques.conversion.completed_from_started !== null && (
+                    <span className="admin-stats-pct">({uniques.conversion.completed_from_started}%)</span>
+                  )}
+                </span>
+              </div>
+            </div>
+          </div>
+        )}
       </div>
     </AdminLayout>
   );
@@ -7,33 +7,33 @@ const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
 
 /**
- * Store admin credentials in session
+ * Store admin session token (short-lived, issued by /admin/auth/login)
  */
-export const setAdminCredentials = (username, password) => {
-  sessionStorage.setItem('hillia_admin_auth', btoa(`${username}:${password}`));
+export const setAdminToken = (token) => {
+  sessionStorage.setItem('hillia_admin_token', token);
 };
 
 /**
  * Get admin auth header
  */
 export const getAuthHeader = () => {
-  const auth = sessionStorage.getItem('hillia_admin_auth');
-  if (!auth) return null;
-  return `Basic ${auth}`;
+  const token = sessionStorage.getItem('hillia_admin_token');
+  if (!token) return null;
+  return `Bearer ${token}`;
 };
 
 /**
  * Clear admin session
  */
 export const clearAdminSession = () => {
-  sessionStorage.removeItem('hillia_admin_auth');
+  sessionStorage.removeItem('hillia_admin_token');
 };
 
 /**
  * Check if admin is authenticated
  */
 export const isAdminAuthenticated = () => {
-  return !!sessionStorage.getItem('hillia_admin_auth');
+  return !!sessionStorage.getItem('hillia_admin_token');
 };
 
 /**
@@ -72,12 +72,12 @@ const adminFetch = async (endpoint, options = {}) => {
 };
 
 /**
- * Verify admin credentials
+ * Verify admin credentials and start a session
  */
 export const verifyAdminAuth = async (username, password) => {
   const auth = btoa(`${username}:${password}`);
   
-  const response = await fetch(`${API}/admin/auth/verify`, {
+  const response = await fetch(`${API}/admin/auth/login`, {
     method: 'POST',
     headers: {
       'Authorization': `Basic ${auth}`,
@@ -92,9 +92,10 @@ export const verifyAdminAuth = async (username, password) => {
     throw new Error('Invalid credentials');
   }
 
-  // Store credentials on successful auth
-  setAdminCredentials(username, password);
-  return response.json();
+  // Store the session token, never the password
+  const data = await response.json();
+  setAdminToken(data.access_token);
+  return { status: 'authenticated', username };
 };
 
 /**
@@ -104,11 +105,19 @@ export const getAdminStats = async () => {
   return adminFetch('/admin/stats');
 };
 
+/**
+ * Get approximate unique visitors and conversion (defaults to last 30 days)
+ */
+export const getAnalyticsUniques = async () => {
+  return adminFetch('/admin/analytics/uniques');
+};
+
 /**
  * Get questionnaire responses
  */
 export const getQuestionnaireResponses = async (status = null, watched = null, limit = 50, skip = 0) => {
-  let endpoint = `/admin/questionnaire?limit=${limit}&skip=${skip}`;
+  // List pages only need the summary fields
+  let endpoint = `/admin/questionnaire?view=summary&limit=${limit}&skip=${skip}`;
   if (status) {
     endpoint += `&status=${status}`;
   }
@@ -143,7 +152,8 @@ export const updateQuestionnaireResponse = async (responseId, updates) => {
  * Get contact submissions
  */
 export const getContactSubmissions = async (status = null, watched = null, limit = 50, skip = 0) => {
-  let endpoint = `/admin/contact?limit=${limit}&skip=${skip}`;
+  // List pages only need the summary fields
+  let endpoint = `/admin/contact?view=summary&limit=${limit}&skip=${skip}`;
   if (status) {
     endpoint += `&status=${status}`;
   }
@@ -173,3 +183,68 @@ export const updateContactSubmission = async (submissionId, updates) => {
     method: 'PATCH',
   });
 };
+
+/**
+ * Search free text, internal notes and contact name/reason (best match first)
+ */
+export const searchAdmin = async (q, { collection = null, status = null, watched = null, limit = 20, skip = 0 } = {}) => {
+  const params = new URLSearchParams({ q, limit, skip });
+  if (collection) params.append('collection', collection);
+  if (status) params.append('status', status);
+  if (watched !== null) params.append('watched', watched);
+  return adminFetch(`/admin/search?${params}`);
+};
+
+/**
+ * Subscribe to the live admin feed (Server-Sent Events over fetch, so the
+ * bearer token can be sent). onEvent gets each change; a "reset" event means
+ * events were missed and the caller should refetch. Returns an unsubscribe
+ * function.
+ */
+export const subscribeAdminFeed = (onEvent) => {
+  const controller = new AbortController();
+  let lastEventId = null;
+
+  const dispatch = (block) => {
+    let event = 'message';
+    let data = '';
+    block.split('\n').forEach((line) => {
+      if (line.startsWith('id: ')) lastEventId = line.slice(4);
+      else if (line.startsWith('event: ')) event = line.slice(7);
+      else if (line.startsWith('data: ')) data += line.slice(6);
+    });
+    if (data) onEvent(event, JSON.parse(data));
+  };
+
+  const connect = async () => {
+    while (!controller.signal.aborted) {
+      const authHeader = getAuthHeader();
+      if (!authHeader) return;
+      try {
+        const headers = { 'Authorization': authHeader };
+        if (lastEventId) headers['Last-Event-ID'] = lastEventId;
+        const response = await fetch(`${API}/admin/stream`, { headers, signal: controller.signal });
+        // 503: no change streams on this deployment - fall back to manual refresh
+        if (!response.ok) return;
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        for (;;) {
+          const { done, value } = await reader.read();
+          if (done) break;
+          buffer += decoder.decode(value, { stream: true });
+          const blocks = buffer.split('\n\n');
+          buffer = blocks.pop();
+          blocks.forEach(dispatch);
+        }
+      } catch (err) {
+        if (controller.signal.aborted) return;
+      }
+      await new Promise((resolve) => setTimeout(resolve, 3000));
+    }
+  };
+
+  connect();
+  return () => controller.abort();
+};
@@ -90,36 +90,65 @@ export const submitContact = async (data) => {
   }
 };
 
+/**
+ * Analytics batching - events are queued and sent together to
+ * /analytics/events instead of one request per event
+ */
+const ANALYTICS_FLUSH_SIZE = 10;
+const ANALYTICS_FLUSH_DELAY_MS = 2000;
+let analyticsQueue = [];
+let analyticsTimer = null;
+
+const flushAnalytics = () => {
+  if (analyticsTimer) {
+    clearTimeout(analyticsTimer);
+    analyticsTimer = null;
+  }
+  if (analyticsQueue.length === 0) return;
+
+  const events = analyticsQueue;
+  analyticsQueue = [];
+
+  // keepalive lets the request outlive the page (tab close, navigation)
+  fetch(`${API}/analytics/events`, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify(events),
+    keepalive: true,
+  }).catch(() => {
+    // Silent fail for analytics
+  });
+};
+
+if (typeof window !== 'undefined') {
+  window.addEventListener('pagehide', flushAnalytics);
+  document.addEventListener('visibilitychange', () => {
+    if (document.visibilityState === 'hidden') flushAnalytics();
+  });
+}
+
 /**
  * Track analytics event (consent-based)
  */
 export const trackEvent = async (eventType, eventData = {}, consent = true) => {
   if (!consent) return { status: 'skipped' };
 
-  try {
-    const params = new URLSearchParams({
-      event_type: eventType,
-      session_id: getSessionId(),
-      consent: consent.toString(),
-    });
+  analyticsQueue.push({
+    event_type: eventType,
+    session_id: getSessionId(),
+    event_data: eventData,
+    consent,
+  });
 
-    const response = await fetch(`${API}/analytics/event?${params}`, {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-      },
-      body: JSON.stringify(eventData),
-    });
-
-    if (!response.ok) {
-      return { status: 'error' };
-    }
-
-    return await response.json();
-  } catch (error) {
-    // Silent fail for analytics
-    return { status: 'error' };
+  if (analyticsQueue.length >= ANALYTICS_FLUSH_SIZE) {
+    flushAnalytics();
+  } else if (!analyticsTimer) {
+    analyticsTimer = setTimeout(flushAnalytics, ANALYTICS_FLUSH_DELAY_MS);
   }
+
+  return { status: 'queued' };
 };
 
 // Event types